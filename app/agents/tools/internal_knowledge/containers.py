@@ -1,7 +1,9 @@
 from dependency_injector.containers import DeclarativeContainer
 from dependency_injector.providers import Configuration, Singleton
 
+from app.common.milvus_pool import MilvusConnectionPool
 from app.config.utils import init_config
+from app.domains.chat.handlers.retriever.milvus import MilvusRetriever
 
 
 class RetrievalContainer(DeclarativeContainer):
@@ -9,3 +11,34 @@ class RetrievalContainer(DeclarativeContainer):
 
     config = Configuration()
     init_config(config)
+    retrieve_config = config.milvus.retrive()
+    connection_config = config.milvus.connection()
+    milvus_connection_pool = Singleton(
+        MilvusConnectionPool,
+        address=connection_config.get("address"),
+        alias_prefix=retrieve_config.get("connection_alias"),
+        pool_size=connection_config.get("pool_size"),
+        health_check_interval_seconds=connection_config.get(
+            "health_check_interval_seconds"
+        ),
+        timeout=connection_config.get("timeout"),
+    )
+    milvus_retriever = Singleton(
+        MilvusRetriever,
+        connection_pool=milvus_connection_pool,
+        embedding_model=retrieve_config.get("embedding").get("model"),
+        top_k=retrieve_config.get("top_k"),
+        ranker_type=retrieve_config.get("ranker_type"),
+        rrf_k=retrieve_config.get("rrf_k"),
+        dense_weight=retrieve_config.get("dense_weight"),
+        search_params=retrieve_config.get("search_params"),
+        enable_nltk=config.milvus.indexing.enable_nltk(),
+        cache_max_size=retrieve_config.get("cache").get("max_size"),
+        cache_ttl_seconds=retrieve_config.get("cache").get("ttl_seconds"),
+        version_check_interval_seconds=retrieve_config.get("cache").get(
+            "version_check_interval_seconds"
+        ),
+        query_batch_window_ms=retrieve_config.get("embedding").get("batch_window_ms"),
+        query_batch_max_size=retrieve_config.get("embedding").get("max_batch_size"),
+        query_cache_max_size=retrieve_config.get("embedding").get("cache_max_size"),
+    )
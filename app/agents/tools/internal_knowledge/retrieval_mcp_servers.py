@@ -53,19 +53,32 @@ class RetrievalResult:
         "To improve search accuracy, analyze the conversational context and rephrase or expand the query into a more detailed and informative 'Search Query'. "
     ),
 )
-async def retrieve_documents(query: str, collection_name: str) -> RetrievalResult:
+async def retrieve_documents(
+    query: str,
+    collection_name: str,
+    document_ids: list[str] | None = None,
+    top_k: int | None = None,
+) -> RetrievalResult:
     """Retrieve documents similar to the query from the vector store.
 
     Args:
         query: The search query to find similar documents
         collection_name: The name of Milvus collection to search in
+        document_ids: Optional document IDs of the chat session to restrict the search to.
+            An empty list means the session has no documents, so nothing is searched.
+        top_k: Optional number of documents to return
 
     Returns:
         Dictionary containing list of similar documents
     """
+    if document_ids is not None and not document_ids:
+        return RetrievalResult(query=query, documents=[], count=0)
     try:
         search_results = await milvus_retriever.hybrid_search(
-            query, collection_name=collection_name
+            query,
+            collection_name=collection_name,
+            top_k=top_k,
+            document_ids=document_ids,
         )
         if not search_results:
             logger.warning(f"No documents found for query: {query}")
@@ -86,3 +99,7 @@ async def retrieve_documents(query: str, collection_name: str) -> RetrievalResul
         return result
     except Exception as e:
         raise Exception(f"Error retrieving documents: {traceback.format_exc()}") from e
+
+
+if __name__ == "__main__":
+    retrieval_mcp_server.run()
@@ -1,4 +1,5 @@
 from contextlib import AsyncExitStack
+from typing import Any
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.sse import sse_client
@@ -16,6 +17,8 @@ class MCPClientTool(BaseTool):
     session: ClientSession | None = None
     server_id: str = ""  # Add server identifier
     original_name: str = ""
+    # Arguments fixed by the server (e.g. the chat session's search scope); they override model-supplied values
+    bound_arguments: dict[str, Any] = {}
 
     async def execute(self, **kwargs) -> ToolResult:
         """Execute the tool by making a remote call to the MCP server."""
@@ -24,7 +27,8 @@ class MCPClientTool(BaseTool):
 
         try:
             logger.info(f"Executing tool: {self.original_name}")
-            result = await self.session.call_tool(self.original_name, kwargs)
+            arguments = {**kwargs, **self.bound_arguments}
+            result = await self.session.call_tool(self.original_name, arguments)
             content_str = ", ".join(
                 item.text for item in result.content if isinstance(item, TextContent)
             )
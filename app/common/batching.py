@@ -0,0 +1,138 @@
+"""토큰 예산 단위로 LLM 배치 요청을 나누어 보내는 비동기 배치 모듈입니다."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+import tiktoken
+
+from app.common.logger import logger
+from app.common.rate_limiter import AsyncRateLimiter
+
+
+class TokenBudgetBatcher:
+    """입력을 토큰 예산 단위의 작은 배치로 묶어 동시 실행 수와 분당 토큰 수(TPM)를 제한하며 실행합니다.
+
+    배치 하나의 입력 토큰 합이 max_batch_tokens, 항목 수가 max_batch_size를 넘지 않도록 순서대로 묶습니다.
+    각 배치는 실행 전에 입력 토큰 수만큼 TPM 한도를 소비하고, 동시에 max_concurrency개까지만 실행됩니다.
+    인스턴스를 공유하면 여러 요청이 같은 동시 실행/TPM 한도를 나누어 씁니다.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        tokens_per_minute: int | None = None,
+        max_batch_tokens: int = 30000,
+        max_batch_size: int = 16,
+        encoding_name: str = "cl100k_base",
+    ):
+        """TokenBudgetBatcher를 초기화합니다.
+
+        Args:
+            max_concurrency (int): 동시에 실행할 최대 배치 수
+            tokens_per_minute (int | None): 분당 입력 토큰 수 제한. None이면 제한하지 않습니다.
+            max_batch_tokens (int): 배치 하나의 최대 입력 토큰 수
+            max_batch_size (int): 배치 하나의 최대 항목 수
+            encoding_name (str): 토큰 수 계산에 사용할 tiktoken 인코딩 이름
+        """
+        self.max_concurrency = max_concurrency
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_size = max_batch_size
+        self.encoding_name = encoding_name
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._token_limiter = (
+            AsyncRateLimiter(capacity=tokens_per_minute) if tokens_per_minute else None
+        )
+        self._tokenizer = None
+        self._tokenizer_loaded = False
+
+    def _get_tokenizer(self):
+        """처음 호출할 때 tiktoken 인코딩을 불러옵니다. 불러올 수 없으면 None입니다."""
+        if not self._tokenizer_loaded:
+            self._tokenizer_loaded = True
+            try:
+                self._tokenizer = tiktoken.get_encoding(self.encoding_name)
+            except Exception as e:
+                logger.warning(
+                    f"tiktoken 인코딩을 불러오지 못해 바이트 길이로 토큰 수를 추정합니다: {e!r}"
+                )
+        return self._tokenizer
+
+    def count_tokens(self, text: str) -> int:
+        """텍스트의 토큰 수를 계산합니다."""
+        tokenizer = self._get_tokenizer()
+        if tokenizer is not None:
+            return len(tokenizer.encode(text, disallowed_special=()))
+        # 한글은 글자당 약 1토큰(UTF-8 3바이트), 영문은 4글자당 약 1토큰이므로 보수적으로 추정
+        return max(1, len(text.encode("utf-8")) // 3)
+
+    def make_batches(
+        self,
+        token_counts: Sequence[int],
+        max_batch_tokens: int | None = None,
+        min_batch_size: int = 1,
+    ) -> list[list[int]]:
+        """항목별 토큰 수를 받아 순서를 유지한 채 토큰 예산 단위로 묶은 인덱스 목록을 반환합니다.
+
+        Args:
+            token_counts (Sequence[int]): 항목별 입력 토큰 수
+            max_batch_tokens (int | None): 배치 하나의 최대 토큰 수. None이면 인스턴스 설정을 사용합니다.
+            min_batch_size (int): 토큰 예산을 넘더라도 배치에 담을 최소 항목 수
+
+        Returns:
+            list[list[int]]: 배치별 항목 인덱스 목록
+        """
+        max_batch_tokens = max_batch_tokens or self.max_batch_tokens
+        batches: list[list[int]] = []
+        batch: list[int] = []
+        batch_tokens = 0
+        for index, tokens in enumerate(token_counts):
+            if len(batch) >= min_batch_size and (
+                batch_tokens + tokens > max_batch_tokens
+                or len(batch) >= self.max_batch_size
+            ):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(index)
+            batch_tokens += tokens
+        if batch:
+            batches.append(batch)
+        return batches
+
+    async def arun(
+        self,
+        func: Callable[[list[Any]], Awaitable[list[Any]]],
+        items: Sequence[Any],
+        token_counts: Sequence[int],
+    ) -> list[Any]:
+        """항목들을 배치로 나누어 func로 실행하고, 입력 순서대로 결과를 반환합니다.
+
+        Args:
+            func (Callable[[list[Any]], Awaitable[list[Any]]]): 항목 목록을 받아 같은 길이의 결과 목록을 반환하는 비동기 함수
+            items (Sequence[Any]): 입력 항목 목록
+            token_counts (Sequence[int]): 항목별 입력 토큰 수
+
+        Returns:
+            list[Any]: 항목별 결과 목록
+        """
+        batches = self.make_batches(token_counts)
+        logger.info(
+            f"TokenBudgetBatcher: {len(items)} items -> {len(batches)} batches "
+            f"(max_concurrency={self.max_concurrency}, max_batch_tokens={self.max_batch_tokens})"
+        )
+
+        async def _run_batch(indices: list[int]) -> list[Any]:
+            async with self._semaphore:
+                if self._token_limiter is not None:
+                    await self._token_limiter.acquire(
+                        sum(token_counts[i] for i in indices)
+                    )
+                return await func([items[i] for i in indices])
+
+        batch_results = await asyncio.gather(*(_run_batch(b) for b in batches))
+
+        results: list[Any] = [None] * len(items)
+        for indices, batch_result in zip(batches, batch_results, strict=True):
+            for index, result in zip(indices, batch_result, strict=True):
+                results[index] = result
+        return results
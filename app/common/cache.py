@@ -0,0 +1,74 @@
+"""프로세스 내 메모리 캐시 모듈입니다."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class LRUCache:
+    """크기 제한과 선택적 TTL을 지원하는 스레드 안전한 LRU 캐시입니다.
+
+    max_size를 넘으면 가장 오래 사용하지 않은 항목부터 삭제하고,
+    ttl_seconds가 지정되면 저장 후 해당 시간이 지난 항목은 조회 시 만료 처리합니다.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float | None = None):
+        """LRUCache를 초기화합니다.
+
+        Args:
+            max_size (int): 캐시에 보관할 최대 항목 수
+            ttl_seconds (float | None): 항목 유효 시간(초). None이면 만료되지 않습니다.
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """키에 해당하는 값을 반환합니다. 없거나 만료된 경우 default를 반환합니다."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+
+            stored_at, value = item
+            if self.ttl_seconds is not None and (
+                time.monotonic() - stored_at > self.ttl_seconds
+            ):
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """값을 저장하고, 최대 크기를 넘으면 가장 오래 사용하지 않은 항목을 삭제합니다."""
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, float]:
+        """캐시 적중 통계를 반환합니다."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
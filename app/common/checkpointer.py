@@ -0,0 +1,428 @@
+"""LangGraph 체크포인트를 SQLite 파일에 저장하는 checkpointer 모듈입니다.
+
+MemorySaver와 같은 방식으로 체크포인트, 채널 값(blob), 노드별 중간 쓰기(writes)를 저장하되
+프로세스 메모리가 아닌 디스크에 보관하므로, 프로세스가 재시작되어도 마지막으로 완료된 노드부터 그래프를 이어서 실행할 수 있습니다.
+"""
+
+import asyncio
+import os
+import random
+import sqlite3
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator, Sequence
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    SerializerProtocol,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+    writes_sort_key,
+)
+
+from app.common.logger import logger
+
+
+class SQLiteCheckpointSaver(BaseCheckpointSaver[str]):
+    """SQLite 기반의 LangGraph checkpointer입니다.
+
+    채널 값은 버전별로 한 번만 저장하므로, 노드가 바꾸지 않은 채널은 체크포인트마다 중복 저장되지 않습니다.
+    thread 단위로 삭제할 수 있으며, ttl_seconds가 지난 thread는 delete_expired로 정리합니다.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        serde: SerializerProtocol | None = None,
+    ):
+        """SQLiteCheckpointSaver를 초기화합니다.
+
+        Args:
+            db_path (str): SQLite 파일 경로입니다.
+            serde (SerializerProtocol | None): 체크포인트 직렬화 방식. None이면 LangGraph 기본값을 사용합니다.
+        """
+        super().__init__(serde=serde)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                thread_id TEXT NOT NULL,
+                checkpoint_ns TEXT NOT NULL,
+                checkpoint_id TEXT NOT NULL,
+                parent_checkpoint_id TEXT,
+                checkpoint_type TEXT NOT NULL,
+                checkpoint BLOB NOT NULL,
+                metadata_type TEXT NOT NULL,
+                metadata BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+            );
+            CREATE TABLE IF NOT EXISTS blobs (
+                thread_id TEXT NOT NULL,
+                checkpoint_ns TEXT NOT NULL,
+                channel TEXT NOT NULL,
+                version TEXT NOT NULL,
+                value_type TEXT NOT NULL,
+                value BLOB,
+                PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+            );
+            CREATE TABLE IF NOT EXISTS writes (
+                thread_id TEXT NOT NULL,
+                checkpoint_ns TEXT NOT NULL,
+                checkpoint_id TEXT NOT NULL,
+                task_id TEXT NOT NULL,
+                idx INTEGER NOT NULL,
+                channel TEXT NOT NULL,
+                value_type TEXT NOT NULL,
+                value BLOB,
+                task_path TEXT NOT NULL,
+                PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+            );
+            CREATE INDEX IF NOT EXISTS idx_checkpoints_created_at ON checkpoints (created_at);
+            """
+        )
+        self._conn.commit()
+        logger.info(f"Checkpointer initialized: {db_path}")
+
+    @staticmethod
+    def _parent_config(
+        thread_id: str, checkpoint_ns: str, parent_checkpoint_id: str | None
+    ) -> RunnableConfig | None:
+        if not parent_checkpoint_id:
+            return None
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": parent_checkpoint_id,
+            }
+        }
+
+    def _load_blobs(
+        self, thread_id: str, checkpoint_ns: str, versions: ChannelVersions
+    ) -> dict[str, Any]:
+        channel_values = {}
+        for channel, version in versions.items():
+            row = self._conn.execute(
+                "SELECT value_type, value FROM blobs WHERE thread_id = ? AND checkpoint_ns = ? AND channel = ? AND version = ?",
+                (thread_id, checkpoint_ns, channel, str(version)),
+            ).fetchone()
+            if row is None or row[0] == "empty":
+                continue
+            channel_values[channel] = self.serde.loads_typed(row)
+        return channel_values
+
+    def _load_writes(
+        self, thread_id: str, checkpoint_ns: str, checkpoint_id: str
+    ) -> list[tuple[str, str, Any]]:
+        rows = self._conn.execute(
+            "SELECT task_id, idx, channel, value_type, value, task_path FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchall()
+        rows.sort(key=lambda row: writes_sort_key(row[5], row[0], row[1]))
+        return [
+            (task_id, channel, self.serde.loads_typed((value_type, value)))
+            for task_id, _, channel, value_type, value, _ in rows
+        ]
+
+    def _make_tuple(self, row: tuple) -> CheckpointTuple:
+        (
+            thread_id,
+            checkpoint_ns,
+            checkpoint_id,
+            parent_checkpoint_id,
+            checkpoint_type,
+            checkpoint_blob,
+            metadata_type,
+            metadata_blob,
+        ) = row
+        checkpoint: Checkpoint = self.serde.loads_typed(
+            (checkpoint_type, checkpoint_blob)
+        )
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint={
+                **checkpoint,
+                "channel_values": self._load_blobs(
+                    thread_id, checkpoint_ns, checkpoint["channel_versions"]
+                ),
+            },
+            metadata=self.serde.loads_typed((metadata_type, metadata_blob)),
+            parent_config=self._parent_config(
+                thread_id, checkpoint_ns, parent_checkpoint_id
+            ),
+            pending_writes=self._load_writes(thread_id, checkpoint_ns, checkpoint_id),
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """config에 해당하는 체크포인트를 조회합니다. checkpoint_id가 없으면 가장 최근 체크포인트를 반환합니다."""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        query = (
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, checkpoint_type, checkpoint, metadata_type, metadata "
+            "FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ?"
+        )
+        params: tuple = (thread_id, checkpoint_ns)
+        if checkpoint_id := get_checkpoint_id(config):
+            query += " AND checkpoint_id = ?"
+            params += (checkpoint_id,)
+        else:
+            query += " ORDER BY checkpoint_id DESC LIMIT 1"
+
+        with self._lock:
+            row = self._conn.execute(query, params).fetchone()
+            return self._make_tuple(row) if row else None
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        """조건에 맞는 체크포인트를 최신순으로 조회합니다."""
+        query = (
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, checkpoint_type, checkpoint, metadata_type, metadata "
+            "FROM checkpoints"
+        )
+        conditions, params = [], []
+        if config:
+            conditions.append("thread_id = ?")
+            params.append(config["configurable"]["thread_id"])
+            if (
+                checkpoint_ns := config["configurable"].get("checkpoint_ns")
+            ) is not None:
+                conditions.append("checkpoint_ns = ?")
+                params.append(checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                conditions.append("checkpoint_id = ?")
+                params.append(checkpoint_id)
+        if before and (before_checkpoint_id := get_checkpoint_id(before)):
+            conditions.append("checkpoint_id < ?")
+            params.append(before_checkpoint_id)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY checkpoint_id DESC"
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+            results = []
+            for row in rows:
+                if limit is not None and len(results) >= limit:
+                    break
+                metadata = self.serde.loads_typed((row[6], row[7]))
+                if filter and not all(
+                    metadata.get(key) == value for key, value in filter.items()
+                ):
+                    continue
+                results.append(self._make_tuple(row))
+        yield from results
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """체크포인트와 이번에 바뀐 채널 값을 저장합니다."""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        checkpoint = checkpoint.copy()
+        channel_values: dict[str, Any] = checkpoint.pop("channel_values")  # type: ignore[misc]
+
+        blob_rows = []
+        for channel, version in new_versions.items():
+            value_type, value = (
+                self.serde.dumps_typed(channel_values[channel])
+                if channel in channel_values
+                else ("empty", None)
+            )
+            blob_rows.append(
+                (thread_id, checkpoint_ns, channel, str(version), value_type, value)
+            )
+        checkpoint_type, checkpoint_blob = self.serde.dumps_typed(checkpoint)
+        metadata_type, metadata_blob = self.serde.dumps_typed(
+            get_checkpoint_metadata(config, metadata)
+        )
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO blobs (thread_id, checkpoint_ns, channel, version, value_type, value) VALUES (?, ?, ?, ?, ?, ?)",
+                blob_rows,
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, checkpoint_type, checkpoint, metadata_type, metadata, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    config["configurable"].get("checkpoint_id"),
+                    checkpoint_type,
+                    checkpoint_blob,
+                    metadata_type,
+                    metadata_blob,
+                    time.time(),
+                ),
+            )
+            self._conn.commit()
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """노드(task)가 완료되며 남긴 중간 쓰기를 저장합니다. 같은 superstep에서 먼저 끝난 노드는 재실행 시 건너뜁니다."""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        # 일반 쓰기는 먼저 저장된 값을 유지하고, 오류/인터럽트 같은 특수 쓰기(음수 idx)는 덮어씀
+        insert_rows, replace_rows = [], []
+        for idx, (channel, value) in enumerate(writes):
+            write_idx = WRITES_IDX_MAP.get(channel, idx)
+            value_type, value_blob = self.serde.dumps_typed(value)
+            row = (
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                task_id,
+                write_idx,
+                channel,
+                value_type,
+                value_blob,
+                task_path,
+            )
+            (insert_rows if write_idx >= 0 else replace_rows).append(row)
+
+        columns = "(thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, value_type, value, task_path) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR IGNORE INTO writes {columns}", insert_rows
+            )
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO writes {columns}", replace_rows
+            )
+            self._conn.commit()
+
+    def delete_thread(self, thread_id: str) -> None:
+        """thread의 모든 체크포인트와 중간 쓰기를 삭제합니다."""
+        with self._lock:
+            for table in ("checkpoints", "blobs", "writes"):
+                self._conn.execute(
+                    f"DELETE FROM {table} WHERE thread_id = ?", (thread_id,)
+                )
+            self._conn.commit()
+
+    def expired_thread_ids(self, ttl_seconds: float) -> tuple[str, ...]:
+        """마지막 체크포인트가 ttl_seconds보다 오래된 thread 목록을 반환합니다."""
+        with self._lock:
+            return tuple(
+                thread_id
+                for (thread_id,) in self._conn.execute(
+                    "SELECT thread_id FROM checkpoints GROUP BY thread_id HAVING MAX(created_at) < ?",
+                    (time.time() - ttl_seconds,),
+                ).fetchall()
+            )
+
+    def delete_expired(self, ttl_seconds: float) -> int:
+        """마지막 체크포인트가 ttl_seconds보다 오래된 thread를 삭제하고, 삭제한 thread 수를 반환합니다."""
+        thread_ids = self.expired_thread_ids(ttl_seconds)
+        for thread_id in thread_ids:
+            self.delete_thread(thread_id)
+        if thread_ids:
+            logger.info(f"Checkpointer expired {len(thread_ids)} threads")
+        return len(thread_ids)
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        results = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for checkpoint_tuple in results:
+            yield checkpoint_tuple
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(
+            self.put, config, checkpoint, metadata, new_versions
+        )
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+    async def aexpired_thread_ids(self, ttl_seconds: float) -> tuple[str, ...]:
+        return await asyncio.to_thread(self.expired_thread_ids, ttl_seconds)
+
+    async def adelete_expired(self, ttl_seconds: float) -> int:
+        return await asyncio.to_thread(self.delete_expired, ttl_seconds)
+
+    def get_next_version(self, current: str | None, channel: None) -> str:
+        """MemorySaver와 같은 형식의 단조 증가 채널 버전을 만듭니다."""
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,157 @@
+"""URL의 파일을 청크 단위로 디스크에 내려받는 비동기 다운로더 모듈입니다."""
+
+import asyncio
+import contextlib
+import os
+import re
+import tempfile
+
+import httpx
+
+from app.common.exceptions.custom_exceptions import FileTooLargeError
+from app.common.logger import logger
+
+CONTENT_RANGE_PATTERN = re.compile(r"bytes (\d+)-\d+/(\d+|\*)")
+
+
+class AsyncFileDownloader:
+    """연결 풀을 재사용하는 스트리밍 파일 다운로더입니다.
+
+    응답 본문을 chunk_size 단위로 받아 바로 파일에 쓰므로, 파일 크기와 관계없이 메모리 사용량은 청크 크기로 제한됩니다.
+    파일 쓰기는 별도 스레드에서 수행하여 이벤트 루프를 막지 않습니다.
+    전송 중 연결이 끊기면 Range 요청으로 받은 위치부터 이어받고, 서버가 Range를 지원하지 않으면 처음부터 다시 받습니다.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 1024 * 1024,
+        max_bytes: int = 500 * 1024 * 1024,
+        timeout: float = 300,
+        connect_timeout: float = 10,
+        read_timeout: float = 60,
+        max_retries: int = 3,
+        max_connections: int = 10,
+    ):
+        """AsyncFileDownloader를 초기화합니다.
+
+        Args:
+            chunk_size (int): 한 번에 읽고 쓸 청크 크기(바이트)
+            max_bytes (int): 허용하는 최대 파일 크기(바이트). 넘으면 FileTooLargeError가 발생합니다.
+            timeout (float): 파일 하나를 내려받는 전체 제한 시간(초)
+            connect_timeout (float): 연결 제한 시간(초)
+            read_timeout (float): 청크 하나를 기다리는 제한 시간(초)
+            max_retries (int): 연결이 끊겼을 때 이어받기를 시도할 최대 횟수
+            max_connections (int): 연결 풀의 최대 연결 수
+        """
+        self.chunk_size = chunk_size
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_retries = max_retries
+        self.max_connections = max_connections
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """keep-alive 연결 풀을 사용하는 HTTP 클라이언트를 반환합니다. 처음 호출할 때 생성합니다."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                follow_redirects=True,
+                # 이어받기 위치(바이트 offset)가 실제 파일 위치와 같도록 압축 전송을 사용하지 않음
+                headers={"Accept-Encoding": "identity"},
+                timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._client
+
+    async def aclose(self):
+        """HTTP 연결 풀을 닫습니다."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def download(self, url: str, save_path: str | None = None) -> str:
+        """URL의 파일을 내려받아 저장하고 저장 경로를 반환합니다.
+
+        Args:
+            url (str): 다운로드할 파일의 URL
+            save_path (str | None): 저장할 경로. None이면 임시 파일을 만들고, 호출한 쪽에서 삭제해야 합니다.
+
+        Returns:
+            str: 파일이 저장된 경로
+
+        Raises:
+            FileTooLargeError: 파일 크기가 max_bytes를 넘는 경우
+            httpx.HTTPError: 재시도 후에도 다운로드에 실패한 경우
+            TimeoutError: 전체 제한 시간을 넘긴 경우
+        """
+        if save_path is None:
+            suffix = os.path.splitext(httpx.URL(url).path)[1]
+            fd, save_path = tempfile.mkstemp(suffix=suffix)
+            os.close(fd)
+        else:
+            save_dir = os.path.dirname(save_path)
+            if save_dir:
+                os.makedirs(save_dir, exist_ok=True)
+
+        try:
+            async with asyncio.timeout(self.timeout):
+                written = await self._download_to_file(url, save_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(save_path)
+            raise
+        logger.info(f"파일 다운로드 완료: {url} -> {save_path} ({written} bytes)")
+        return save_path
+
+    async def _download_to_file(self, url: str, save_path: str) -> int:
+        client = self._get_client()
+        written = 0
+        with open(save_path, "wb") as f:
+            for attempt in range(self.max_retries + 1):
+                headers = {"Range": f"bytes={written}-"} if written else {}
+                try:
+                    async with client.stream("GET", url, headers=headers) as response:
+                        response.raise_for_status()
+                        if written and not self._is_resumed(response, written):
+                            # 서버가 Range를 무시하고 전체 본문을 보낸 경우 처음부터 다시 씀
+                            logger.warning(
+                                f"Range 요청 미지원, 처음부터 다시 다운로드: {url}"
+                            )
+                            written = 0
+                            await asyncio.to_thread(f.seek, 0)
+                            await asyncio.to_thread(f.truncate)
+
+                        content_length = response.headers.get("Content-Length")
+                        if (
+                            content_length is not None
+                            and written + int(content_length) > self.max_bytes
+                        ):
+                            raise FileTooLargeError()
+
+                        async for chunk in response.aiter_bytes(self.chunk_size):
+                            written += len(chunk)
+                            if written > self.max_bytes:
+                                raise FileTooLargeError()
+                            await asyncio.to_thread(f.write, chunk)
+                    return written
+                except httpx.TransportError as e:
+                    if attempt == self.max_retries:
+                        raise
+                    logger.warning(
+                        f"다운로드 연결 끊김, {written} bytes부터 이어받기 "
+                        f"({attempt + 1}/{self.max_retries}): {e!r}"
+                    )
+                    await asyncio.sleep(min(2**attempt, 10))
+        return written
+
+    @staticmethod
+    def _is_resumed(response: httpx.Response, offset: int) -> bool:
+        """응답이 offset부터 이어지는 부분 응답(206)인지 확인합니다."""
+        if response.status_code != 206:
+            return False
+        match = CONTENT_RANGE_PATTERN.match(response.headers.get("Content-Range", ""))
+        return match is not None and int(match.group(1)) == offset
@@ -80,6 +80,34 @@ class TaskFailError(CustomError):
         )
 
 
+class FileTooLargeError(CustomError):
+    def __init__(self):
+        status_code = StatusCode.HTTP_400
+        error_code = "1005"
+        exception_detail = "파일 크기가 허용된 최대 크기를 초과하였습니다."
+
+        super().__init__(
+            status_code=status_code,
+            error_code=error_code,
+            message=exception_detail,
+            ex=Exception(exception_detail),
+        )
+
+
+class ParsingInProgressError(CustomError):
+    def __init__(self):
+        status_code = StatusCode.HTTP_409
+        error_code = "1006"
+        exception_detail = "이미 파싱이 진행 중인 문서입니다."
+
+        super().__init__(
+            status_code=status_code,
+            error_code=error_code,
+            message=exception_detail,
+            ex=Exception(exception_detail),
+        )
+
+
 class ToolError(Exception):
     """Raised when a tool encounters an error."""
 
@@ -9,5 +9,6 @@ class StatusCode:
     HTTP_403 = status.HTTP_403_FORBIDDEN
     HTTP_404 = status.HTTP_404_NOT_FOUND
     HTTP_405 = status.HTTP_405_METHOD_NOT_ALLOWED
+    HTTP_409 = status.HTTP_409_CONFLICT
     HTTP_422 = status.HTTP_422_UNPROCESSABLE_ENTITY
     HTTP_500 = status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import os
 from collections.abc import Generator
@@ -77,6 +78,25 @@ class LangchainClient(ILangchainClient):
 
         return self._client.invoke(messages)
 
+    async def ainvoke(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        chat_history: list[dict[str, Any]] | None = None,
+    ) -> Any:
+        """Async invoke the model.
+
+        Args:
+            system_prompt: The system prompt.
+            user_prompt: The user prompt.
+            chat_history: The chat history.
+        """
+        messages = self.create_messages(system_prompt, user_prompt)
+        if chat_history:
+            messages = chat_history + messages
+
+        return await self._client.ainvoke(messages)
+
     def invoke_structured(
         self,
         system_prompt: str,
@@ -265,6 +285,46 @@ class MultiModalLangchainClient(LangchainClient):
 
         return self._client.invoke(messages)
 
+    async def acreate_messages_with_image(
+        self,
+        image_input: str | bytes,
+        system_prompt: str,
+        user_prompt: str,
+        mime_type: str = "image/png",
+    ) -> list[dict[str, Any]]:
+        """create_messages_with_image의 비동기 버전입니다.
+
+        이미지 URL/파일 경로는 다운로드·파일 읽기가 이벤트 루프를 막지 않도록 별도 스레드에서 인코딩합니다.
+        """
+        if isinstance(image_input, str):
+            return await asyncio.to_thread(
+                self.create_messages_with_image,
+                image_input,
+                system_prompt,
+                user_prompt,
+                mime_type,
+            )
+        return self.create_messages_with_image(
+            image_input, system_prompt, user_prompt, mime_type
+        )
+
+    async def ainvoke(
+        self,
+        image_input: str | bytes,
+        system_prompt: str,
+        user_prompt: str,
+        mime_type: str = "image/png",
+        chat_history: list[dict[str, Any]] | None = None,
+    ):
+        """Async invoke the model."""
+        messages = await self.acreate_messages_with_image(
+            image_input, system_prompt, user_prompt, mime_type
+        )
+        if chat_history:
+            messages = chat_history + messages
+
+        return await self._client.ainvoke(messages)
+
     def batch(
         self,
         image_inputs: list[str | bytes],
@@ -295,6 +355,36 @@ class MultiModalLangchainClient(LangchainClient):
 
         return self._client.batch(messages_list)
 
+    async def abatch(
+        self,
+        image_inputs: list[str | bytes],
+        system_prompts: list[str],
+        user_prompts: list[str],
+        mime_types: list[str],
+        chat_history: list[list[dict[str, Any]]] | None = None,
+    ) -> list[str]:
+        """Async batch invoke the model."""
+        if not (
+            len(system_prompts)
+            == len(user_prompts)
+            == len(mime_types)
+            == len(image_inputs)
+        ):
+            raise ValueError(
+                "Length of all input lists must match the number of images."
+            )
+
+        messages_list = []
+        for i in range(len(system_prompts)):
+            messages = await self.acreate_messages_with_image(
+                image_inputs[i], system_prompts[i], user_prompts[i], mime_types[i]
+            )
+            if chat_history:
+                messages = chat_history[i] + messages
+            messages_list.append(messages)
+
+        return await self._client.abatch(messages_list)
+
     def stream(
         self,
         image_input: str | bytes,
@@ -8,10 +8,18 @@ class ILangchainClient(ABC):
     def invoke(self, **kwargs: Any) -> Any:
         pass
 
+    @abstractmethod
+    async def ainvoke(self, **kwargs: Any) -> Any:
+        pass
+
     @abstractmethod
     def batch(self, **kwargs: Any) -> list[str]:
         pass
 
+    @abstractmethod
+    async def abatch(self, **kwargs: Any) -> list[str]:
+        pass
+
     @abstractmethod
     def stream(self, **kwargs: Any) -> Generator[Any, None, None]:
         pass
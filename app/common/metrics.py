@@ -0,0 +1,53 @@
+"""외부 API 호출 지연 시간 통계 모듈입니다."""
+
+import threading
+from collections import deque
+
+
+class LatencyMetrics:
+    """최근 호출의 지연 시간과 성공/실패/재시도 횟수를 집계합니다.
+
+    백분위수는 최근 window개 호출로 계산하고, 누적 횟수는 전체 호출 기준입니다.
+    """
+
+    def __init__(self, window: int = 1000):
+        """LatencyMetrics를 초기화합니다.
+
+        Args:
+            window (int): 백분위수 계산에 사용할 최근 호출 수
+        """
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency_seconds: float, success: bool, attempts: int = 1):
+        """호출 한 번의 결과를 기록합니다."""
+        with self._lock:
+            self.count += 1
+            self.retries += max(0, attempts - 1)
+            if not success:
+                self.errors += 1
+            self._latencies.append(latency_seconds)
+
+    def snapshot(self) -> dict[str, float]:
+        """현재까지의 통계를 반환합니다."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            count, errors, retries = self.count, self.errors, self.retries
+
+        def _percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(len(latencies) * p))]
+
+        return {
+            "count": count,
+            "errors": errors,
+            "retries": retries,
+            "avg_seconds": sum(latencies) / len(latencies) if latencies else 0.0,
+            "p50_seconds": _percentile(0.5),
+            "p95_seconds": _percentile(0.95),
+            "max_seconds": latencies[-1] if latencies else 0.0,
+        }
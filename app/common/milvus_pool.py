@@ -0,0 +1,130 @@
+"""Milvus 연결 풀 모듈입니다."""
+
+import asyncio
+import itertools
+import threading
+import time
+
+from pymilvus import connections, utility
+
+from app.common.logger import logger
+
+
+class MilvusConnectionPool:
+    """여러 개의 Milvus 연결 별칭(gRPC 채널)을 지연 생성하고 라운드 로빈으로 나누어 주는 연결 풀입니다.
+
+    pymilvus는 연결 별칭마다 하나의 gRPC 채널을 사용하므로, 별칭을 여러 개 두어 동시 세션의 요청이
+    하나의 채널에 몰리지 않도록 합니다. 연결은 처음 사용할 때 생성하므로 앱 시작이 Milvus 연결을 기다리지 않으며,
+    health_check_interval_seconds가 지난 연결은 사용 전에 서버 버전 조회로 상태를 확인하고 실패하면 다시 연결합니다.
+    """
+
+    def __init__(
+        self,
+        address: str = "127.0.0.1:19530",
+        alias_prefix: str = "default",
+        pool_size: int = 4,
+        health_check_interval_seconds: float = 30,
+        timeout: float = 10,
+        user: str = "",
+        password: str = "",
+        db_name: str = "default",
+    ):
+        """MilvusConnectionPool을 초기화합니다. 이 시점에는 연결을 생성하지 않습니다.
+
+        Args:
+            address (str): Milvus 서버 주소입니다.
+            alias_prefix (str): 연결 별칭 접두사입니다. 별칭은 "{alias_prefix}-{번호}" 형태입니다.
+            pool_size (int): 생성할 연결(gRPC 채널) 수입니다.
+            health_check_interval_seconds (float): 연결 상태를 다시 확인할 간격(초)입니다.
+            timeout (float): 연결 및 상태 확인 제한 시간(초)입니다.
+            user (str): Milvus 사용자 이름입니다.
+            password (str): Milvus 비밀번호입니다.
+            db_name (str): 사용할 데이터베이스 이름입니다.
+        """
+        self.address = address
+        self.aliases = [f"{alias_prefix}-{i}" for i in range(max(1, pool_size))]
+        self.health_check_interval_seconds = health_check_interval_seconds
+        self.timeout = timeout
+        self._user = user
+        self._password = password
+        self._db_name = db_name
+        self._counter = itertools.count()
+        self._alias_locks = {alias: threading.Lock() for alias in self.aliases}
+        self._last_checked: dict[str, float] = {}
+        logger.info(
+            f"Milvus connection pool: address={address}, aliases={self.aliases}"
+        )
+
+    def acquire(self) -> str:
+        """사용할 연결 별칭을 라운드 로빈으로 반환합니다. 필요하면 연결을 생성하거나 다시 연결합니다.
+
+        네트워크 I/O가 발생할 수 있으므로 이벤트 루프에서는 aacquire를 사용하거나 스레드에서 호출해야 합니다.
+        """
+        alias = self.aliases[next(self._counter) % len(self.aliases)]
+        self._ensure_connected(alias)
+        return alias
+
+    async def aacquire(self) -> str:
+        return await asyncio.to_thread(self.acquire)
+
+    def _ensure_connected(self, alias: str):
+        with self._alias_locks[alias]:
+            self._check_connection(alias)
+
+    def _check_connection(self, alias: str):
+        if not connections.has_connection(alias):
+            self._connect(alias)
+            return
+
+        if (
+            time.monotonic() - self._last_checked.get(alias, 0)
+            < self.health_check_interval_seconds
+        ):
+            return
+
+        try:
+            utility.get_server_version(using=alias, timeout=self.timeout)
+            self._last_checked[alias] = time.monotonic()
+        except Exception as e:
+            logger.warning(
+                f"Milvus 연결 '{alias}' 상태 확인 실패, 다시 연결합니다: {e}"
+            )
+            try:
+                connections.disconnect(alias)
+            except Exception as disconnect_error:
+                logger.warning(
+                    f"Milvus 연결 '{alias}' 해제 중 오류 발생: {disconnect_error}"
+                )
+            self._connect(alias)
+
+    def _connect(self, alias: str):
+        connections.connect(
+            alias,
+            address=self.address,
+            user=self._user,
+            password=self._password,
+            db_name=self._db_name,
+            timeout=self.timeout,
+        )
+        self._last_checked[alias] = time.monotonic()
+        logger.info(f"Milvus connection '{alias}' initialized at {self.address}")
+
+    async def awarmup(self):
+        """모든 연결을 미리 생성합니다. 실패해도 예외를 던지지 않으며, 실제 사용 시점에 다시 연결을 시도합니다."""
+        for alias in self.aliases:
+            try:
+                await asyncio.to_thread(self._ensure_connected, alias)
+            except Exception as e:
+                logger.warning(f"Milvus 연결 '{alias}' 사전 생성 실패: {e}")
+                return
+
+    def close(self):
+        """풀의 모든 연결을 해제합니다."""
+        for alias in self.aliases:
+            try:
+                if connections.has_connection(alias):
+                    connections.disconnect(alias)
+                    logger.info(f"Milvus connection '{alias}' disconnected")
+            except Exception as e:
+                logger.warning(f"Error during Milvus cleanup: {e}")
+        self._last_checked.clear()
@@ -0,0 +1,43 @@
+"""외부 API 호출 속도를 제한하는 비동기 rate limiter 모듈입니다."""
+
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """토큰 버킷 방식의 비동기 rate limiter입니다.
+
+    period_seconds 동안 최대 capacity만큼 소비할 수 있으며, 토큰은 일정한 속도로 다시 채워집니다.
+    요청 수(RPM)뿐 아니라 amount에 토큰 수를 넘기면 분당 토큰 수(TPM) 제한에도 사용할 수 있습니다.
+    """
+
+    def __init__(self, capacity: float, period_seconds: float = 60):
+        """AsyncRateLimiter를 초기화합니다.
+
+        Args:
+            capacity (float): period_seconds 동안 허용하는 최대 소비량
+            period_seconds (float): 제한 기간(초)
+        """
+        self.capacity = capacity
+        self.period_seconds = period_seconds
+        self._refill_rate = capacity / period_seconds
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self._refill_rate
+        )
+        self._updated_at = now
+
+    async def acquire(self, amount: float = 1):
+        """amount만큼 소비할 수 있을 때까지 기다립니다. capacity보다 큰 요청은 capacity로 제한합니다."""
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            self._refill()
+            while self._tokens < amount:
+                await asyncio.sleep((amount - self._tokens) / self._refill_rate)
+                self._refill()
+            self._tokens -= amount
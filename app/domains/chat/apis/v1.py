@@ -8,6 +8,7 @@ from mcp import ClientSession
 from app.common.messaging.message_dispatcher import MessageDispatcher
 from app.domains.chat.schemas.chat_request import ChatRequest, CreateSessionRequest
 from app.domains.chat.schemas.chat_response import CreateSessionResponse
+from app.domains.chat.schemas.indexing_job import IndexingJob
 from app.domains.chat.services.chat_service import ChatService
 from app.domains.containers import BaseContainer
 
@@ -30,6 +31,57 @@ async def create_session(
     return await chat_service.create_session(create_session_request)
 
 
+@chat_v1_router.get(
+    path="/indexing-jobs/{job_id}",
+    summary="Get indexing job status",
+    description="Retrieve the status and progress of a session document indexing job",
+    response_model=IndexingJob,
+)
+@inject
+async def get_indexing_job(
+    job_id: str,
+    chat_service: ChatService = Depends(
+        Provide[BaseContainer.chat_container.chat_service]
+    ),
+) -> IndexingJob:
+    return chat_service.get_indexing_job(job_id)
+
+
+@chat_v1_router.get(
+    path="/indexing-jobs/{job_id}/stream",
+    summary="Stream indexing job progress",
+    description="Receive SSE events whenever the indexing job status or progress changes",
+    response_class=StreamingResponse,
+)
+@inject
+async def stream_indexing_job(
+    job_id: str,
+    chat_service: ChatService = Depends(
+        Provide[BaseContainer.chat_container.chat_service]
+    ),
+) -> StreamingResponse:
+    return StreamingResponse(
+        chat_service.stream_indexing_job(job_id),
+        media_type="text/event-stream",
+    )
+
+
+@chat_v1_router.post(
+    path="/indexing-jobs/{job_id}/cancel",
+    summary="Cancel indexing job",
+    description="Cancel a pending or running session document indexing job",
+    response_model=IndexingJob,
+)
+@inject
+async def cancel_indexing_job(
+    job_id: str,
+    chat_service: ChatService = Depends(
+        Provide[BaseContainer.chat_container.chat_service]
+    ),
+) -> IndexingJob:
+    return await chat_service.cancel_indexing_job(job_id)
+
+
 @chat_v1_router.post(
     path="/stream",
     summary="Send chat message",
@@ -7,13 +7,16 @@ from app.agents.adaptor.openai_adaptor import OpenAILLMAdapter
 from app.agents.domains import AGENT_REGISTRY
 from app.common.logger import logger
 from app.common.messaging.message_dispatcher import MessageDispatcher
+from app.common.milvus_pool import MilvusConnectionPool
 from app.config.utils import init_config
+from app.domains.chat.handlers.indexer.embedding_cache import SQLiteEmbeddingCache
 from app.domains.chat.handlers.indexer.milvus import MilvusIndexer
 from app.domains.chat.repositories.mongo_chat_session_repository import (
     MongoChatSessionRepository,
 )
 from app.domains.chat.services.agent_adapter import AgentAdapter
 from app.domains.chat.services.chat_service import ChatService
+from app.domains.chat.services.indexing_job_manager import IndexingJobManager
 from app.domains.document.repositories.mongo_document_repository import (
     MongoDocumentRepository,
 )
@@ -91,12 +94,49 @@ class ChatContainer(DeclarativeContainer):
         db=mongo_db,
     )
     mongo_document_repository = Singleton(MongoDocumentRepository, db=mongo_db)
+    connection_config = config.milvus.connection()
+    milvus_connection_pool = Singleton(
+        MilvusConnectionPool,
+        address=connection_config.get("address"),
+        alias_prefix=config.milvus.indexing.connection_alias(),
+        pool_size=connection_config.get("pool_size"),
+        health_check_interval_seconds=connection_config.get(
+            "health_check_interval_seconds"
+        ),
+        timeout=connection_config.get("timeout"),
+    )
+    embedding_cache_config = config.milvus.indexing.embedding_cache()
+    embedding_cache = Singleton(
+        SQLiteEmbeddingCache,
+        db_path=embedding_cache_config.get("db_path"),
+        max_entries=embedding_cache_config.get("max_entries"),
+    )
+    insert_config = config.milvus.indexing.insert()
+    pipeline_config = config.milvus.indexing.pipeline()
     milvus_indexer = Singleton(
         MilvusIndexer,
-        connection_alias=config.milvus.indexing.connection_alias(),
+        connection_pool=milvus_connection_pool,
         embedding_model=config.milvus.indexing.embedding_model(),
         dense_vector_dim=config.milvus.indexing.dense_vector_dim(),
         enable_nltk=config.milvus.indexing.enable_nltk(),
+        preprocess_workers=config.milvus.indexing.preprocess_workers(),
+        index_mode=config.milvus.indexing.index_mode(),
+        embedding_cache=embedding_cache
+        if embedding_cache_config.get("enabled")
+        else None,
+        insert_concurrency=insert_config.get("concurrency"),
+        insert_max_batch_bytes=insert_config.get("max_batch_bytes"),
+        insert_max_batch_rows=insert_config.get("max_batch_rows"),
+        pipeline_group_size=pipeline_config.get("group_size"),
+        pipeline_queue_size=pipeline_config.get("queue_size"),
+        embed_concurrency=pipeline_config.get("embed_concurrency"),
+    )
+
+    indexing_jobs_config = config.milvus.indexing.jobs()
+    indexing_job_manager = Singleton(
+        IndexingJobManager,
+        max_concurrent_jobs=indexing_jobs_config.get("max_concurrent_jobs"),
+        max_retained_jobs=indexing_jobs_config.get("max_retained_jobs"),
     )
 
     # --- LLM 어댑터 설정 ---
@@ -131,4 +171,6 @@ class ChatContainer(DeclarativeContainer):
         chat_session_repository=mongo_chat_session_repository,
         milvus_indexer=milvus_indexer,
         document_repository=mongo_document_repository,
+        indexing_job_manager=indexing_job_manager,
+        collection_scope=config.milvus.indexing.collection_scope(),
     )
@@ -0,0 +1,141 @@
+"""Dense 임베딩 결과를 디스크(SQLite)에 보관하는 캐시 모듈입니다.
+
+(임베딩 모델, 텍스트 해시)를 키로 벡터를 저장하여, 이미 임베딩한 청크는 임베딩 API를 다시 호출하지 않도록 합니다.
+"""
+
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from array import array
+
+from app.common.logger import logger
+
+
+class SQLiteEmbeddingCache:
+    """SQLite 기반의 크기 제한 LRU 임베딩 캐시입니다.
+
+    벡터는 float32 바이트(BLOB)로 저장하며, 조회될 때마다 마지막 접근 시각을 갱신합니다.
+    저장된 항목 수가 max_entries를 넘으면 가장 오래 접근하지 않은 항목부터 삭제합니다.
+    """
+
+    def __init__(self, db_path: str, max_entries: int = 200_000):
+        """SQLiteEmbeddingCache를 초기화합니다.
+
+        Args:
+            db_path (str): SQLite 파일 경로입니다.
+            max_entries (int): 캐시에 보관할 최대 벡터 수입니다.
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_embeddings_last_access ON embeddings (last_access)"
+        )
+        self._conn.commit()
+        logger.info(
+            f"Embedding cache initialized: {db_path} (max_entries={max_entries})"
+        )
+
+    @staticmethod
+    def _make_key(model: str, text: str) -> str:
+        return hashlib.sha256(f"{model}\x00{text}".encode()).hexdigest()
+
+    def get_many(self, model: str, texts: list[str]) -> list[list[float] | None]:
+        """텍스트 목록에 대한 캐시된 벡터를 조회합니다. 캐시에 없는 항목은 None입니다."""
+        keys = [self._make_key(model, text) for text in texts]
+        found: dict[str, list[float]] = {}
+        query_batch_size = 500  # SQLite 바인딩 변수 수 제한 대응
+
+        with self._lock:
+            for i in range(0, len(keys), query_batch_size):
+                batch_keys = list(set(keys[i : i + query_batch_size]))
+                placeholders = ",".join("?" * len(batch_keys))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    batch_keys,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = array("f", blob).tolist()
+
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE embeddings SET last_access = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+                self._conn.commit()
+
+            results = [found.get(key) for key in keys]
+            hit_count = sum(1 for vector in results if vector is not None)
+            self.hits += hit_count
+            self.misses += len(results) - hit_count
+        return results
+
+    def put_many(self, model: str, texts: list[str], vectors: list[list[float]]):
+        """텍스트 목록과 벡터를 캐시에 저장하고, 필요하면 LRU 정책으로 오래된 항목을 삭제합니다."""
+        now = time.time()
+        rows = [
+            (self._make_key(model, text), model, array("f", vector).tobytes(), now)
+            for text, vector in zip(texts, vectors, strict=True)
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, model, vector, last_access) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """저장된 항목 수가 max_entries를 넘으면 가장 오래 접근하지 않은 항목을 삭제합니다."""
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        overflow = count - self.max_entries
+        if overflow <= 0:
+            return
+        self._conn.execute(
+            "DELETE FROM embeddings WHERE key IN (SELECT key FROM embeddings ORDER BY last_access ASC LIMIT ?)",
+            (overflow,),
+        )
+        logger.info(f"Embedding cache evicted {overflow} entries")
+
+    async def aget_many(self, model: str, texts: list[str]) -> list[list[float] | None]:
+        return await asyncio.to_thread(self.get_many, model, texts)
+
+    async def aput_many(self, model: str, texts: list[str], vectors: list[list[float]]):
+        await asyncio.to_thread(self.put_many, model, texts, vectors)
+
+    def stats(self) -> dict[str, float]:
+        """캐시 적중 통계를 반환합니다."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,15 +1,13 @@
 import asyncio
-import re
-from functools import partial
+import hashlib
+import json
+import time
+from array import array
+from collections.abc import Callable
 from typing import Any
 
-# 효과적인 전처리를 위한 imports
-import nltk
 from langchain_core.documents import Document as LangchainDocument
 from langchain_openai import OpenAIEmbeddings
-from nltk.corpus import stopwords
-from nltk.stem import PorterStemmer
-from nltk.tokenize import word_tokenize
 from pymilvus import (
     Collection,
     CollectionSchema,
@@ -17,207 +15,285 @@ from pymilvus import (
     FieldSchema,
     Function,
     FunctionType,
-    connections,
     utility,
 )
 
 from app.common.logger import logger
+from app.common.milvus_pool import MilvusConnectionPool
+from app.domains.chat.handlers.indexer.embedding_cache import SQLiteEmbeddingCache
+from app.domains.chat.handlers.indexer.preprocessing import BM25TextPreprocessor
 
-# NLTK 데이터 다운로드 (처음 실행시에만)
-try:
-    nltk.data.find("tokenizers/punkt")
-    nltk.data.find("corpora/stopwords")
-except LookupError:
-    nltk.download("punkt", quiet=True)
-    nltk.download("stopwords", quiet=True)
+# 인덱싱이 끝날 때마다 갱신하는 컬렉션 속성. MilvusRetriever가 결과 캐시를 무효화하는 데 사용
+INDEX_VERSION_PROPERTY = "index_version"
 
 
 class MilvusIndexer:
     """pymilvus를 사용하여 하이브리드 검색(Dense + Sparse)을 위한 인덱스를 구축하고 관리합니다.
 
-    이 클래스는 컬렉션을 완전히 다시 만드는 "drop and recreate" 전략을 사용하여 항상 모든 문서에 대한 최신 인덱스를 유지합니다.
+    두 가지 인덱싱 모드를 지원합니다.
+    - rebuild: 컬렉션을 완전히 다시 만드는 "drop and recreate" 전략으로 항상 전달된 문서만으로 인덱스를 구성합니다.
+    - incremental: 컬렉션을 유지한 채 문서 단위로 저장된 청크와 비교(diff)하여 새 청크만 임베딩/upsert하고, 사라진 청크는 삭제합니다.
     Milvus 2.5/2.6의 내장 BM25 Function을 사용하여 자동으로 sparse embedding을 생성합니다.
     원본 텍스트는 dense embedding용, 전처리된 텍스트는 sparse embedding용으로 분리 저장합니다.
+    청크의 primary key는 (document_id, 본문, 메타데이터)의 SHA-256 해시로, 같은 청크는 항상 같은 키를 갖습니다.
     """
 
+    INDEX_MODES = ("rebuild", "incremental")
+
     def __init__(
         self,
-        connection_alias: str,
+        connection_pool: MilvusConnectionPool,
         dense_vector_dim: int,
         embedding_model: str = "text-embedding-3-small",
         enable_nltk: bool = False,
+        index_mode: str = "rebuild",
+        embedding_cache: SQLiteEmbeddingCache | None = None,
+        insert_concurrency: int = 4,
+        insert_max_batch_bytes: int = 8 * 1024 * 1024,
+        insert_max_batch_rows: int = 1000,
+        pipeline_group_size: int = 256,
+        pipeline_queue_size: int = 2,
+        embed_concurrency: int = 2,
+        preprocess_workers: int = 0,
     ):
         """MilvusIndexer를 초기화합니다.
 
         Args:
             embedding_model (str): Dense 임베딩을 생성할 OpenAI 모델의 이름입니다.
-            connection_alias (str): 사용할 Milvus 연결 별칭입니다.
+            connection_pool (MilvusConnectionPool): Milvus 연결 풀입니다. 연결은 처음 사용할 때 생성됩니다.
             dense_vector_dim (int): Dense 임베딩의 차원입니다.
             enable_nltk (bool): NLTK 사용 여부입니다.
+            index_mode (str): 인덱싱 모드입니다. "rebuild" 또는 "incremental"
+            embedding_cache (SQLiteEmbeddingCache | None): Dense 임베딩 디스크 캐시입니다. None이면 캐시를 사용하지 않습니다.
+            insert_concurrency (int): 동시에 실행할 삽입 배치 수입니다.
+            insert_max_batch_bytes (int): 삽입 배치 하나의 최대 예상 크기(바이트)입니다. gRPC 메시지 크기 제한보다 작아야 합니다.
+            insert_max_batch_rows (int): 삽입 배치 하나의 최대 행 수입니다.
+            pipeline_group_size (int): 인덱싱 파이프라인에서 한 번에 전처리/임베딩할 청크 수입니다.
+            pipeline_queue_size (int): 파이프라인 단계 사이 큐의 최대 그룹 수입니다.
+            embed_concurrency (int): 동시에 실행할 임베딩 그룹 수입니다.
+            preprocess_workers (int): NLTK 전처리에 사용할 프로세스 수입니다. 0이면 스레드에서 실행합니다.
         """
-        self.connection_alias = connection_alias
+        if index_mode not in self.INDEX_MODES:
+            raise ValueError(
+                f"Unsupported index_mode: {index_mode}. Use one of {self.INDEX_MODES}"
+            )
+        self.connection_pool = connection_pool
         logger.info(
-            f"connection_alias: {self.connection_alias} dense_vector_dim: {dense_vector_dim}, embedding_model: {embedding_model}, enable_nltk: {enable_nltk}"
+            f"connection_aliases: {connection_pool.aliases} dense_vector_dim: {dense_vector_dim}, embedding_model: {embedding_model}, enable_nltk: {enable_nltk}, index_mode: {index_mode}"
         )
         self.enable_nltk = enable_nltk
+        self.index_mode = index_mode
 
-        # 연결 설정
-        connections.connect(self.connection_alias, address="127.0.0.1:19530")
+        # 연결 풀의 별칭별 컬렉션 핸들 ({(alias, collection_name): Collection})
+        self._collection_handles: dict[tuple[str, str], Collection] = {}
 
         # 필드 이름 정의
         self.pk_field = "doc_id"
+        self.document_id_field = "document_id"  # 청크가 속한 원본 문서 ID
         self.text_original_field = "text_original"  # Dense embedding용 원본 텍스트
         self.text_processed_field = "text_processed"  # BM25용 전처리된 텍스트
         self.dense_vector_field = "dense_vector"
         self.sparse_vector_field = "sparse_vector"
 
         # Dense 임베딩 모델만 초기화 (sparse는 내장 BM25 Function 사용)
+        self.embedding_model = embedding_model
         self.dense_embedder = OpenAIEmbeddings(model=embedding_model)
         self.dense_vector_dim = dense_vector_dim
+        self.embedding_cache = embedding_cache
 
-        # 전처리 도구 초기화
-        if self.enable_nltk:
-            self.stemmer = PorterStemmer()
-            self.stop_words = set(stopwords.words("english"))
-        else:
-            self.stemmer = None
-            self.stop_words = set()
+        # 삽입 배치 설정
+        self.insert_concurrency = insert_concurrency
+        self.insert_max_batch_bytes = insert_max_batch_bytes
+        self.insert_max_batch_rows = insert_max_batch_rows
 
-    def _preprocess_text_for_bm25(self, text: str) -> str:
-        """BM25 검색 성능 향상을 위한 텍스트 전처리를 수행합니다.
+        # 스트리밍 인덱싱 파이프라인 설정
+        self.pipeline_group_size = pipeline_group_size
+        self.pipeline_queue_size = pipeline_queue_size
+        self.embed_concurrency = embed_concurrency
 
-        전처리 단계:
-        1. 소문자 변환
-        2. 특수문자 및 숫자 제거 (선택적 보존)
-        3. 토큰화
-        4. 불용어 제거 (옵션)
-        5. 어간 추출 (Stemming)
+        # 전처리 도구 초기화 (검색 시에도 같은 전처리기를 사용)
+        self.bm25_preprocessor = BM25TextPreprocessor(
+            enable_nltk=enable_nltk, num_workers=preprocess_workers
+        )
 
-        Args:
-            text (str): 전처리할 원본 텍스트
+    def close(self):
+        """BM25 전처리 프로세스 풀과 임베딩 캐시 연결을 닫습니다."""
+        self.bm25_preprocessor.close()
+        if self.embedding_cache is not None:
+            self.embedding_cache.close()
 
-        Returns:
-            str: 전처리된 텍스트
-        """
-        if not text or not text.strip():
-            return ""
+    def _preprocess_text_for_bm25(self, text: str) -> str:
+        """BM25 검색 성능 향상을 위한 텍스트 전처리를 수행합니다."""
+        return self.bm25_preprocessor.preprocess(text)
 
-        # 1. 소문자 변환
-        text = text.lower()
+    async def _aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        """텍스트 목록의 dense 임베딩을 생성합니다.
 
-        # 2. 기본 정리: 연속된 공백, 탭, 개행문자 정규화
-        text = re.sub(r"\s+", " ", text).strip()
+        임베딩 캐시가 설정되어 있으면 캐시에 없는 텍스트만 임베딩 API로 요청하고, 결과를 캐시에 저장합니다.
+        """
+        if not texts:
+            return []
+        if self.embedding_cache is None:
+            return await self.dense_embedder.aembed_documents(texts)
 
-        if not self.enable_nltk:
-            return text
+        cached_vectors = await self.embedding_cache.aget_many(
+            self.embedding_model, texts
+        )
+        # 같은 텍스트는 한 번만 요청
+        missing_texts = list(
+            dict.fromkeys(
+                text
+                for text, vector in zip(texts, cached_vectors, strict=True)
+                if vector is None
+            )
+        )
+        logger.info(
+            f"임베딩 캐시: 요청 {len(texts)}개, 적중 {len(texts) - sum(v is None for v in cached_vectors)}개, "
+            f"API 요청 {len(missing_texts)}개 (누적 {self.embedding_cache.stats()})"
+        )
+        if not missing_texts:
+            return cached_vectors
 
-        try:
-            # 3. 토큰화
-            tokens = word_tokenize(text)
+        new_vectors = await self.dense_embedder.aembed_documents(missing_texts)
+        await self.embedding_cache.aput_many(
+            self.embedding_model, missing_texts, new_vectors
+        )
+        new_vector_map = dict(zip(missing_texts, new_vectors, strict=True))
+        return [
+            vector if vector is not None else new_vector_map[text]
+            for text, vector in zip(texts, cached_vectors, strict=True)
+        ]
 
-            # 4. 필터링 및 전처리
-            processed_tokens = []
-            for token in tokens:
-                # 최소 길이 체크 (1글자 단어 제외, 단 'i', 'a' 같은 중요한 단어는 보존)
-                if len(token) < 2 and token.lower() not in {"i", "a"}:
-                    continue
+    def _make_chunk_id(self, document_id: str, doc: LangchainDocument) -> str:
+        """청크의 내용 기반 primary key를 생성합니다.
 
-                # 숫자만으로 구성된 토큰 제외
-                if token.isdigit():
-                    continue
+        (document_id, 본문, 메타데이터)가 같으면 항상 같은 키가 생성되므로
+        재인덱싱 시 이미 저장된 청크를 식별하는 데 사용합니다.
+        """
+        payload = json.dumps(
+            [document_id, doc.page_content, doc.metadata],
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
-                # 특수문자만으로 구성된 토큰 제외
-                if not re.search(r"[a-zA-Z]", token):
-                    continue
+    def _build_schema(self) -> CollectionSchema:
+        """하이브리드 검색을 위한 컬렉션 스키마를 생성합니다."""
+        # TODO: 컬렉션 생성 시 파라미터 config에서 관리하도록 변경 필요
+        pk_field = FieldSchema(
+            name=self.pk_field,
+            dtype=DataType.VARCHAR,
+            is_primary=True,
+            max_length=64,
+            auto_id=False,
+        )
 
-                # 불용어 제거
-                if self.enable_nltk and token.lower() in self.stop_words:
-                    continue
+        # 원본 문서 ID 필드 (문서 단위 diff/삭제 및 세션 검색 범위 제한용)
+        # NOTE: partition key로 지정하여 사용자 단위 공유 컬렉션에서 document_id 필터 검색 시 파티션 프루닝이 적용됨
+        document_id_field = FieldSchema(
+            name=self.document_id_field,
+            dtype=DataType.VARCHAR,
+            max_length=64,
+            is_partition_key=True,
+            description="청크가 속한 원본 문서 ID",
+        )
 
-                # 어간 추출
-                stemmed_token = self.stemmer.stem(token)
-                processed_tokens.append(stemmed_token)
+        # 원본 텍스트 필드 (Dense embedding용)
+        text_original_field = FieldSchema(
+            name=self.text_original_field,
+            dtype=DataType.VARCHAR,
+            max_length=65535,
+            description="원본 텍스트 (Dense embedding 생성용)",
+        )
 
-            # 5. 결과 반환
-            processed_text = " ".join(processed_tokens)
-            return processed_text if processed_text else text.lower()  # fallback
+        # 전처리된 텍스트 필드 (BM25 Function용)
+        text_processed_field = FieldSchema(
+            name=self.text_processed_field,
+            dtype=DataType.VARCHAR,
+            max_length=65535,
+            enable_analyzer=True,  # BM25 Function을 위해 analyzer 활성화
+            description="전처리된 텍스트 (BM25 Sparse embedding 생성용)",
+        )
 
-        except Exception as e:
-            logger.warning(
-                f"텍스트 전처리 중 오류 발생: {e}. 기본 전처리를 사용합니다."
-            )
-            # fallback: 기본 전처리
-            text = re.sub(r"[^\w\s]", " ", text)
-            text = re.sub(r"\s+", " ", text).strip()
-            return text
+        dense_field = FieldSchema(
+            name=self.dense_vector_field,
+            dtype=DataType.FLOAT_VECTOR,
+            dim=self.dense_vector_dim,
+        )
+        sparse_field = FieldSchema(
+            name=self.sparse_vector_field,
+            dtype=DataType.SPARSE_FLOAT_VECTOR,
+            description="BM25 Function으로 자동 생성되는 sparse embedding",
+        )
 
-    def _create_collection(self, collection_name: str):
-        """하이브리드 검색을 위한 새로운 컬렉션을 생성합니다. 기존 컬렉션이 있다면 삭제합니다."""
-        if utility.has_collection(collection_name, using=self.connection_alias):
-            logger.info(f"기존 컬렉션을 삭제합니다: {collection_name}")
-            utility.drop_collection(collection_name, using=self.connection_alias)
+        schema = CollectionSchema(
+            fields=[
+                pk_field,
+                document_id_field,
+                text_original_field,
+                text_processed_field,
+                dense_field,
+                sparse_field,
+            ],
+            enable_dynamic_field=True,
+        )
 
-        logger.info(f"새로운 컬렉션을 생성합니다: {collection_name}")
-        # TODO: 컬렉션 생성 시 파라미터 config에서 관리하도록 변경 필요
-        try:
-            pk_field = FieldSchema(
-                name=self.pk_field,
-                dtype=DataType.VARCHAR,
-                is_primary=True,
-                max_length=64,
-                auto_id=False,
-            )
+        # BM25 Function 추가 - 전처리된 텍스트를 input으로 사용
+        bm25_function = Function(
+            name="text_bm25_emb",
+            input_field_names=[self.text_processed_field],  # 전처리된 텍스트 사용
+            output_field_names=[self.sparse_vector_field],
+            function_type=FunctionType.BM25,
+        )
+        schema.add_function(bm25_function)
+        return schema
 
-            # 원본 텍스트 필드 (Dense embedding용)
-            text_original_field = FieldSchema(
-                name=self.text_original_field,
-                dtype=DataType.VARCHAR,
-                max_length=65535,
-                description="원본 텍스트 (Dense embedding 생성용)",
-            )
+    def _get_collection_handle(self, collection_name: str) -> Collection:
+        """연결 풀에서 별칭을 받아 해당 연결에 바인딩된 컬렉션 핸들을 반환합니다.
 
-            # 전처리된 텍스트 필드 (BM25 Function용)
-            text_processed_field = FieldSchema(
-                name=self.text_processed_field,
-                dtype=DataType.VARCHAR,
-                max_length=65535,
-                enable_analyzer=True,  # BM25 Function을 위해 analyzer 활성화
-                description="전처리된 텍스트 (BM25 Sparse embedding 생성용)",
-            )
+        삽입 배치마다 호출하여 동시에 실행되는 배치가 여러 gRPC 채널로 나누어 전송되도록 합니다.
+        """
+        alias = self.connection_pool.acquire()
+        key = (alias, collection_name)
+        collection = self._collection_handles.get(key)
+        if collection is None:
+            collection = Collection(name=collection_name, using=alias)
+            self._collection_handles[key] = collection
+        return collection
+
+    def _forget_collection_handles(self, collection_name: str):
+        """삭제된 컬렉션의 핸들을 제거합니다."""
+        for key in [
+            key for key in self._collection_handles if key[1] == collection_name
+        ]:
+            self._collection_handles.pop(key, None)
+
+    def _mark_indexed(self, collection: Collection):
+        """컬렉션의 인덱싱 버전을 갱신하여 다른 프로세스의 검색 결과 캐시가 무효화되도록 합니다."""
+        try:
+            collection.set_properties({INDEX_VERSION_PROPERTY: str(time.time_ns())})
+        except Exception as e:
+            # 버전을 갱신하지 못해도 검색 결과 캐시는 TTL이 지나면 갱신됨
+            logger.warning(f"컬렉션 인덱싱 버전 갱신 실패 ({collection.name}): {e}")
 
-            dense_field = FieldSchema(
-                name=self.dense_vector_field,
-                dtype=DataType.FLOAT_VECTOR,
-                dim=self.dense_vector_dim,
-            )
-            sparse_field = FieldSchema(
-                name=self.sparse_vector_field,
-                dtype=DataType.SPARSE_FLOAT_VECTOR,
-                description="BM25 Function으로 자동 생성되는 sparse embedding",
-            )
+    def _make_writer(self, collection_name: str, method: str):
+        """배치마다 연결 풀의 다른 채널로 insert/upsert를 수행하는 함수를 만듭니다."""
 
-            schema = CollectionSchema(
-                fields=[
-                    pk_field,
-                    text_original_field,
-                    text_processed_field,
-                    dense_field,
-                    sparse_field,
-                ],
-                enable_dynamic_field=True,
-            )
+        def _write(rows: list[dict[str, Any]]):
+            collection = self._get_collection_handle(collection_name)
+            return getattr(collection, method)(rows)
 
-            # BM25 Function 추가 - 전처리된 텍스트를 input으로 사용
-            bm25_function = Function(
-                name="text_bm25_emb",
-                input_field_names=[self.text_processed_field],  # 전처리된 텍스트 사용
-                output_field_names=[self.sparse_vector_field],
-                function_type=FunctionType.BM25,
-            )
-            schema.add_function(bm25_function)
+        return _write
 
+    def _create_new_collection(self, collection_name: str) -> Collection:
+        """스키마와 인덱스를 포함한 새로운 컬렉션을 생성합니다."""
+        logger.info(f"새로운 컬렉션을 생성합니다: {collection_name}")
+        try:
             collection = Collection(
-                name=collection_name, schema=schema, using=self.connection_alias
+                name=collection_name,
+                schema=self._build_schema(),
+                using=self.connection_pool.acquire(),
             )
 
             # Dense vector 인덱스 생성 (OpenAI embedding에 최적화: 정규화된 벡터이므로 IP 사용)
@@ -245,124 +321,431 @@ class MilvusIndexer:
             logger.error(f"컬렉션 '{collection_name}' 생성에 실패했습니다: {e}")
             raise
 
-    async def aindex_documents(self, documents: list[dict[str, Any]]):
-        """문서 리스트를 받아 Milvus에 하이브리드 검색을 위해 인덱싱합니다.
+    def _create_collection(self, collection_name: str) -> Collection:
+        """하이브리드 검색을 위한 새로운 컬렉션을 생성합니다. 기존 컬렉션이 있다면 삭제합니다."""
+        using = self.connection_pool.acquire()
+        if utility.has_collection(collection_name, using=using):
+            logger.info(f"기존 컬렉션을 삭제합니다: {collection_name}")
+            utility.drop_collection(collection_name, using=using)
+            self._forget_collection_handles(collection_name)
 
-        이 메서드는 기존 컬렉션을 삭제하고 모든 문서를 새로 인덱싱합니다.
-        원본 텍스트는 dense embedding용으로, 전처리된 텍스트는 BM25 Function의 sparse embedding용으로 사용됩니다.
-        """
-        collection_name = documents[0]["collection_name"]
-        logger.info(f"collection_name: {collection_name}")
+        return self._create_new_collection(collection_name)
+
+    def _get_or_create_collection(self, collection_name: str) -> Collection:
+        """기존 컬렉션을 로드하여 반환합니다. 컬렉션이 없다면 새로 생성합니다.
 
+        incremental 모드에서 저장된 청크를 조회(query)하기 위해 컬렉션을 로드합니다.
+        """
+        using = self.connection_pool.acquire()
+        if utility.has_collection(collection_name, using=using):
+            collection = Collection(name=collection_name, using=using)
+        else:
+            collection = self._create_new_collection(collection_name)
+        collection.load()
+        return collection
+
+    def _fetch_existing_chunk_ids(
+        self, collection: Collection, document_ids: list[str]
+    ) -> set[str]:
+        """주어진 문서들에 대해 컬렉션에 이미 저장된 청크의 primary key를 조회합니다."""
+        existing_chunk_ids: set[str] = set()
+        expr = f"{self.document_id_field} in {json.dumps(document_ids)}"
+        iterator = collection.query_iterator(
+            batch_size=1000, expr=expr, output_fields=[self.pk_field]
+        )
+        try:
+            while True:
+                rows = iterator.next()
+                if not rows:
+                    break
+                existing_chunk_ids.update(row[self.pk_field] for row in rows)
+        finally:
+            iterator.close()
+        return existing_chunk_ids
+
+    def _delete_by_expr(self, collection: Collection, field: str, values: list[str]):
+        """필드 값 목록에 해당하는 엔티티를 삭제합니다. expr 길이 제한을 피하기 위해 나누어 삭제합니다."""
+        delete_batch_size = 1000
+        for i in range(0, len(values), delete_batch_size):
+            batch = values[i : i + delete_batch_size]
+            collection.delete(expr=f"{field} in {json.dumps(batch)}")
+
+    def _collect_chunks(
+        self,
+        documents: list[dict[str, Any]],
+        precomputed_embeddings: dict[str, bytes] | None = None,
+    ) -> dict[str, tuple[str, LangchainDocument]]:
+        """Mongo 문서 목록에서 청크를 추출하여 {chunk_id: (document_id, 청크)} 형태로 반환합니다.
+
+        내용이 같은 청크는 같은 primary key를 가지므로 한 번만 포함됩니다.
+        precomputed_embeddings가 주어지면, 파싱 단계(semantic 청킹)에서 같은 임베딩 모델로 계산하여
+        문서와 함께 저장한 청크 임베딩을 {chunk_id: float32 바이트} 형태로 채웁니다.
+        """
+        chunks: dict[str, tuple[str, LangchainDocument]] = {}
+        for doc in documents:
+            if not isinstance(doc["content"], list):
+                continue
+            document_id = doc["document_id"]
+            stored_vectors = None
+            embeddings = doc.get("embeddings")
+            if (
+                precomputed_embeddings is not None
+                and embeddings
+                and embeddings.get("model") == self.embedding_model
+                and len(embeddings.get("vectors") or []) == len(doc["content"])
+            ):
+                stored_vectors = embeddings["vectors"]
+            for i, content_doc in enumerate(doc["content"]):
+                langchain_doc = LangchainDocument(
+                    page_content=content_doc["page_content"],
+                    metadata=content_doc["metadata"],
+                )
+                chunk_id = self._make_chunk_id(document_id, langchain_doc)
+                chunks[chunk_id] = (document_id, langchain_doc)
+                if stored_vectors is not None:
+                    precomputed_embeddings[chunk_id] = stored_vectors[i]
+        return chunks
+
+    def _estimate_row_bytes(self, row: dict[str, Any]) -> int:
+        """삽입할 행의 대략적인 전송 크기(바이트)를 계산합니다."""
+        size = 0
+        for value in row.values():
+            if isinstance(value, str):
+                size += len(value.encode("utf-8"))
+            elif isinstance(value, list):
+                size += 4 * len(value)  # FLOAT_VECTOR는 float32
+            else:
+                size += 8
+        return size
+
+    def _make_insert_batches(
+        self, rows: list[dict[str, Any]]
+    ) -> list[list[dict[str, Any]]]:
+        """행 목록을 최대 바이트 크기와 최대 행 수를 넘지 않는 배치로 나눕니다."""
+        batches = []
+        batch = []
+        batch_bytes = 0
+        for row in rows:
+            row_bytes = self._estimate_row_bytes(row)
+            if batch and (
+                batch_bytes + row_bytes > self.insert_max_batch_bytes
+                or len(batch) >= self.insert_max_batch_rows
+            ):
+                batches.append(batch)
+                batch = []
+                batch_bytes = 0
+            batch.append(row)
+            batch_bytes += row_bytes
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _write_batch_sync(
+        self, write, batch: list[dict[str, Any]]
+    ) -> tuple[int, list[dict[str, str]]]:
+        """배치를 삽입합니다. 실패하면 배치를 반으로 나누어 재시도하여 문제가 있는 행만 건너뜁니다."""
         try:
-            langchain_docs = []
-            for doc in documents:
-                if isinstance(doc["content"], list):
-                    for content_doc in doc["content"]:
-                        page_content = content_doc["page_content"]
-                        metadata = content_doc["metadata"]
-                        langchain_docs.append(
-                            LangchainDocument(
-                                page_content=page_content,
-                                metadata=metadata,
-                            )
-                        )
+            write(batch)
+            return len(batch), []
         except Exception as e:
-            logger.error(f"문서 인덱싱 중 오류가 발생했습니다: {e}")
-            raise e
+            if len(batch) == 1:
+                doc_id = batch[0].get(self.pk_field, "unknown")
+                logger.warning(f"문서 {doc_id} 삽입 실패 (건너뜀): {e}")
+                return 0, [{"doc_id": doc_id, "error": str(e)}]
 
-        if not langchain_docs:
-            logger.warning("인덱싱할 내용이 있는 문서가 없습니다.")
-            return
+            logger.warning(
+                f"배치 삽입 실패 ({len(batch)}개 문서), 배치를 나누어 재시도: {e}"
+            )
+            middle = len(batch) // 2
+            left_count, left_failed = self._write_batch_sync(write, batch[:middle])
+            right_count, right_failed = self._write_batch_sync(write, batch[middle:])
+            return left_count + right_count, left_failed + right_failed
 
-        # 1. 컬렉션 재생성
+    async def _awrite_rows(
+        self,
+        write,
+        rows: list[dict[str, Any]],
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> tuple[int, list[dict[str, str]]]:
+        """행 목록을 바이트 크기 기준 배치로 나누어 insert_concurrency개까지 동시에 삽입합니다.
+
+        Args:
+            write: collection.insert 또는 collection.upsert
+            rows (list[dict[str, Any]]): 삽입할 행 목록
+            semaphore (asyncio.Semaphore | None): 여러 호출이 동시 삽입 수 제한을 공유할 때 사용할 세마포어
+
+        Returns:
+            tuple[int, list[dict[str, str]]]: 성공한 행 수와 실패한 행 정보 목록
+        """
         loop = asyncio.get_running_loop()
-        collection = await loop.run_in_executor(
-            None, self._create_collection, collection_name
-        )
+        batches = self._make_insert_batches(rows)
+        semaphore = semaphore or asyncio.Semaphore(self.insert_concurrency)
 
-        # 2. 원본 텍스트와 전처리된 텍스트 준비
-        original_corpus = [doc.page_content for doc in langchain_docs]
-        processed_corpus = [
-            self._preprocess_text_for_bm25(doc.page_content) for doc in langchain_docs
-        ]
+        async def _write(batch_index: int, batch: list[dict[str, Any]]):
+            async with semaphore:
+                inserted, failed = await loop.run_in_executor(
+                    None, self._write_batch_sync, write, batch
+                )
+            logger.info(
+                f"배치 {batch_index + 1}/{len(batches)} 처리 완료: {inserted}개 성공"
+            )
+            return inserted, failed
 
-        logger.info("전처리 예시:")
-        if original_corpus:
-            logger.info(f"원본: {original_corpus[0][:100]}...")
-            logger.info(f"전처리: {processed_corpus[0][:100]}...")
+        results = await asyncio.gather(
+            *(_write(i, batch) for i, batch in enumerate(batches))
+        )
+        total_inserted = sum(inserted for inserted, _ in results)
+        failed_items = [item for _, failed in results for item in failed]
+        return total_inserted, failed_items
 
-        # 3. Dense 임베딩 생성 (원본 텍스트 기반)
-        dense_embeddings = await self.dense_embedder.aembed_documents(original_corpus)
+    async def _aprepare_rows(
+        self,
+        chunks: dict[str, tuple[str, LangchainDocument]],
+        chunk_ids: list[str],
+        precomputed_embeddings: dict[str, bytes] | None = None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """청크 그룹을 BM25 전처리하고 dense 임베딩하여 삽입할 행 목록을 만듭니다.
 
-        # 4. 삽입할 데이터 준비
-        data_to_insert = []
-        failed_documents = []
+        precomputed_embeddings에 벡터가 있는 청크는 임베딩 API를 호출하지 않고 저장된 벡터를 사용합니다.
 
-        for i, doc in enumerate(langchain_docs):
+        Returns:
+            tuple[list[dict[str, Any]], int]: 삽입할 행 목록과 데이터 준비에 실패한 청크 수
+        """
+        precomputed_embeddings = precomputed_embeddings or {}
+        original_corpus = [chunks[chunk_id][1].page_content for chunk_id in chunk_ids]
+        missing_indices = [
+            i
+            for i, chunk_id in enumerate(chunk_ids)
+            if chunk_id not in precomputed_embeddings
+        ]
+        # BM25 전처리(CPU, 이벤트 루프 밖)와 dense 임베딩(I/O)을 동시에 진행
+        processed_corpus, new_embeddings = await asyncio.gather(
+            self.bm25_preprocessor.apreprocess_many(original_corpus),
+            self._aembed_documents([original_corpus[i] for i in missing_indices]),
+        )
+        dense_embeddings: list[list[float] | None] = [
+            array("f", precomputed_embeddings[chunk_id]).tolist()
+            if chunk_id in precomputed_embeddings
+            else None
+            for chunk_id in chunk_ids
+        ]
+        for i, vector in zip(missing_indices, new_embeddings, strict=True):
+            dense_embeddings[i] = vector
+
+        rows = []
+        failed_count = 0
+        for i, chunk_id in enumerate(chunk_ids):
             try:
-                doc_id = str(i)
+                document_id, doc = chunks[chunk_id]
                 data = doc.metadata.copy()
-                data[self.pk_field] = doc_id
+                data[self.pk_field] = chunk_id
+                data[self.document_id_field] = document_id
                 data[self.text_original_field] = doc.page_content  # 원본 텍스트
                 data[self.text_processed_field] = processed_corpus[i]  # 전처리된 텍스트
                 data[self.dense_vector_field] = dense_embeddings[
                     i
                 ]  # 원본 기반 dense embedding
                 # sparse_vector_field는 BM25 Function이 text_processed_field로부터 자동 생성
-                data_to_insert.append(data)
+                rows.append(data)
             except Exception as e:
-                logger.warning(f"문서 {i} 데이터 준비 중 오류 발생 (건너뜀): {e}")
-                failed_documents.append({"index": i, "error": str(e)})
-                continue
+                logger.warning(
+                    f"문서 {chunk_id} 데이터 준비 중 오류 발생 (건너뜀): {e}"
+                )
+                failed_count += 1
+        return rows, failed_count
 
-        if not data_to_insert:
-            logger.error("삽입할 유효한 문서 데이터가 없습니다.")
-            return
+    async def _arun_index_pipeline(
+        self,
+        write,
+        chunks: dict[str, tuple[str, LangchainDocument]],
+        chunk_ids: list[str],
+        progress_callback: Callable[[int, int, int], None] | None = None,
+        precomputed_embeddings: dict[str, bytes] | None = None,
+    ) -> dict[str, int]:
+        """청크를 그룹 단위로 전처리/임베딩 단계와 삽입 단계에 흘려보내는 스트리밍 파이프라인을 실행합니다.
+
+        각 단계는 크기가 제한된 큐로 연결되어 있어 느린 단계가 앞 단계를 자동으로 멈추게 하고(backpressure),
+        메모리에 동시에 올라가는 벡터는 (큐 크기 + 작업자 수) * pipeline_group_size개로 제한됩니다.
+        한 단계에서 예외가 발생하면 나머지 작업을 취소하고 예외를 전파합니다.
 
-        # 5. 배치 단위로 데이터 삽입 (에러 발생시 개별 문서로 진행)
-        # TODO: 컬렉션 생성 시 파라미터 config에서 관리하도록 변경 필요
-        batch_size = 100  # 배치 크기
-        total_inserted = 0
-        total_failed = len(failed_documents)
+        Args:
+            write: 행 목록을 insert 또는 upsert하는 함수
+            chunks (dict[str, tuple[str, LangchainDocument]]): chunk_id별 (document_id, 청크) 매핑
+            chunk_ids (list[str]): 인덱싱할 chunk_id 목록
+            progress_callback (Callable[[int, int, int], None] | None): 삽입 그룹이 끝날 때마다 (성공, 실패, 전체) 청크 수로 호출됩니다.
+            precomputed_embeddings (dict[str, bytes] | None): 파싱 단계에서 저장한 chunk_id별 dense 임베딩 (float32 바이트)
 
-        def _insert_batch_sync(batch_data):
-            try:
-                collection.insert(batch_data)
-                return len(batch_data), []
-            except Exception as e:
-                logger.warning(f"배치 삽입 실패 ({len(batch_data)}개 문서): {e}")
-                # 배치 실패시 개별 문서로 재시도
-                successful_count = 0
-                failed_items = []
-
-                for item in batch_data:
-                    try:
-                        collection.insert([item])
-                        successful_count += 1
-                    except Exception as individual_error:
-                        failed_items.append(
-                            {
-                                "doc_id": item.get(self.pk_field, "unknown"),
-                                "error": str(individual_error),
-                            }
-                        )
-                        logger.warning(
-                            f"문서 {item.get(self.pk_field, 'unknown')} 삽입 실패 (건너뜀): {individual_error}"
-                        )
-
-                return successful_count, failed_items
-
-        # 배치별로 처리
-        for i in range(0, len(data_to_insert), batch_size):
-            batch = data_to_insert[i : i + batch_size]
-            batch_inserted, batch_failed = await loop.run_in_executor(
-                None, _insert_batch_sync, batch
+        Returns:
+            dict[str, int]: 삽입 성공(inserted), 실패(failed) 청크 수
+        """
+        group_queue: asyncio.Queue[list[str] | None] = asyncio.Queue(
+            maxsize=self.pipeline_queue_size
+        )
+        row_queue: asyncio.Queue[list[dict[str, Any]] | None] = asyncio.Queue(
+            maxsize=self.pipeline_queue_size
+        )
+        insert_semaphore = asyncio.Semaphore(self.insert_concurrency)
+        stats = {"inserted": 0, "failed": 0}
+        groups = [
+            chunk_ids[i : i + self.pipeline_group_size]
+            for i in range(0, len(chunk_ids), self.pipeline_group_size)
+        ]
+        logger.info(
+            f"인덱싱 파이프라인 시작: 청크 {len(chunk_ids)}개, 그룹 {len(groups)}개 "
+            f"(group_size={self.pipeline_group_size}, embed_concurrency={self.embed_concurrency}, "
+            f"insert_concurrency={self.insert_concurrency})"
+        )
+
+        async def _produce():
+            for group in groups:
+                await group_queue.put(group)
+            for _ in range(self.embed_concurrency):
+                await group_queue.put(None)
+
+        active_embed_workers = self.embed_concurrency
+
+        async def _embed_worker():
+            nonlocal active_embed_workers
+            while (group := await group_queue.get()) is not None:
+                rows, failed_count = await self._aprepare_rows(
+                    chunks, group, precomputed_embeddings
+                )
+                stats["failed"] += failed_count
+                if rows:
+                    await row_queue.put(rows)
+            # 마지막으로 끝난 임베딩 작업자가 삽입 작업자들에게 종료를 알림
+            active_embed_workers -= 1
+            if active_embed_workers == 0:
+                for _ in range(self.insert_concurrency):
+                    await row_queue.put(None)
+
+        async def _insert_worker():
+            while (rows := await row_queue.get()) is not None:
+                inserted, failed_items = await self._awrite_rows(
+                    write, rows, semaphore=insert_semaphore
+                )
+                stats["inserted"] += inserted
+                stats["failed"] += len(failed_items)
+                logger.info(
+                    f"인덱싱 진행: {stats['inserted'] + stats['failed']}/{len(chunk_ids)}"
+                )
+                if progress_callback is not None:
+                    progress_callback(
+                        stats["inserted"], stats["failed"], len(chunk_ids)
+                    )
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(_produce())
+                for _ in range(self.embed_concurrency):
+                    tg.create_task(_embed_worker())
+                for _ in range(self.insert_concurrency):
+                    tg.create_task(_insert_worker())
+        except ExceptionGroup as eg:
+            # 호출자가 원래 예외(임베딩 API 오류 등)를 그대로 처리할 수 있도록 첫 번째 예외를 전파
+            raise eg.exceptions[0] from eg
+        return stats
+
+    async def aindex_documents(
+        self,
+        documents: list[dict[str, Any]],
+        index_mode: str | None = None,
+        progress_callback: Callable[[int, int, int], None] | None = None,
+    ):
+        """문서 리스트를 받아 Milvus에 하이브리드 검색을 위해 인덱싱합니다.
+
+        rebuild 모드에서는 기존 컬렉션을 삭제하고 모든 문서를 새로 인덱싱합니다.
+        incremental 모드에서는 문서 단위로 저장된 청크와 비교하여 새로운 청크만 임베딩 후 upsert하고,
+        더 이상 존재하지 않는 청크는 삭제합니다. 변경이 없는 문서는 임베딩 API를 호출하지 않습니다.
+        원본 텍스트는 dense embedding용으로, 전처리된 텍스트는 BM25 Function의 sparse embedding용으로 사용됩니다.
+
+        Args:
+            documents (list[dict[str, Any]]): collection_name, document_id, content를 포함한 문서 목록
+            index_mode (str | None): 이번 호출에 사용할 인덱싱 모드. None이면 초기화 시 설정한 모드를 사용합니다.
+            progress_callback (Callable[[int, int, int], None] | None): 진행률 콜백. (성공, 실패, 전체) 청크 수로 호출됩니다.
+        """
+        index_mode = index_mode or self.index_mode
+        if index_mode not in self.INDEX_MODES:
+            raise ValueError(
+                f"Unsupported index_mode: {index_mode}. Use one of {self.INDEX_MODES}"
+            )
+        collection_name = documents[0]["collection_name"]
+        logger.info(f"collection_name: {collection_name}, index_mode: {index_mode}")
+
+        # semantic 청킹 단계에서 계산하여 문서와 함께 저장한 청크 임베딩은 다시 요청하지 않음
+        precomputed_embeddings: dict[str, bytes] = {}
+        try:
+            chunks = self._collect_chunks(documents, precomputed_embeddings)
+        except Exception as e:
+            logger.error(f"문서 인덱싱 중 오류가 발생했습니다: {e}")
+            raise e
+
+        if not chunks:
+            logger.warning("인덱싱할 내용이 있는 문서가 없습니다.")
+            return
+        if precomputed_embeddings:
+            logger.info(
+                f"저장된 청크 임베딩 재사용: {len(precomputed_embeddings)}/{len(chunks)}개"
+            )
+
+        # 1. 컬렉션 준비 (rebuild: 재생성 / incremental: 재사용 후 diff)
+        loop = asyncio.get_running_loop()
+        if index_mode == "rebuild":
+            collection = await loop.run_in_executor(
+                None, self._create_collection, collection_name
+            )
+            chunk_ids_to_index = list(chunks)
+        else:
+            collection = await loop.run_in_executor(
+                None, self._get_or_create_collection, collection_name
+            )
+            document_ids = sorted({document_id for document_id, _ in chunks.values()})
+            existing_chunk_ids = await loop.run_in_executor(
+                None, self._fetch_existing_chunk_ids, collection, document_ids
+            )
+            stale_chunk_ids = sorted(existing_chunk_ids - chunks.keys())
+            chunk_ids_to_index = [
+                chunk_id for chunk_id in chunks if chunk_id not in existing_chunk_ids
+            ]
+            logger.info(
+                f"증분 인덱싱 diff: 문서 {len(document_ids)}개, 유지 {len(chunks) - len(chunk_ids_to_index)}개, "
+                f"추가 {len(chunk_ids_to_index)}개, 삭제 {len(stale_chunk_ids)}개"
             )
-            total_inserted += batch_inserted
-            total_failed += len(batch_failed)
+            if stale_chunk_ids:
+                await loop.run_in_executor(
+                    None,
+                    self._delete_by_expr,
+                    collection,
+                    self.pk_field,
+                    stale_chunk_ids,
+                )
+
+            if not chunk_ids_to_index:
+                if stale_chunk_ids:
+                    await loop.run_in_executor(None, collection.flush)
+                    await loop.run_in_executor(None, self._mark_indexed, collection)
+                logger.info("새로 인덱싱할 청크가 없습니다.")
+                if progress_callback is not None:
+                    progress_callback(0, 0, 0)
+                return
 
-            logger.info(f"배치 {i//batch_size + 1} 처리 완료: {batch_inserted}개 성공")
+        # 2. 전처리 → 임베딩 → 삽입 스트리밍 파이프라인
+        # NOTE: incremental 모드는 동시 인덱싱 요청과 충돌하지 않도록 upsert를 사용
+        # NOTE: 배치마다 연결 풀의 다른 채널을 사용하도록 컬렉션 핸들을 배치 단위로 선택
+        write = self._make_writer(
+            collection_name, "insert" if index_mode == "rebuild" else "upsert"
+        )
+        if progress_callback is not None:
+            progress_callback(0, 0, len(chunk_ids_to_index))
+        stats = await self._arun_index_pipeline(
+            write,
+            chunks,
+            chunk_ids_to_index,
+            progress_callback,
+            precomputed_embeddings,
+        )
+        if not stats["inserted"]:
+            logger.error("삽입에 성공한 문서 데이터가 없습니다.")
 
         # 최종 flush
         def _final_flush():
@@ -374,22 +757,25 @@ class MilvusIndexer:
                 raise
 
         await loop.run_in_executor(None, _final_flush)
+        await loop.run_in_executor(None, self._mark_indexed, collection)
 
         # 최종 결과 로깅
-        total_processed = len(langchain_docs)
+        total_processed = len(chunk_ids_to_index)
         logger.info("문서 인덱싱 완료:")
         logger.info(f"  - 총 문서 수: {total_processed}개")
-        logger.info(f"  - 성공: {total_inserted}개")
-        logger.info(f"  - 실패: {total_failed}개")
-        logger.info(f"  - 성공률: {(total_inserted/total_processed)*100:.1f}%")
+        logger.info(f"  - 성공: {stats['inserted']}개")
+        logger.info(f"  - 실패: {stats['failed']}개")
+        logger.info(f"  - 성공률: {(stats['inserted']/total_processed)*100:.1f}%")
         logger.info("하이브리드 검색 준비 완료: Dense(원본) + Sparse(전처리)")
 
     async def alist_collections(self) -> list[str]:
         """Milvus에 있는 모든 컬렉션의 이름을 반환합니다."""
         try:
             loop = asyncio.get_running_loop()
-            func = partial(utility.list_collections, using=self.connection_alias)
-            collections = await loop.run_in_executor(None, func)
+            collections = await loop.run_in_executor(
+                None,
+                lambda: utility.list_collections(using=self.connection_pool.acquire()),
+            )
             logger.info(f"사용 가능한 컬렉션: {collections}")
             return collections
         except Exception as e:
@@ -400,8 +786,10 @@ class MilvusIndexer:
         """지정된 이름의 컬렉션을 삭제합니다."""
 
         def _delete_sync():
-            if utility.has_collection(collection_name, using=self.connection_alias):
-                utility.drop_collection(collection_name, using=self.connection_alias)
+            using = self.connection_pool.acquire()
+            if utility.has_collection(collection_name, using=using):
+                utility.drop_collection(collection_name, using=using)
+                self._forget_collection_handles(collection_name)
                 logger.info(
                     f"컬렉션 '{collection_name}'이(가) 성공적으로 삭제되었습니다."
                 )
@@ -417,17 +805,48 @@ class MilvusIndexer:
             logger.error(f"컬렉션 '{collection_name}' 삭제에 실패했습니다: {e}")
             raise
 
+    async def adelete_documents(self, collection_name: str, document_ids: list[str]):
+        """컬렉션에서 지정된 문서들에 속한 모든 청크를 삭제합니다."""
+
+        def _delete_documents_sync():
+            using = self.connection_pool.acquire()
+            if not utility.has_collection(collection_name, using=using):
+                logger.warning(
+                    f"청크를 삭제할 컬렉션 '{collection_name}'을(를) 찾을 수 없습니다."
+                )
+                return
+            collection = Collection(name=collection_name, using=using)
+            self._delete_by_expr(collection, self.document_id_field, document_ids)
+            collection.flush()
+            self._mark_indexed(collection)
+            logger.info(
+                f"컬렉션 '{collection_name}'에서 문서 {len(document_ids)}개의 청크를 삭제했습니다."
+            )
+
+        if not document_ids:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, _delete_documents_sync)
+        except Exception as e:
+            logger.error(
+                f"컬렉션 '{collection_name}'의 문서 청크 삭제에 실패했습니다: {e}"
+            )
+            raise
+
     async def aclear_all_collections(self):
         """Milvus의 모든 컬렉션을 삭제합니다."""
 
         def _clear_sync():
-            collections = utility.list_collections(using=self.connection_alias)
+            using = self.connection_pool.acquire()
+            collections = utility.list_collections(using=using)
             if not collections:
                 logger.info("삭제할 컬렉션이 없습니다.")
                 return
 
             for collection_name in collections:
-                utility.drop_collection(collection_name, using=self.connection_alias)
+                utility.drop_collection(collection_name, using=using)
+            self._collection_handles.clear()
             logger.info(
                 f"모든 컬렉션({len(collections)}개)이 성공적으로 삭제되었습니다."
             )
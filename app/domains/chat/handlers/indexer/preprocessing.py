@@ -0,0 +1,251 @@
+"""BM25 sparse 검색을 위한 텍스트 전처리 모듈입니다.
+
+인덱싱(MilvusIndexer)과 검색(MilvusRetriever)이 같은 전처리를 사용해야 BM25 점수가 일관되므로 공용 모듈로 분리합니다.
+NLTK 전처리는 CPU 작업이므로 대량 전처리는 프로세스 풀(또는 스레드)에서 실행하여 이벤트 루프를 막지 않도록 합니다.
+
+처리량 벤치마크:
+    python -m app.domains.chat.handlers.indexer.preprocessing --docs 5000 --workers 4
+"""
+
+import asyncio
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+
+import nltk
+from nltk.corpus import stopwords
+from nltk.stem import PorterStemmer
+from nltk.tokenize import word_tokenize
+
+from app.common.logger import logger
+
+# NLTK 데이터 다운로드 (처음 실행시에만)
+try:
+    nltk.data.find("tokenizers/punkt")
+    nltk.data.find("corpora/stopwords")
+except LookupError:
+    nltk.download("punkt", quiet=True)
+    nltk.download("stopwords", quiet=True)
+
+# 토큰마다 재컴파일하지 않도록 정규식을 미리 컴파일
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_ALPHA_PATTERN = re.compile(r"[a-zA-Z]")
+_NON_WORD_PATTERN = re.compile(r"[^\w\s]")
+
+_KEEP_SHORT_TOKENS = frozenset({"i", "a"})
+_PROCESS_BATCH_SIZE = 256  # 프로세스 풀 작업 하나에 보낼 텍스트 수
+
+
+@lru_cache(maxsize=1)
+def _get_stop_words() -> frozenset[str]:
+    return frozenset(stopwords.words("english"))
+
+
+@lru_cache(maxsize=1)
+def _get_stemmer() -> PorterStemmer:
+    return PorterStemmer()
+
+
+@lru_cache(maxsize=100_000)
+def _stem(token: str) -> str:
+    """어간 추출 결과를 메모이제이션합니다. 코퍼스의 토큰은 반복이 많아 대부분 캐시에서 반환됩니다."""
+    return _get_stemmer().stem(token)
+
+
+class BM25TextPreprocessor:
+    """BM25 검색 성능 향상을 위한 텍스트 전처리기입니다."""
+
+    def __init__(self, enable_nltk: bool = False, num_workers: int = 0):
+        """BM25TextPreprocessor를 초기화합니다.
+
+        Args:
+            enable_nltk (bool): NLTK 기반 토큰화/불용어 제거/어간 추출 사용 여부입니다.
+            num_workers (int): 대량 전처리(apreprocess_many)에 사용할 프로세스 수입니다. 0이면 스레드에서 실행합니다.
+        """
+        self.enable_nltk = enable_nltk
+        self.num_workers = num_workers
+        self.stop_words = _get_stop_words() if self.enable_nltk else frozenset()
+        self._executor: ProcessPoolExecutor | None = None
+
+    def preprocess(self, text: str) -> str:
+        """BM25 검색 성능 향상을 위한 텍스트 전처리를 수행합니다.
+
+        전처리 단계:
+        1. 소문자 변환
+        2. 특수문자 및 숫자 제거 (선택적 보존)
+        3. 토큰화
+        4. 불용어 제거 (옵션)
+        5. 어간 추출 (Stemming)
+
+        Args:
+            text (str): 전처리할 원본 텍스트
+
+        Returns:
+            str: 전처리된 텍스트
+        """
+        if not text or not text.strip():
+            return ""
+
+        # 1. 소문자 변환
+        text = text.lower()
+
+        # 2. 기본 정리: 연속된 공백, 탭, 개행문자 정규화
+        text = _WHITESPACE_PATTERN.sub(" ", text).strip()
+
+        if not self.enable_nltk:
+            return text
+
+        try:
+            # 3. 토큰화
+            tokens = word_tokenize(text)
+
+            # 4. 필터링 및 전처리 (text가 이미 소문자이므로 토큰도 소문자)
+            stop_words = self.stop_words
+            processed_tokens = [
+                _stem(token)  # 5. 어간 추출
+                for token in tokens
+                # 최소 길이 체크 (1글자 단어 제외, 단 'i', 'a' 같은 중요한 단어는 보존)
+                if (len(token) >= 2 or token in _KEEP_SHORT_TOKENS)
+                # 숫자만으로 구성된 토큰 제외
+                and not token.isdigit()
+                # 특수문자만으로 구성된 토큰 제외
+                and _ALPHA_PATTERN.search(token)
+                # 불용어 제거
+                and token not in stop_words
+            ]
+
+            processed_text = " ".join(processed_tokens)
+            return processed_text if processed_text else text  # fallback
+
+        except Exception as e:
+            logger.warning(
+                f"텍스트 전처리 중 오류 발생: {e}. 기본 전처리를 사용합니다."
+            )
+            # fallback: 기본 전처리
+            text = _NON_WORD_PATTERN.sub(" ", text)
+            text = _WHITESPACE_PATTERN.sub(" ", text).strip()
+            return text
+
+    def preprocess_many(self, texts: list[str]) -> list[str]:
+        """텍스트 목록을 현재 프로세스에서 순서대로 전처리합니다."""
+        return [self.preprocess(text) for text in texts]
+
+    async def apreprocess_many(self, texts: list[str]) -> list[str]:
+        """텍스트 목록을 이벤트 루프 밖에서 전처리합니다.
+
+        NLTK를 사용하고 num_workers가 1 이상이면 텍스트를 묶음 단위로 나누어 프로세스 풀에서 병렬 처리하고,
+        그 외에는 스레드에서 실행합니다. 결과 순서는 입력 순서와 같습니다.
+        """
+        if not self.enable_nltk or self.num_workers <= 0 or len(texts) < 2:
+            return await asyncio.to_thread(self.preprocess_many, texts)
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        batch_size = max(
+            1, min(_PROCESS_BATCH_SIZE, -(-len(texts) // self.num_workers))
+        )
+        batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+        try:
+            results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(executor, _preprocess_batch, batch, True)
+                    for batch in batches
+                )
+            )
+        except BrokenProcessPool as e:
+            # 작업자가 비정상 종료되면 풀을 다시 만들도록 버리고, 이번 요청은 스레드에서 전처리
+            logger.warning(
+                f"BM25 전처리 프로세스 풀 손상, 다음 요청에서 다시 생성: {e}"
+            )
+            self._discard_executor(executor)
+            return await asyncio.to_thread(self.preprocess_many, texts)
+        return [text for batch_result in results for text in batch_result]
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """프로세스 풀을 반환합니다. 처음 호출할 때 생성합니다.
+
+        서버 프로세스에는 이미 스레드(gRPC 채널, to_thread 작업자, 로거)가 있으므로, fork하면 자식 프로세스가
+        복사된 잠금에서 멈출 수 있어 spawn으로 작업자를 시작합니다.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.num_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(f"BM25 전처리 프로세스 풀 생성: workers={self.num_workers}")
+        return self._executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor):
+        """손상된 프로세스 풀을 버립니다. 다른 요청이 이미 새 풀을 만들었다면 그대로 둡니다."""
+        if self._executor is executor:
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def close(self):
+        """프로세스 풀을 종료합니다."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+
+_worker_preprocessors: dict[bool, BM25TextPreprocessor] = {}
+
+
+def _preprocess_batch(texts: list[str], enable_nltk: bool) -> list[str]:
+    """프로세스 풀 작업자에서 실행되는 함수입니다. 작업자마다 전처리기와 어간 캐시를 재사용합니다."""
+    preprocessor = _worker_preprocessors.get(enable_nltk)
+    if preprocessor is None:
+        preprocessor = BM25TextPreprocessor(enable_nltk=enable_nltk)
+        _worker_preprocessors[enable_nltk] = preprocessor
+    return preprocessor.preprocess_many(texts)
+
+
+if __name__ == "__main__":
+    import argparse
+    import random
+    import time
+
+    parser = argparse.ArgumentParser(description="BM25 전처리 처리량 벤치마크")
+    parser.add_argument("--docs", type=int, default=5000, help="전처리할 문서 수")
+    parser.add_argument("--words", type=int, default=200, help="문서당 단어 수")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="프로세스 수"
+    )
+    args = parser.parse_args()
+
+    random.seed(0)
+    vocabulary = [
+        "robot", "running", "alarms", "controllers", "configured", "the", "and",
+        "navigation", "errors", "scheduling", "mission", "charging", "stations",
+        "vehicles", "transport", "sensors", "battery", "12", "3.5", "--", "API",
+    ]  # fmt: skip
+    corpus = [
+        " ".join(random.choices(vocabulary, k=args.words)) for _ in range(args.docs)
+    ]
+    total_mb = sum(len(text) for text in corpus) / 1024 / 1024
+
+    def _report(name: str, elapsed: float):
+        print(
+            f"{name:<28} {elapsed:7.3f}s  {args.docs / elapsed:10.1f} docs/s  {total_mb / elapsed:7.2f} MB/s"
+        )
+
+    print(f"docs={args.docs}, words/doc={args.words}, size={total_mb:.2f}MB")
+    serial = BM25TextPreprocessor(enable_nltk=True)
+    start = time.perf_counter()
+    expected = serial.preprocess_many(corpus)
+    _report("serial (cold stem cache)", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    serial.preprocess_many(corpus)
+    _report("serial (warm stem cache)", time.perf_counter() - start)
+    print(f"stem cache: {_stem.cache_info()}")
+
+    pooled = BM25TextPreprocessor(enable_nltk=True, num_workers=args.workers)
+    start = time.perf_counter()
+    actual = asyncio.run(pooled.apreprocess_many(corpus))
+    _report(f"process pool (workers={args.workers})", time.perf_counter() - start)
+    pooled.close()
+    assert actual == expected, "프로세스 풀 결과가 순차 처리 결과와 다릅니다."
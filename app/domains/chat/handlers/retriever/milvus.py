@@ -0,0 +1,319 @@
+import asyncio
+import json
+import re
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from langchain_core.documents import Document as LangchainDocument
+from langchain_openai import OpenAIEmbeddings
+from pymilvus import (
+    AnnSearchRequest,
+    Collection,
+    RRFRanker,
+    WeightedRanker,
+)
+
+from app.common.cache import LRUCache
+from app.common.logger import logger
+from app.common.milvus_pool import MilvusConnectionPool
+from app.domains.chat.handlers.indexer.milvus import INDEX_VERSION_PROPERTY
+from app.domains.chat.handlers.indexer.preprocessing import BM25TextPreprocessor
+from app.domains.chat.handlers.retriever.query_embedder import BatchedQueryEmbedder
+
+
+@dataclass
+class SearchResult:
+    """하이브리드 검색 결과 문서와 융합 점수입니다."""
+
+    doc: LangchainDocument
+    score: float
+
+
+class MilvusRetriever:
+    """MilvusIndexer가 구축한 컬렉션에 대해 하이브리드 검색(Dense + BM25 Sparse)을 수행합니다.
+
+    Dense(IP)와 Sparse(BM25) ANN 요청을 한 번의 hybrid_search 호출로 보내고,
+    Milvus 서버에서 RRF 또는 가중치 기반으로 결과를 융합합니다.
+    에이전트가 한 턴 안에서 비슷한 질의를 반복하는 경우가 많으므로 컬렉션별 TTL/LRU 결과 캐시를 둡니다.
+    인덱서는 다른 프로세스에서 실행되므로, 컬렉션 ID와 인덱싱 버전(MilvusIndexer가 갱신)을
+    version_check_interval_seconds마다 조회하여 바뀌었으면 해당 컬렉션의 캐시를 비웁니다.
+    """
+
+    RANKER_TYPES = ("rrf", "weighted")
+
+    def __init__(
+        self,
+        connection_pool: MilvusConnectionPool,
+        embedding_model: str = "text-embedding-3-small",
+        top_k: int = 10,
+        ranker_type: str = "rrf",
+        rrf_k: int = 60,
+        dense_weight: float = 0.7,
+        search_params: dict[str, Any] | None = None,
+        enable_nltk: bool = False,
+        cache_max_size: int = 256,
+        cache_ttl_seconds: float | None = 300,
+        version_check_interval_seconds: float = 5,
+        query_batch_window_ms: float = 10,
+        query_batch_max_size: int = 64,
+        query_cache_max_size: int = 1024,
+    ):
+        """MilvusRetriever를 초기화합니다.
+
+        Args:
+            connection_pool (MilvusConnectionPool): Milvus 연결 풀입니다. 연결은 처음 검색할 때 생성됩니다.
+            embedding_model (str): 질의 dense 임베딩을 생성할 OpenAI 모델의 이름입니다. 인덱싱 모델과 같아야 합니다.
+            top_k (int): 기본 검색 결과 수입니다.
+            ranker_type (str): 결과 융합 방식입니다. "rrf" 또는 "weighted"
+            rrf_k (int): RRF ranker 파라미터입니다.
+            dense_weight (float): weighted ranker 사용 시 dense 결과 가중치입니다. sparse는 1 - dense_weight
+            search_params (dict[str, Any] | None): dense_params, sparse_params를 포함한 기본 검색 파라미터입니다.
+            enable_nltk (bool): BM25 질의 전처리의 NLTK 사용 여부입니다. 인덱싱 설정과 같아야 합니다.
+            cache_max_size (int): 컬렉션별 결과 캐시 최대 항목 수입니다.
+            cache_ttl_seconds (float | None): 결과 캐시 유효 시간(초)입니다.
+            version_check_interval_seconds (float): 컬렉션 인덱싱 버전을 다시 조회하기까지의 최소 간격(초)입니다.
+            query_batch_window_ms (float): 동시에 들어온 질의 임베딩을 모으는 대기 시간(ms)입니다.
+            query_batch_max_size (int): 한 번에 요청할 최대 질의 임베딩 수입니다.
+            query_cache_max_size (int): 질의 벡터 LRU 캐시 최대 항목 수입니다.
+        """
+        if ranker_type not in self.RANKER_TYPES:
+            raise ValueError(
+                f"Unsupported ranker_type: {ranker_type}. Use one of {self.RANKER_TYPES}"
+            )
+        self.connection_pool = connection_pool
+        self.top_k = top_k
+        self.ranker_type = ranker_type
+        self.rrf_k = rrf_k
+        self.dense_weight = dense_weight
+        self.search_params = search_params or {}
+        self.cache_max_size = cache_max_size
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.version_check_interval_seconds = version_check_interval_seconds
+        logger.info(
+            f"connection_aliases: {connection_pool.aliases}, embedding_model: {embedding_model}, top_k: {top_k}, ranker_type: {ranker_type}"
+        )
+
+        # 필드 이름 정의 (MilvusIndexer와 동일)
+        self.pk_field = "doc_id"
+        self.document_id_field = "document_id"
+        self.text_original_field = "text_original"
+        self.dense_vector_field = "dense_vector"
+        self.sparse_vector_field = "sparse_vector"
+        self.metadata_fields = ["type", "title", "url", "page_number", "summary"]
+
+        self.dense_embedder = OpenAIEmbeddings(model=embedding_model)
+        self.query_embedder = BatchedQueryEmbedder(
+            self.dense_embedder,
+            batch_window_ms=query_batch_window_ms,
+            max_batch_size=query_batch_max_size,
+            cache_max_size=query_cache_max_size,
+        )
+        self.bm25_preprocessor = BM25TextPreprocessor(enable_nltk=enable_nltk)
+
+        self._collections: dict[tuple[str, str], Collection] = {}
+        self._loaded_collections: set[str] = set()
+        self._result_caches: dict[str, LRUCache] = {}
+        self._collection_versions: dict[str, tuple[int, str | None]] = {}
+        self._version_checked_at: dict[str, float] = {}
+
+    def _get_collection(self, collection_name: str) -> Collection:
+        """연결 풀에서 받은 연결에 바인딩된 컬렉션 핸들을 반환합니다.
+
+        동시 검색이 여러 gRPC 채널로 나누어지도록 검색마다 별칭을 받고, 핸들과 로드 여부는 재사용합니다.
+        """
+        alias = self.connection_pool.acquire()
+        key = (alias, collection_name)
+        collection = self._collections.get(key)
+        if collection is None:
+            collection = Collection(name=collection_name, using=alias)
+            self._collections[key] = collection
+        if collection_name not in self._loaded_collections:
+            collection.load()
+            self._loaded_collections.add(collection_name)
+        return collection
+
+    def _get_result_cache(self, collection_name: str) -> LRUCache:
+        cache = self._result_caches.get(collection_name)
+        if cache is None:
+            cache = LRUCache(
+                max_size=self.cache_max_size, ttl_seconds=self.cache_ttl_seconds
+            )
+            self._result_caches[collection_name] = cache
+        return cache
+
+    def _get_collection_version(self, collection_name: str) -> tuple[int, str | None]:
+        """컬렉션 ID(재생성 시 변경)와 인덱싱 버전을 조회합니다."""
+        description = self._get_collection(collection_name).describe()
+        return (
+            description["collection_id"],
+            description.get("properties", {}).get(INDEX_VERSION_PROPERTY),
+        )
+
+    async def _arefresh_cache(self, collection_name: str) -> None:
+        """컬렉션이 다시 인덱싱되었으면 결과 캐시를 비웁니다.
+
+        캐시 적중 시에도 Milvus 왕복이 생기지 않도록 version_check_interval_seconds 안에는 다시 조회하지 않습니다.
+        """
+        checked_at = self._version_checked_at.get(collection_name)
+        now = time.monotonic()
+        if (
+            checked_at is not None
+            and now - checked_at < self.version_check_interval_seconds
+        ):
+            return
+        self._version_checked_at[collection_name] = now
+        version = await asyncio.to_thread(self._get_collection_version, collection_name)
+        cached_version = self._collection_versions.get(collection_name)
+        if cached_version is not None and cached_version != version:
+            logger.info(
+                f"컬렉션이 다시 인덱싱되어 검색 결과 캐시를 비웁니다: {collection_name}"
+            )
+            self.invalidate_cache(collection_name)
+        self._collection_versions[collection_name] = version
+
+    def invalidate_cache(self, collection_name: str | None = None) -> None:
+        """결과 캐시를 비웁니다. collection_name이 없으면 모든 컬렉션의 캐시를 비웁니다."""
+        if collection_name is None:
+            self._result_caches.clear()
+            self._collections.clear()
+            self._loaded_collections.clear()
+            self._collection_versions.clear()
+            self._version_checked_at.clear()
+        else:
+            self._result_caches.pop(collection_name, None)
+            self._loaded_collections.discard(collection_name)
+            self._collection_versions.pop(collection_name, None)
+            self._version_checked_at.pop(collection_name, None)
+            for key in [key for key in self._collections if key[1] == collection_name]:
+                self._collections.pop(key, None)
+
+    def build_document_filter(self, document_ids: list[str]) -> str:
+        """세션에서 선택한 문서로 검색 범위를 제한하는 필터 표현식을 생성합니다."""
+        return f"{self.document_id_field} in {json.dumps(document_ids)}"
+
+    def _make_ranker(self):
+        if self.ranker_type == "weighted":
+            return WeightedRanker(self.dense_weight, 1 - self.dense_weight)
+        return RRFRanker(self.rrf_k)
+
+    def _search_sync(
+        self,
+        collection_name: str,
+        dense_vector: list[float],
+        processed_query: str,
+        top_k: int,
+        expr: str | None,
+        search_params: dict[str, Any],
+    ) -> list[SearchResult]:
+        """Dense/Sparse ANN 요청을 한 번의 hybrid_search로 실행합니다."""
+        collection = self._get_collection(collection_name)
+        dense_request = AnnSearchRequest(
+            data=[dense_vector],
+            anns_field=self.dense_vector_field,
+            param=search_params.get("dense_params", {}),
+            limit=top_k,
+            expr=expr,
+        )
+        # NOTE: BM25 Function 필드는 질의 텍스트를 그대로 전달하면 서버에서 sparse vector로 변환
+        sparse_request = AnnSearchRequest(
+            data=[processed_query],
+            anns_field=self.sparse_vector_field,
+            param=search_params.get("sparse_params", {}),
+            limit=top_k,
+            expr=expr,
+        )
+        search_results = collection.hybrid_search(
+            reqs=[dense_request, sparse_request],
+            rerank=self._make_ranker(),
+            limit=top_k,
+            output_fields=[
+                self.text_original_field,
+                self.document_id_field,
+                *self.metadata_fields,
+            ],
+        )
+
+        results = []
+        for hit in search_results[0]:
+            fields = hit.fields
+            metadata = {
+                "id": hit.id,
+                self.document_id_field: fields.get(self.document_id_field),
+            }
+            metadata.update({name: fields.get(name) for name in self.metadata_fields})
+            results.append(
+                SearchResult(
+                    doc=LangchainDocument(
+                        page_content=fields.get(self.text_original_field, ""),
+                        metadata=metadata,
+                    ),
+                    score=hit.distance,
+                )
+            )
+        return results
+
+    async def hybrid_search(
+        self,
+        query: str,
+        collection_name: str,
+        top_k: int | None = None,
+        expr: str | None = None,
+        document_ids: list[str] | None = None,
+        search_params: dict[str, Any] | None = None,
+    ) -> list[SearchResult]:
+        """질의에 대해 하이브리드 검색을 수행합니다.
+
+        Args:
+            query (str): 검색 질의
+            collection_name (str): 검색할 Milvus 컬렉션 이름
+            top_k (int | None): 반환할 결과 수. None이면 기본값을 사용합니다.
+            expr (str | None): 스칼라 필터 표현식
+            document_ids (list[str] | None): 검색 범위를 제한할 문서 ID 목록. expr과 AND로 결합됩니다.
+            search_params (dict[str, Any] | None): dense_params, sparse_params 검색 파라미터. None이면 기본값을 사용합니다.
+
+        Returns:
+            list[SearchResult]: 융합 점수 순으로 정렬된 검색 결과
+        """
+        top_k = top_k or self.top_k
+        search_params = search_params or self.search_params
+        filters = [f"({expr})"] if expr else []
+        if document_ids:
+            filters.append(f"({self.build_document_filter(sorted(document_ids))})")
+        combined_expr = " and ".join(filters) or None
+
+        # 공백만 다른 질의는 같은 결과를 사용. 캐시 키와 같도록 정규화한 질의로 임베딩/BM25 검색
+        # NOTE: 대소문자는 dense 임베딩 결과를 바꾸므로 정규화하지 않음
+        query = re.sub(r"\s+", " ", query).strip()
+        cache_key = (
+            query,
+            top_k,
+            combined_expr,
+            json.dumps(search_params, sort_keys=True),
+        )
+        await self._arefresh_cache(collection_name)
+        result_cache = self._get_result_cache(collection_name)
+        cached_results = result_cache.get(cache_key)
+        if cached_results is not None:
+            logger.info(
+                f"검색 결과 캐시 적중: {collection_name} (cache: {result_cache.stats()})"
+            )
+            return cached_results
+
+        dense_vector = await self.query_embedder.aembed_query(query)
+        # NOTE: NLTK 토큰화/형태소 처리는 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        processed_query = (
+            await asyncio.to_thread(self.bm25_preprocessor.preprocess, query) or query
+        )
+        results = await asyncio.to_thread(
+            self._search_sync,
+            collection_name,
+            dense_vector,
+            processed_query,
+            top_k,
+            combined_expr,
+            search_params,
+        )
+        result_cache.set(cache_key, results)
+        logger.info(f"하이브리드 검색 완료: {collection_name}, 결과 {len(results)}개")
+        return results
@@ -0,0 +1,90 @@
+import asyncio
+
+from langchain_core.embeddings import Embeddings
+
+from app.common.cache import LRUCache
+from app.common.logger import logger
+
+
+class BatchedQueryEmbedder:
+    """검색 질의 임베딩을 마이크로 배치로 묶어 요청하고 결과를 LRU 캐시에 보관합니다.
+
+    에이전트가 한 스텝에서 여러 검색 도구를 동시에 호출하면, batch_window_ms 동안 들어온 질의를
+    한 번의 aembed_documents 요청으로 묶습니다. 같은 질의가 동시에 들어오면 하나의 요청 결과를 공유하고,
+    이전에 임베딩한 질의는 API를 호출하지 않고 캐시에서 반환합니다.
+    """
+
+    def __init__(
+        self,
+        embedder: Embeddings,
+        batch_window_ms: float = 10,
+        max_batch_size: int = 64,
+        cache_max_size: int = 1024,
+    ):
+        """BatchedQueryEmbedder를 초기화합니다.
+
+        Args:
+            embedder (Embeddings): 실제 임베딩을 수행할 Langchain 임베딩 객체
+            batch_window_ms (float): 질의를 모으는 대기 시간(ms)
+            max_batch_size (int): 한 번에 요청할 최대 질의 수. 도달하면 대기 없이 바로 요청합니다.
+            cache_max_size (int): 질의 벡터 LRU 캐시의 최대 항목 수
+        """
+        self._embedder = embedder
+        self._batch_window = batch_window_ms / 1000
+        self._max_batch_size = max_batch_size
+        self._cache = LRUCache(max_size=cache_max_size)
+        self._pending: dict[str, asyncio.Future] = {}
+        self._flush_timer: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task] = set()
+        self.request_count = 0
+
+    async def aembed_query(self, query: str) -> list[float]:
+        """질의의 dense 임베딩을 반환합니다."""
+        cached_vector = self._cache.get(query)
+        if cached_vector is not None:
+            return cached_vector
+
+        future = self._pending.get(query)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[query] = future
+            if len(self._pending) >= self._max_batch_size:
+                # 배치가 가득 차면 대기하지 않고 바로 요청
+                self._start_flush()
+            elif self._flush_timer is None:
+                self._flush_timer = asyncio.get_running_loop().call_later(
+                    self._batch_window, self._start_flush
+                )
+        return await asyncio.shield(future)
+
+    def _start_flush(self) -> None:
+        """현재까지 모인 질의를 하나의 배치로 떼어내 임베딩 요청을 시작합니다."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        batch, self._pending = self._pending, {}
+        task = asyncio.ensure_future(self._flush(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, batch: dict[str, asyncio.Future]) -> None:
+        if not batch:
+            return
+        queries = list(batch)
+        self.request_count += 1
+        logger.debug(
+            f"질의 임베딩 배치 요청: {len(queries)}개 (누적 요청 {self.request_count}회, cache: {self._cache.stats()})"
+        )
+        try:
+            vectors = await self._embedder.aembed_documents(queries)
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for query, vector in zip(queries, vectors, strict=True):
+            self._cache.set(query, vector)
+            future = batch[query]
+            if not future.done():
+                future.set_result(vector)
@@ -8,6 +8,10 @@ from app.common.utils import get_kst_now
 
 class CreateSessionResponse(BaseModel):
     session_id: str = Field(..., description="세션 ID")
+    indexing_job_id: str | None = Field(
+        default=None,
+        description="선택한 문서의 백그라운드 인덱싱 작업 ID (문서를 선택하지 않으면 None)",
+    )
     updated_at: datetime = Field(
         default_factory=get_kst_now, description="세션 업데이트 시간"
     )
@@ -16,6 +20,7 @@ class CreateSessionResponse(BaseModel):
         json_schema_extra={
             "example": {
                 "session_id": uuid.uuid4().hex,
+                "indexing_job_id": uuid.uuid4().hex,
                 "updated_at": get_kst_now(),
             }
         }
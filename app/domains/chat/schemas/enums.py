@@ -17,3 +17,13 @@ class Role(str, Enum):
     TOOL = "tool"
     DOC_LINK = "doc_link"
     WEB_LINK = "web_link"
+
+
+class IndexingJobStatus(str, Enum):
+    """세션 문서 인덱싱 작업 상태."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
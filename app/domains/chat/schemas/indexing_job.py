@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from app.common.utils import get_kst_now
+from app.domains.chat.schemas.enums import IndexingJobStatus
+
+
+class IndexingJob(BaseModel):
+    """세션 생성 시 실행되는 백그라운드 문서 인덱싱 작업의 상태입니다."""
+
+    job_id: str = Field(..., description="인덱싱 작업 ID")
+    session_id: str = Field(..., description="작업을 생성한 채팅 세션 ID")
+    collection_name: str = Field(..., description="인덱싱 대상 Milvus 컬렉션 이름")
+    status: IndexingJobStatus = Field(
+        default=IndexingJobStatus.PENDING, description="작업 상태"
+    )
+    total_chunks: int | None = Field(
+        default=None, description="인덱싱할 청크 수 (diff 계산 전에는 None)"
+    )
+    processed_chunks: int = Field(default=0, description="삽입에 성공한 청크 수")
+    failed_chunks: int = Field(default=0, description="삽입에 실패한 청크 수")
+    error: str | None = Field(default=None, description="실패 시 오류 메시지")
+
+    created_at: datetime = Field(
+        default_factory=get_kst_now, description="작업 생성 시간"
+    )
+    started_at: datetime | None = Field(default=None, description="작업 시작 시간")
+    finished_at: datetime | None = Field(default=None, description="작업 종료 시간")
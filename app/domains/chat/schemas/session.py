@@ -15,6 +15,14 @@ class ChatSession(BaseModel):
         default_factory=list,
         description="문서 ID 목록",
     )
+    collection_name: str | None = Field(
+        default=None,
+        description="세션 검색에 사용하는 Milvus 컬렉션 이름 (documents로 검색 범위 제한)",
+    )
+    indexing_job_id: str | None = Field(
+        default=None,
+        description="세션 문서의 백그라운드 인덱싱 작업 ID",
+    )
 
     history: list[Message] = Field(
         default_factory=list,
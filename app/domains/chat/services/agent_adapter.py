@@ -1,6 +1,7 @@
 """Chat agent adapter for Kearney agent to implement IChatAgent interface."""
 
 import re
+from typing import Any
 
 from mcp import ClientSession
 
@@ -40,11 +41,12 @@ class AgentAdapter(IChatAgent):
         messages: list[Message],
         message_queue: MessageQueue,
         mcp_sessions: dict[str, ClientSession] | None = None,
+        tool_arguments: dict[str, Any] | None = None,
     ) -> None:
         """Run the agent with SSE messaging support."""
         if mcp_sessions and chat_request.tool_server_ids:
             selected_tools = await self._setup_mcp_tools(
-                mcp_sessions, chat_request.tool_server_ids
+                mcp_sessions, chat_request.tool_server_ids, tool_arguments
             )
             self._agent.available_tools.add_tools(*selected_tools)
             logger.info(
@@ -80,9 +82,17 @@ class AgentAdapter(IChatAgent):
                 self._agent.update_memory(agent_role, msg.content)
 
     async def _setup_mcp_tools(
-        self, mcp_sessions: dict[str, ClientSession], tool_server_ids: list[str]
+        self,
+        mcp_sessions: dict[str, ClientSession],
+        tool_server_ids: list[str],
+        tool_arguments: dict[str, Any] | None = None,
     ) -> list[MCPClientTool]:
-        """Setup MCP tools for the agent."""
+        """Setup MCP tools for the agent.
+
+        Tool parameters named in tool_arguments are bound to the given values and hidden from the model,
+        so the model cannot choose them (e.g. the Milvus collection and documents of the chat session).
+        """
+        tool_arguments = tool_arguments or {}
         selected_tools = []
         for server_id, session in mcp_sessions.items():
             if server_id in tool_server_ids:
@@ -92,14 +102,23 @@ class AgentAdapter(IChatAgent):
                         original_name = tool.name
                         tool_name = f"mcp_{server_id}_{original_name}"
                         tool_name = self._sanitize_tool_name(tool_name)
+                        properties = (tool.inputSchema or {}).get("properties", {})
+                        bound_arguments = {
+                            key: value
+                            for key, value in tool_arguments.items()
+                            if key in properties
+                        }
 
                         server_tool = MCPClientTool(
                             name=tool_name,
                             description=tool.description,
-                            parameters=tool.inputSchema,
+                            parameters=self._hide_parameters(
+                                tool.inputSchema, bound_arguments
+                            ),
                             session=session,
                             server_id=server_id,
                             original_name=original_name,
+                            bound_arguments=bound_arguments,
                         )
                         selected_tools.append(server_tool)
                 except Exception as e:
@@ -108,6 +127,25 @@ class AgentAdapter(IChatAgent):
                     )
         return selected_tools
 
+    @staticmethod
+    def _hide_parameters(
+        input_schema: dict[str, Any], names: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Remove the given parameters from a tool input schema."""
+        if not names:
+            return input_schema
+        return {
+            **input_schema,
+            "properties": {
+                key: value
+                for key, value in input_schema.get("properties", {}).items()
+                if key not in names
+            },
+            "required": [
+                key for key in input_schema.get("required", []) if key not in names
+            ],
+        }
+
     def _sanitize_tool_name(self, name: str) -> str:
         """Sanitize tool name to match MCPClientTool requirements."""
         sanitized = re.sub(r"[^a-zA-Z0-9_-]", "_", name)
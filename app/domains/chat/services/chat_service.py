@@ -13,6 +13,7 @@ from app.domains.chat.repositories.interface import IChatSessionRepository
 from app.domains.chat.schemas.chat_request import ChatRequest, CreateSessionRequest
 from app.domains.chat.schemas.chat_response import CreateSessionResponse
 from app.domains.chat.schemas.enums import Role
+from app.domains.chat.schemas.indexing_job import IndexingJob
 from app.domains.chat.schemas.message import (
     ErrorEvent,
     Message,
@@ -20,6 +21,7 @@ from app.domains.chat.schemas.message import (
     UserMessage,
 )
 from app.domains.chat.schemas.session import ChatSession
+from app.domains.chat.services.indexing_job_manager import IndexingJobManager
 from app.domains.chat.services.interface import IChatAgent
 from app.domains.document.repositories.interface import IDocumentRepository
 
@@ -30,22 +32,54 @@ class ChatService:
     사용자의 채팅 요청을 처리하고, 대화 기록과 이벤트(오류, 도구 호출 등)를 분리하여 관리합니다.
     """
 
+    COLLECTION_SCOPES = ("session", "user")
+
     def __init__(
         self,
         chat_agent: IChatAgent,
         chat_session_repository: IChatSessionRepository,
         milvus_indexer: MilvusIndexer,
         document_repository: IDocumentRepository,
+        indexing_job_manager: IndexingJobManager,
+        collection_scope: str = "session",
     ) -> None:
+        """ChatService를 초기화합니다.
+
+        Args:
+            chat_agent: 채팅 에이전트
+            chat_session_repository: 채팅 세션 저장소
+            milvus_indexer: Milvus 인덱서
+            document_repository: 문서 저장소
+            indexing_job_manager: 백그라운드 인덱싱 작업 관리자
+            collection_scope: Milvus 컬렉션 범위.
+                "session"은 세션마다 컬렉션을 새로 만들고,
+                "user"는 사용자별 공유 컬렉션에 증분 인덱싱 후 세션은 document_ids 필터로 검색 범위를 제한합니다.
+        """
+        if collection_scope not in self.COLLECTION_SCOPES:
+            raise ValueError(
+                f"Unsupported collection_scope: {collection_scope}. Use one of {self.COLLECTION_SCOPES}"
+            )
         self._chat_agent = chat_agent
         self._chat_session_repository = chat_session_repository
         self._milvus_indexer = milvus_indexer
         self._document_repository = document_repository
+        self._indexing_job_manager = indexing_job_manager
+        self._collection_scope = collection_scope
+
+    def _get_collection_name(self, user_id: str, session_id: str) -> str:
+        """컬렉션 범위 설정에 따라 세션이 사용할 Milvus 컬렉션 이름을 반환합니다."""
+        if self._collection_scope == "user":
+            return f"c_{user_id}"
+        return f"c_{user_id}_{session_id}"
 
     async def create_session(
         self, create_session_request: CreateSessionRequest
     ) -> CreateSessionResponse:
-        """세션을 생성합니다."""
+        """세션을 생성합니다.
+
+        선택한 문서의 인덱싱은 백그라운드 작업으로 등록하고 바로 반환합니다.
+        진행 상황은 반환된 indexing_job_id로 조회하거나 스트리밍할 수 있습니다.
+        """
         session_id = uuid.uuid4().hex
         user_id = create_session_request.user_id
         selected_document_ids = create_session_request.document_ids
@@ -54,19 +88,65 @@ class ChatService:
             await self._chat_session_repository.save(chat_session)
             return CreateSessionResponse(session_id=session_id)
 
-        documents = await self._document_repository.find_by_user_id(user_id)
+        # NOTE: 선택한 문서만 저장된 청크 임베딩과 함께 조회
+        documents = await self._document_repository.find_by_ids(
+            user_id, selected_document_ids
+        )
         if not documents:
             raise HTTPException(status_code=404, detail="Documents not found")
 
+        collection_name = self._get_collection_name(user_id, session_id)
         all_documents = []
         for doc in documents:
             doc_dict = doc.model_dump()
-            if doc_dict["document_id"] in selected_document_ids:
-                doc_dict["collection_name"] = f"c_{user_id}_{session_id}"
-                all_documents.append(doc_dict)
+            doc_dict["collection_name"] = collection_name
+            all_documents.append(doc_dict)
+
+        if not all_documents:
+            raise HTTPException(status_code=404, detail="Documents not found")
 
-        await self._milvus_indexer.aindex_documents(all_documents)
-        return CreateSessionResponse(session_id=session_id)
+        # NOTE: 사용자 공유 컬렉션은 다른 세션의 문서를 보존해야 하므로 항상 증분 인덱싱
+        index_mode = "incremental" if self._collection_scope == "user" else None
+        indexing_job = self._indexing_job_manager.submit(
+            lambda progress_callback: self._milvus_indexer.aindex_documents(
+                all_documents,
+                index_mode=index_mode,
+                progress_callback=progress_callback,
+            ),
+            session_id=session_id,
+            collection_name=collection_name,
+        )
+
+        chat_session = ChatSession(
+            chat_session_id=session_id,
+            user_id=user_id,
+            documents=[doc["document_id"] for doc in all_documents],
+            collection_name=collection_name,
+            indexing_job_id=indexing_job.job_id,
+        )
+        await self._chat_session_repository.save(chat_session)
+        return CreateSessionResponse(
+            session_id=session_id, indexing_job_id=indexing_job.job_id
+        )
+
+    def get_indexing_job(self, job_id: str) -> IndexingJob:
+        """인덱싱 작업 상태를 조회합니다."""
+        indexing_job = self._indexing_job_manager.get(job_id)
+        if indexing_job is None:
+            raise HTTPException(status_code=404, detail="Indexing job not found")
+        return indexing_job
+
+    async def cancel_indexing_job(self, job_id: str) -> IndexingJob:
+        """실행 중이거나 대기 중인 인덱싱 작업을 취소합니다."""
+        indexing_job = await self._indexing_job_manager.cancel(job_id)
+        if indexing_job is None:
+            raise HTTPException(status_code=404, detail="Indexing job not found")
+        return indexing_job
+
+    def stream_indexing_job(self, job_id: str):
+        """인덱싱 작업 상태 변경을 SSE 이벤트로 스트리밍합니다."""
+        self.get_indexing_job(job_id)
+        return self._indexing_job_manager.stream(job_id)
 
     async def chat(
         self,
@@ -83,14 +163,37 @@ class ChatService:
             await message_queue.put(StopMessage())
             raise HTTPException(status_code=404, detail="Session not found")
 
+        # NOTE: 세션 문서 인덱싱이 끝나지 않았다면 검색 결과가 비지 않도록 완료를 기다림
+        if chat_session.indexing_job_id:
+            indexing_job = await self._indexing_job_manager.wait(
+                chat_session.indexing_job_id
+            )
+            if indexing_job is not None and indexing_job.error:
+                logger.warning(
+                    f"세션 문서 인덱싱이 실패한 상태로 채팅을 진행합니다: {indexing_job.error}"
+                )
+
         # 2. 사용자 메시지를 생성하여 history에 추가합니다.
         user_message = UserMessage(content=chat_request.content)
         chat_session.history.append(user_message)
 
+        # NOTE: 검색 범위(컬렉션, 문서)는 모델이 넘기는 인자가 아니라 세션에서 정해 도구 호출 시 주입
+        tool_arguments = {
+            "collection_name": chat_session.collection_name
+            or self._get_collection_name(
+                chat_session.user_id, chat_session.chat_session_id
+            ),
+            "document_ids": chat_session.documents,
+        }
+
         # 3. 에이전트를 실행하고, 발생할 수 있는 예외는 'events'에 기록합니다.
         try:
             await self._chat_agent.run(
-                chat_request, chat_session.history, message_queue, mcp_sessions
+                chat_request,
+                chat_session.history,
+                message_queue,
+                mcp_sessions,
+                tool_arguments=tool_arguments,
             )
         except Exception as e:
             logger.error(f"Error during chat agent execution: {e}")
@@ -0,0 +1,168 @@
+import asyncio
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Awaitable, Callable
+
+from app.common.logger import logger
+from app.common.utils import get_kst_now
+from app.domains.chat.schemas.enums import IndexingJobStatus
+from app.domains.chat.schemas.indexing_job import IndexingJob
+
+# (삽입 성공 청크 수, 실패 청크 수, 전체 청크 수)를 받는 진행률 콜백
+ProgressCallback = Callable[[int, int, int], None]
+
+TERMINAL_STATUSES = frozenset(
+    {
+        IndexingJobStatus.COMPLETED,
+        IndexingJobStatus.FAILED,
+        IndexingJobStatus.CANCELLED,
+    }
+)
+
+
+class IndexingJobManager:
+    """문서 인덱싱을 백그라운드 작업으로 실행하고 상태를 관리합니다.
+
+    작업은 앱 전체에서 공유하는 세마포어로 동시 실행 수가 제한되므로, 요청이 몰려도
+    임베딩 API와 Milvus에 가해지는 부하가 max_concurrent_jobs개 작업으로 제한됩니다.
+    작업 상태는 프로세스 메모리에 보관하며, 종료된 작업은 max_retained_jobs개까지만 유지합니다.
+    """
+
+    def __init__(self, max_concurrent_jobs: int = 2, max_retained_jobs: int = 1000):
+        """IndexingJobManager를 초기화합니다.
+
+        Args:
+            max_concurrent_jobs (int): 동시에 실행할 인덱싱 작업 수
+            max_retained_jobs (int): 메모리에 보관할 최대 작업 수. 넘으면 오래된 종료 작업부터 삭제합니다.
+        """
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.max_retained_jobs = max_retained_jobs
+        self._semaphore = asyncio.Semaphore(max_concurrent_jobs)
+        self._jobs: OrderedDict[str, IndexingJob] = OrderedDict()
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._update_events: dict[str, asyncio.Event] = {}
+
+    def submit(
+        self,
+        run: Callable[[ProgressCallback], Awaitable[None]],
+        session_id: str,
+        collection_name: str,
+    ) -> IndexingJob:
+        """인덱싱 작업을 등록하고 백그라운드에서 실행합니다.
+
+        Args:
+            run: 진행률 콜백을 받아 인덱싱을 수행하는 코루틴 함수
+            session_id (str): 작업을 생성한 채팅 세션 ID
+            collection_name (str): 인덱싱 대상 컬렉션 이름
+
+        Returns:
+            IndexingJob: 등록된 작업
+        """
+        job = IndexingJob(
+            job_id=uuid.uuid4().hex,
+            session_id=session_id,
+            collection_name=collection_name,
+        )
+        self._jobs[job.job_id] = job
+        self._update_events[job.job_id] = asyncio.Event()
+        self._tasks[job.job_id] = asyncio.create_task(self._run(job.job_id, run))
+        self._evict()
+        logger.info(f"인덱싱 작업 등록: {job.job_id} (session: {session_id})")
+        return job
+
+    def get(self, job_id: str) -> IndexingJob | None:
+        return self._jobs.get(job_id)
+
+    async def cancel(self, job_id: str) -> IndexingJob | None:
+        """실행 중이거나 대기 중인 작업을 취소하고, 취소가 반영된 작업 상태를 반환합니다."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        task = self._tasks.get(job_id)
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        return job
+
+    async def wait(self, job_id: str) -> IndexingJob | None:
+        """작업이 종료될 때까지 기다린 후 작업 상태를 반환합니다."""
+        task = self._tasks.get(job_id)
+        if task is not None:
+            await asyncio.gather(asyncio.shield(task), return_exceptions=True)
+        return self._jobs.get(job_id)
+
+    async def stream(
+        self, job_id: str, keepalive_seconds: float = 15
+    ) -> AsyncGenerator[str, None]:
+        """작업 상태가 바뀔 때마다 SSE 이벤트를 전송합니다. 작업이 종료되면 스트림을 닫습니다."""
+        while (job := self._jobs.get(job_id)) is not None:
+            update_event = self._update_events[job_id]
+            yield f"data: {job.model_dump_json()}\n\n"
+            if job.status in TERMINAL_STATUSES:
+                return
+            try:
+                await asyncio.wait_for(update_event.wait(), timeout=keepalive_seconds)
+            except TimeoutError:
+                # 변경이 없어도 현재 상태를 다시 보내 연결을 유지
+                continue
+
+    async def _run(
+        self, job_id: str, run: Callable[[ProgressCallback], Awaitable[None]]
+    ):
+        def _on_progress(processed: int, failed: int, total: int):
+            self._update(
+                job_id,
+                processed_chunks=processed,
+                failed_chunks=failed,
+                total_chunks=total,
+            )
+
+        try:
+            async with self._semaphore:
+                self._update(
+                    job_id, status=IndexingJobStatus.RUNNING, started_at=get_kst_now()
+                )
+                await run(_on_progress)
+            self._update(
+                job_id, status=IndexingJobStatus.COMPLETED, finished_at=get_kst_now()
+            )
+            logger.info(f"인덱싱 작업 완료: {job_id}")
+        except asyncio.CancelledError:
+            self._update(
+                job_id, status=IndexingJobStatus.CANCELLED, finished_at=get_kst_now()
+            )
+            logger.info(f"인덱싱 작업 취소: {job_id}")
+            raise
+        except Exception as e:
+            self._update(
+                job_id,
+                status=IndexingJobStatus.FAILED,
+                error=str(e),
+                finished_at=get_kst_now(),
+            )
+            logger.error(f"인덱싱 작업 실패: {job_id}, {e}")
+        finally:
+            self._tasks.pop(job_id, None)
+
+    def _update(self, job_id: str, **fields):
+        """작업 상태를 갱신하고 상태 스트림 대기자를 깨웁니다."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        for name, value in fields.items():
+            setattr(job, name, value)
+        self._update_events[job_id].set()
+        self._update_events[job_id] = asyncio.Event()
+
+    def _evict(self):
+        """보관 중인 작업이 max_retained_jobs를 넘으면 오래된 종료 작업부터 삭제합니다."""
+        overflow = len(self._jobs) - self.max_retained_jobs
+        if overflow <= 0:
+            return
+        for job_id in [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.status in TERMINAL_STATUSES
+        ][:overflow]:
+            self._jobs.pop(job_id, None)
+            self._update_events.pop(job_id, None)
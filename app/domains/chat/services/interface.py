@@ -1,6 +1,7 @@
 """Interface for chat agents that handle conversation flow with SSE messaging support."""
 
 from abc import ABC, abstractmethod
+from typing import Any
 
 from mcp import ClientSession
 
@@ -25,6 +26,7 @@ class IChatAgent(ABC):
         messages: list[Message],
         message_queue: MessageQueue,
         mcp_sessions: dict[str, ClientSession] | None = None,
+        tool_arguments: dict[str, Any] | None = None,
     ) -> None:
         """Run the agent with the given chat context.
 
@@ -38,6 +40,8 @@ class IChatAgent(ABC):
             chat_request: Chat request including the latest user request
             messages: Chat messages including the latest user request
             message_queue: Queue for sending SSE messages to the client
+            mcp_sessions: MCP server sessions the selected tools are loaded from
+            tool_arguments: Tool arguments fixed by the server and hidden from the model
 
         Returns:
             Final response string from the agent
@@ -123,6 +123,49 @@ async def create_document(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@document_v1_router.post(
+    path="/{document_id}/resume",
+    summary="Resume document",
+    description="Resume an interrupted document parsing from its last checkpoint with SSE processing updates",
+    response_class=StreamingResponse,
+)
+@inject
+async def resume_document(
+    document_id: str,
+    document_service: DocumentService = Depends(
+        Provide[BaseContainer.document_container.document_service]
+    ),
+) -> StreamingResponse:
+    """Resume an interrupted document parsing with SSE processing updates.
+
+    Args:
+        document_id: Document ID returned by create document
+        document_service: Document service instance.
+
+    Returns:
+        StreamingResponse: SSE stream with processing updates
+    """
+    logger.info(f"POST /documents/{document_id}/resume called")
+
+    # 재개할 파싱 작업이 없으면 스트리밍 시작 전에 404 반환
+    updates = document_service.resume_document(document_id)
+    try:
+        first_update = await anext(updates)
+    except StopAsyncIteration:
+        first_update = None
+
+    async def generate_sse():
+        if first_update is not None:
+            yield f"{first_update.model_dump_json()}\n\n"
+        async for update in updates:
+            yield f"{update.model_dump_json()}\n\n"
+
+    return StreamingResponse(
+        generate_sse(),
+        media_type="text/event-stream",
+    )
+
+
 @document_v1_router.post(
     path="/delete",
     summary="Delete document",
@@ -3,11 +3,14 @@ from pathlib import Path
 from dependency_injector.containers import DeclarativeContainer
 from dependency_injector.providers import Configuration, Dependency, Factory, Singleton
 
+from app.common.checkpointer import SQLiteCheckpointSaver
+from app.common.downloader import AsyncFileDownloader
 from app.common.llm_clients.langchain_clients import (
     LangchainClient,
     MultiModalLangchainClient,
 )
 from app.config.utils import init_config
+from app.domains.document.handlers.image_preprocessor import ImagePreprocessor
 from app.domains.document.handlers.langchain.adapter import LangchainAdapter
 from app.domains.document.handlers.langchain.chain import (
     get_extract_document_summary_runnable,
@@ -23,7 +26,8 @@ from app.domains.document.handlers.node.llm import (
 from app.domains.document.handlers.node.loader import SplitPDFFilesNode
 from app.domains.document.handlers.node.parser import PostParseNode, UpstageParseNode
 from app.domains.document.handlers.node.preprocessing import LangchainDocumentNode
-from app.domains.document.handlers.node.utils import WorkingQueueNode
+from app.domains.document.handlers.ocr_cache import DiskOCRCache
+from app.domains.document.handlers.split_file_store import SplitFileStore
 from app.domains.document.repositories.mongo_document_repository import (
     MongoDocumentRepository,
 )
@@ -55,7 +59,9 @@ class DocumentContainer(DeclarativeContainer):
         params=page_summary_config.get("params"),
     )
     page_summary_adapter = Singleton(
-        LangchainAdapter, llm_client=page_summary_llm_client
+        LangchainAdapter,
+        llm_client=page_summary_llm_client,
+        max_concurrency=page_summary_config.get("max_concurrency"),
     )
     extract_page_summary_chain = Singleton(
         get_extract_page_summary_runnable, adapter=page_summary_adapter
@@ -76,7 +82,9 @@ class DocumentContainer(DeclarativeContainer):
         params=image_summary_config.get("params"),
     )
     image_summary_adapter = Singleton(
-        LangchainAdapter, multi_modal_client=image_summary_llm_client
+        LangchainAdapter,
+        multi_modal_client=image_summary_llm_client,
+        max_concurrency=image_summary_config.get("max_concurrency"),
     )
     extract_image_summary_chain = Singleton(
         get_extract_image_summary_runnable, adapter=image_summary_adapter
@@ -94,26 +102,59 @@ class DocumentContainer(DeclarativeContainer):
         params=table_summary_config.get("params"),
     )
     table_summary_adapter = Singleton(
-        LangchainAdapter, multi_modal_client=table_summary_llm_client
+        LangchainAdapter,
+        multi_modal_client=table_summary_llm_client,
+        max_concurrency=table_summary_config.get("max_concurrency"),
     )
     extract_table_summary_chain = Singleton(
         get_extract_table_summary_runnable, adapter=table_summary_adapter
     )
 
+    # --- URL 문서 다운로더 (연결 풀 공유) ---
+    downloader_config = config.document.downloader()
+    file_downloader = Singleton(
+        AsyncFileDownloader,
+        chunk_size=downloader_config.get("chunk_size"),
+        max_bytes=downloader_config.get("max_bytes"),
+        timeout=downloader_config.get("timeout"),
+        connect_timeout=downloader_config.get("connect_timeout"),
+        read_timeout=downloader_config.get("read_timeout"),
+        max_retries=downloader_config.get("max_retries"),
+        max_connections=downloader_config.get("max_connections"),
+    )
+
     # --- 파싱 파이프라인 노드 정의 ---
+    # 분할 PDF 바이트는 체크포인트 state 밖의 저장소로 주고받음 (분할/OCR 노드와 ParsingService가 공유)
+    split_file_store = Singleton(SplitFileStore)
     split_pdf_files_node = Singleton(
         SplitPDFFilesNode,
+        downloader=file_downloader,
         batch_size=config.document.split_pdf_files_node.batch_size(),
         save_dir=config.document.split_pdf_files_node.save_dir(),
         test_page=config.document.split_pdf_files_node.test_page(),
+        in_memory=config.document.split_pdf_files_node.in_memory(),
+        spool_max_bytes=config.document.split_pdf_files_node.spool_max_bytes(),
+        split_file_store=split_file_store,
+    )
+    ocr_cache_config = config.document.upstage_parse_node.ocr_cache()
+    ocr_cache = Singleton(
+        DiskOCRCache,
+        cache_dir=ocr_cache_config.get("cache_dir"),
+        max_bytes=ocr_cache_config.get("max_bytes"),
     )
     upstage_parse_node = Singleton(
         UpstageParseNode,
         api_key=config.upstage.api_key(),
         is_save=config.document.upstage_parse_node.is_save(),
+        max_concurrency=config.document.upstage_parse_node.max_concurrency(),
+        requests_per_minute=config.document.upstage_parse_node.requests_per_minute(),
+        request_timeout=config.document.upstage_parse_node.request_timeout(),
+        max_retries=config.document.upstage_parse_node.max_retries(),
+        backoff_base_seconds=config.document.upstage_parse_node.backoff_base_seconds(),
+        ocr_cache=ocr_cache if ocr_cache_config.get("enabled") else None,
+        split_file_store=split_file_store,
     )
     post_parse_node = Singleton(PostParseNode)
-    working_queue_node = Singleton(WorkingQueueNode)
 
     page_summary_node = Singleton(
         PageSummaryNode,
@@ -121,16 +162,38 @@ class DocumentContainer(DeclarativeContainer):
         document_summary_chain=extract_document_summary_chain,
         page_summary_system_prompt=config.document_prompts.page_summary_node.system_prompt(),
         document_summary_system_prompt=config.document_prompts.page_summary_node.system_prompt_2(),
+        max_concurrency=page_summary_config.get("batching").get("max_concurrency"),
+        tokens_per_minute=page_summary_config.get("batching").get("tokens_per_minute"),
+        max_batch_tokens=page_summary_config.get("batching").get("max_batch_tokens"),
+        max_batch_size=page_summary_config.get("batching").get("max_batch_size"),
+        max_context_tokens=page_summary_config.get("batching").get(
+            "max_context_tokens"
+        ),
+    )
+    # 이미지/테이블 요약 전 이미지 축소 및 중복 제거
+    image_preprocessing_config = config.document.image_preprocessing()
+    image_preprocessor = Singleton(
+        ImagePreprocessor,
+        jpeg_quality=image_preprocessing_config.get("jpeg_quality"),
+        hash_distance=image_preprocessing_config.get("hash_distance"),
     )
     image_summary_node = Singleton(
         ImageSummaryNode,
         chain=extract_image_summary_chain,
         system_prompt=config.document_prompts.image_summary_node.system_prompt(),
+        image_preprocessor=image_preprocessor
+        if image_preprocessing_config.get("enabled")
+        else None,
+        summary_cache_max_size=image_preprocessing_config.get("summary_cache_max_size"),
     )
     table_summary_node = Singleton(
         TableSummaryNode,
         chain=extract_table_summary_chain,
         system_prompt=config.document_prompts.table_summary_node.system_prompt(),
+        image_preprocessor=image_preprocessor
+        if image_preprocessing_config.get("enabled")
+        else None,
+        summary_cache_max_size=image_preprocessing_config.get("summary_cache_max_size"),
     )
     langchain_document_node = Singleton(
         LangchainDocumentNode,
@@ -138,20 +201,38 @@ class DocumentContainer(DeclarativeContainer):
         chunk_overlap=config.document.langchain_document_node.chunk_overlap(),
         strategy=config.document.langchain_document_node.strategy(),
         embedding_model=config.document.langchain_document_node.embedding_model(),
+        num_workers=config.document.langchain_document_node.num_workers(),
+        embedding_batch_size=config.document.langchain_document_node.embedding_batch_size(),
+        embedding_concurrency=config.document.langchain_document_node.embedding_concurrency(),
+        embedding_persist_max_bytes=config.document.langchain_document_node.embedding_persist_max_bytes(),
     )
 
     # --- 서비스 정의 ---
-    parsing_service = Factory(
+    # 파싱 그래프 체크포인트 저장소 (sqlite이면 중단된 파싱을 재개할 수 있음)
+    checkpointer_config = config.document.checkpointer()
+    parsing_checkpointer = Singleton(
+        SQLiteCheckpointSaver,
+        db_path=checkpointer_config.get("db_path"),
+    )
+
+    # 파싱 그래프는 서비스 생성 시 한 번만 컴파일하므로 앱 전체에서 공유
+    parsing_service = Singleton(
         ParsingService,
         split_pdf_files_node=split_pdf_files_node,
         upstage_parse_node=upstage_parse_node,
         post_parse_node=post_parse_node,
-        working_queue_node=working_queue_node,
         page_summary_node=page_summary_node,
         image_summary_node=image_summary_node,
         table_summary_node=table_summary_node,
         langchain_document_node=langchain_document_node,
         langchain_adapter=page_summary_adapter,
+        downloader=file_downloader,
+        pipeline_summaries=config.document.pipeline_summaries(),
+        checkpointer=parsing_checkpointer
+        if checkpointer_config.get("backend") == "sqlite"
+        else None,
+        checkpoint_ttl_seconds=checkpointer_config.get("ttl_seconds"),
+        split_file_store=split_file_store,
     )
     document_service = Factory(
         DocumentService,
@@ -0,0 +1,68 @@
+"""파싱 요소 목록을 한 번만 훑어 요약 노드들이 함께 사용하는 인덱스 모듈입니다."""
+
+import base64
+from typing import Any
+
+
+class ElementIndex:
+    """post_parse_elements에 대한 읽기 전용 인덱스입니다.
+
+    요소 목록을 한 번 순회하면서 요소별 markdown과 페이지/카테고리별 요소 위치를 미리 계산합니다.
+    주변 요소 문맥 문자열은 처음 요청될 때 만들어 재사용하고, 이미지는 요청될 때만 base64를 디코딩하며 보관하지 않습니다.
+    """
+
+    def __init__(self, elements: list[dict[str, Any]], context_window: int = 2):
+        """ElementIndex를 초기화합니다.
+
+        Args:
+            elements (list[dict[str, Any]]): 페이지 순으로 정렬된 파싱 요소 목록
+            context_window (int): 주변 문맥에 포함할 앞뒤 요소 수
+        """
+        self.elements = elements
+        self.context_window = context_window
+        self.markdowns: list[str] = []
+        self.page_offsets: dict[Any, list[int]] = {}
+        self.category_offsets: dict[str, list[int]] = {}
+        for i, element in enumerate(elements):
+            self.markdowns.append((element.get("content") or {}).get("markdown") or "")
+            self.page_offsets.setdefault(element.get("page"), []).append(i)
+            self.category_offsets.setdefault(element.get("category"), []).append(i)
+        self._contexts: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def offsets(self, *categories: str) -> list[int]:
+        """주어진 카테고리 요소들의 위치를 요소 순서대로 반환합니다."""
+        if len(categories) == 1:
+            return self.category_offsets.get(categories[0], [])
+        return sorted(
+            offset
+            for category in categories
+            for offset in self.category_offsets.get(category, [])
+        )
+
+    def page_text(self, page: Any) -> str:
+        """페이지에 속한 요소들의 markdown을 줄바꿈으로 이어 반환합니다."""
+        return "\n".join(self.markdowns[i] for i in self.page_offsets.get(page, []))
+
+    def context(self, offset: int) -> str:
+        """요소와 앞뒤 context_window개 요소의 markdown을 이어 반환합니다.
+
+        앞이나 뒤에 요소가 부족하면 양쪽이 같은 개수가 되도록 범위를 줄입니다.
+        """
+        context = self._contexts.get(offset)
+        if context is None:
+            context = self.markdowns[offset]
+            for window in range(self.context_window, 0, -1):
+                if window <= offset < len(self.markdowns) - window:
+                    context = "\n".join(
+                        self.markdowns[offset - window : offset + window + 1]
+                    )
+                    break
+            self._contexts[offset] = context
+        return context
+
+    def image_bytes(self, offset: int) -> bytes:
+        """요소의 base64 이미지를 디코딩하여 반환합니다. 디코딩 결과는 보관하지 않습니다."""
+        return base64.b64decode(self.elements[offset].get("base64_encoding"))
@@ -0,0 +1,127 @@
+"""멀티모달 요약 전에 이미지를 축소하고 중복을 찾기 위한 전처리 모듈입니다.
+
+Upstage가 잘라 준 그림/차트/테이블 이미지를 모델이 실제로 사용하는 해상도까지만 줄여 JPEG로 다시 인코딩하고,
+지각 해시를 계산하여 페이지마다 반복되는 로고나 같은 차트를 한 번만 요약할 수 있도록 합니다.
+"""
+
+import hashlib
+from dataclasses import dataclass
+
+import pymupdf
+
+from app.agents.context.token_manager import TokenCounter
+from app.common.logger import logger
+
+HASH_SIZE = 16
+
+
+@dataclass
+class PreparedImage:
+    """전처리된 이미지입니다."""
+
+    image_bytes: bytes
+    mime_type: str
+    content_hash: str  # 원본 이미지 바이트의 sha256 (정확히 같은 이미지 확인용)
+    image_hash: int  # 지각 해시 (거의 같은 이미지 확인용)
+    width: int
+    height: int
+    tokens: int
+
+
+class ImagePreprocessor:
+    """이미지 축소, 재인코딩, 지각 해시 계산을 담당합니다.
+
+    모델은 긴 변을 max_size 이하로, 짧은 변을 high_detail_target_short_side로 맞춘 뒤 타일 단위로 처리하므로
+    (TokenCounter의 고해상도 이미지 토큰 계산 규칙), 그보다 큰 이미지는 같은 크기로 미리 줄여서 보냅니다.
+    """
+
+    def __init__(
+        self,
+        jpeg_quality: int = 85,
+        hash_distance: int = 5,
+        token_config: dict | None = None,
+    ):
+        """ImagePreprocessor를 초기화합니다.
+
+        Args:
+            jpeg_quality (int): 다시 인코딩할 JPEG 품질
+            hash_distance (int): 같은 이미지로 볼 지각 해시의 최대 해밍 거리 (512비트 기준)
+            token_config (dict | None): TokenCounter의 토큰 계산 설정. None이면 기본값을 사용합니다.
+        """
+        self.jpeg_quality = jpeg_quality
+        self.hash_distance = hash_distance
+        self.token_counter = TokenCounter(tokenizer=None, config=token_config)
+
+    def _effective_size(self, width: int, height: int) -> tuple[int, int]:
+        """모델이 실제로 사용하는 해상도를 계산합니다. 원본보다 커지지는 않습니다."""
+        # 1. 긴 변을 MAX_SIZE 이하로 제한
+        scale = min(1.0, self.token_counter.MAX_SIZE / max(width, height))
+        # 2. 짧은 변을 HIGH_DETAIL_TARGET_SHORT_SIDE 이하로 제한
+        short_side = min(width, height) * scale
+        if short_side > self.token_counter.HIGH_DETAIL_TARGET_SHORT_SIDE:
+            scale *= self.token_counter.HIGH_DETAIL_TARGET_SHORT_SIDE / short_side
+        return max(1, int(width * scale)), max(1, int(height * scale))
+
+    @staticmethod
+    def _perceptual_hash(pix: pymupdf.Pixmap) -> int:
+        """16x16 흑백 축소 이미지로 512비트 지각 해시를 계산합니다.
+
+        평균 밝기 해시(aHash)와 인접 픽셀 차이 해시(dHash)를 이어 붙입니다.
+        흰 배경이 대부분인 그림은 dHash만으로는 비트가 거의 채워지지 않으므로 aHash로 보완합니다.
+        """
+        gray = pymupdf.Pixmap(pymupdf.csGRAY, pix)
+        average_samples = pymupdf.Pixmap(gray, HASH_SIZE, HASH_SIZE, None).samples
+        diff_samples = pymupdf.Pixmap(gray, HASH_SIZE + 1, HASH_SIZE, None).samples
+
+        image_hash = 0
+        mean = sum(average_samples) / len(average_samples)
+        for value in average_samples:
+            image_hash = (image_hash << 1) | (value > mean)
+        for row in range(HASH_SIZE):
+            for col in range(HASH_SIZE):
+                left = diff_samples[row * (HASH_SIZE + 1) + col]
+                right = diff_samples[row * (HASH_SIZE + 1) + col + 1]
+                image_hash = (image_hash << 1) | (left > right)
+        return image_hash
+
+    def prepare(self, image_bytes: bytes) -> PreparedImage | None:
+        """이미지를 모델 해상도로 줄여 JPEG로 인코딩하고 지각 해시를 계산합니다. 읽을 수 없는 이미지는 None입니다."""
+        try:
+            pix = pymupdf.Pixmap(image_bytes)
+            if pix.alpha:
+                pix = pymupdf.Pixmap(pix, 0)
+            if pix.colorspace is None or pix.colorspace.n not in (1, 3):
+                pix = pymupdf.Pixmap(pymupdf.csRGB, pix)
+
+            width, height = self._effective_size(pix.width, pix.height)
+            if (width, height) != (pix.width, pix.height):
+                pix = pymupdf.Pixmap(pix, width, height, None)
+
+            return PreparedImage(
+                image_bytes=pix.tobytes("jpeg", jpg_quality=self.jpeg_quality),
+                mime_type="image/jpeg",
+                content_hash=hashlib.sha256(image_bytes).hexdigest(),
+                image_hash=self._perceptual_hash(pix),
+                width=width,
+                height=height,
+                tokens=self.token_counter.count_image(
+                    {"detail": "high", "dimensions": (width, height)}
+                ),
+            )
+        except Exception as e:
+            logger.warning(f"이미지 전처리 실패, 원본 이미지를 사용합니다: {e!r}")
+            return None
+
+    def is_duplicate(self, image: PreparedImage, other: PreparedImage) -> bool:
+        """두 이미지가 같은 이미지로 볼 만큼 가까운지 확인합니다.
+
+        단색 이미지처럼 해시만으로 구분되지 않는 경우를 위해 가로세로 비율이 비슷한지도 함께 확인합니다.
+        16x16 해시는 셀 값만 다른 테이블을 구분하지 못하므로 테이블에는 사용하지 않습니다.
+        """
+        if (image.image_hash ^ other.image_hash).bit_count() > self.hash_distance:
+            return False
+        aspect_ratio = image.width / image.height
+        other_aspect_ratio = other.width / other.height
+        return abs(aspect_ratio - other_aspect_ratio) <= 0.05 * max(
+            aspect_ratio, other_aspect_ratio
+        )
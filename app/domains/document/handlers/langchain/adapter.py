@@ -1,4 +1,5 @@
 import asyncio
+from collections.abc import Awaitable
 from typing import Any
 
 from app.common.llm_clients.langchain_interface import ILangchainClient
@@ -10,21 +11,36 @@ class LangchainAdapter:
         self,
         llm_client: ILangchainClient | None = None,
         multi_modal_client: ILangchainClient | None = None,
+        max_concurrency: int = 16,
     ):
+        """LangchainAdapter를 초기화합니다.
+
+        모든 호출은 클라이언트의 비동기 메서드로 실행되어 기본 스레드 풀을 사용하지 않습니다.
+        배치 요청도 항목별 요청으로 나누어 보내며, 어댑터 하나를 공유하는 모든 요청의 동시 실행 수는
+        max_concurrency로 제한됩니다.
+
+        Args:
+            llm_client: 텍스트 LLM 클라이언트
+            multi_modal_client: 멀티모달 LLM 클라이언트
+            max_concurrency: 동시에 실행할 최대 LLM 요청 수
+        """
         self.llm_client = llm_client
         self.multi_modal_client = multi_modal_client
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
 
-    async def _run_sync_in_executor(self, func, *args, **kwargs):
-        """Helper to run sync functions in executor."""
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, lambda: func(*args, **kwargs))
+    async def _run_limited(self, coro: Awaitable[Any]) -> Any:
+        """동시 실행 수 제한 안에서 LLM 요청을 실행합니다."""
+        async with self._semaphore:
+            return await coro
 
     async def llm_client_ainvoke(self, system_prompt: str, user_prompt: str) -> Any:
         try:
-            response = await self._run_sync_in_executor(
-                self.llm_client.invoke,
-                system_prompt=system_prompt,
-                user_prompt=user_prompt,
+            response = await self._run_limited(
+                self.llm_client.ainvoke(
+                    system_prompt=system_prompt,
+                    user_prompt=user_prompt,
+                )
             )
             return response
         except Exception as e:
@@ -38,11 +54,17 @@ class LangchainAdapter:
         chat_history: list[list[dict[str, Any]]] | None = None,
     ) -> Any:
         try:
-            response = await self._run_sync_in_executor(
-                self.llm_client.batch,
-                system_prompts=system_prompts,
-                user_prompts=user_prompts,
-                chat_history=chat_history,
+            response = await asyncio.gather(
+                *(
+                    self._run_limited(
+                        self.llm_client.ainvoke(
+                            system_prompt=system_prompts[i],
+                            user_prompt=user_prompts[i],
+                            chat_history=chat_history[i] if chat_history else None,
+                        )
+                    )
+                    for i in range(len(system_prompts))
+                )
             )
             return response
         except Exception as e:
@@ -58,13 +80,28 @@ class LangchainAdapter:
         chat_history: list[list[dict[str, Any]]] | None = None,
     ) -> Any:
         try:
-            response = await self._run_sync_in_executor(
-                self.multi_modal_client.batch,
-                image_inputs=image_inputs,
-                system_prompts=system_prompts,
-                user_prompts=user_prompts,
-                mime_types=mime_types,
-                chat_history=chat_history,
+            if not (
+                len(system_prompts)
+                == len(user_prompts)
+                == len(mime_types)
+                == len(image_inputs)
+            ):
+                raise ValueError(
+                    "Length of all input lists must match the number of images."
+                )
+            response = await asyncio.gather(
+                *(
+                    self._run_limited(
+                        self.multi_modal_client.ainvoke(
+                            image_input=image_inputs[i],
+                            system_prompt=system_prompts[i],
+                            user_prompt=user_prompts[i],
+                            mime_type=mime_types[i],
+                            chat_history=chat_history[i] if chat_history else None,
+                        )
+                    )
+                    for i in range(len(image_inputs))
+                )
             )
             return response
         except Exception as e:
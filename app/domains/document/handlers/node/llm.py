@@ -1,10 +1,17 @@
-import base64
+import asyncio
 from collections.abc import AsyncGenerator
 from typing import Any
 
 from langchain_core.runnables import Runnable
 
+from app.common.batching import TokenBudgetBatcher
+from app.common.cache import LRUCache
 from app.common.logger import logger
+from app.domains.document.handlers.element_index import ElementIndex
+from app.domains.document.handlers.image_preprocessor import (
+    ImagePreprocessor,
+    PreparedImage,
+)
 from app.domains.document.handlers.node.base import BaseNode
 from app.domains.document.schemas.state import ParseState
 
@@ -16,124 +23,325 @@ class PageSummaryNode(BaseNode):
         document_summary_chain: Runnable,
         page_summary_system_prompt: str,
         document_summary_system_prompt: str,
+        max_concurrency: int = 8,
+        tokens_per_minute: int | None = None,
+        max_batch_tokens: int = 30000,
+        max_batch_size: int = 16,
+        max_context_tokens: int = 100000,
     ):
+        """PageSummaryNode를 초기화합니다.
+
+        페이지 요약은 토큰 예산 단위의 작은 배치로 나누어 동시에 요청합니다.
+        페이지 요약 전체가 max_context_tokens를 넘으면, 페이지 요약을 묶어 다시 요약하는 과정을
+        한도 안에 들어올 때까지 반복한 뒤(map-reduce) 전체 문서 요약을 생성합니다.
+
+        :param max_concurrency: 동시에 요청할 최대 배치 수 (앱 전체 공유)
+        :param tokens_per_minute: 분당 입력 토큰 수 제한, None은 제한 없음
+        :param max_batch_tokens: 배치 하나의 최대 입력 토큰 수
+        :param max_batch_size: 배치 하나의 최대 페이지 수
+        :param max_context_tokens: 전체 문서 요약 요청 하나의 최대 입력 토큰 수
+        """
         self.name = "page_summary_node"
         self.page_summary_chain = page_summary_chain
         self.document_summary_chain = document_summary_chain
         self.page_summary_system_prompt = page_summary_system_prompt
         self.document_summary_system_prompt = document_summary_system_prompt
+        self.max_context_tokens = max_context_tokens
+        self.batcher = TokenBudgetBatcher(
+            max_concurrency=max_concurrency,
+            tokens_per_minute=tokens_per_minute,
+            max_batch_tokens=max_batch_tokens,
+            max_batch_size=max_batch_size,
+        )
 
-    def _make_batch_data(
-        self, post_parse_elements: list[dict[str, Any]]
-    ) -> list[dict[str, Any]]:
+    def _make_batch_data(self, element_index: ElementIndex) -> list[dict[str, Any]]:
         """페이지 요약을 위한 배치 데이터 준비."""
-        page_content_map = {}
-        for element in post_parse_elements:
-            element_page = element.get("page")
-            if element_page not in page_content_map:
-                page_content_map[element_page] = []
-            element_text = element.get("content").get("markdown")
-            page_content_map[element_page].append(element_text)
-
         data_batches = []
-        for page, content in page_content_map.items():
+        for page in element_index.page_offsets:
             data_batches.append(
                 {
                     "system_prompt": self.page_summary_system_prompt,
                     "page": str(page),
-                    "text": "\n".join(content),
+                    "text": element_index.page_text(page),
                 }
             )
+        if len(data_batches) == 0:
+            return []
         logger.debug(f"PageSummary system prompt: {self.page_summary_system_prompt}")
         logger.debug(f"PageSummary data_batches: {data_batches[0]}")
         logger.info(f"PageSummary data_batches_length: {len(data_batches)}")
         return data_batches
 
-    async def execute(self, state: ParseState) -> AsyncGenerator[ParseState, None]:
-        post_parse_elements = state["post_parse_elements"]
-        data_batches = self._make_batch_data(post_parse_elements)
+    async def asummarize_pages(
+        self,
+        elements: list[dict[str, Any]],
+        element_index: ElementIndex | None = None,
+    ) -> list[dict[str, Any]]:
+        """요소들을 페이지별로 묶어 페이지 요약을 생성합니다. element_index가 없으면 새로 만듭니다."""
+        if element_index is None:
+            element_index = ElementIndex(elements)
+        data_batches = self._make_batch_data(element_index)
         if len(data_batches) == 0:
             logger.warning("PageSummary data batches is empty")
-            yield {"page_summary": []}
-        else:
-            llm_results = await self.page_summary_chain.ainvoke(data_batches)
-            logger.info(f"PageSummary LLM results: {len(llm_results)}")
-
-            page_summary_result = []
-            for data_batch, llm_result in zip(data_batches, llm_results, strict=False):
-                page_summary_result.append(
-                    {
-                        "system_prompt": self.document_summary_system_prompt,
-                        "page": data_batch.get("page"),
-                        "page_raw": data_batch.get("text"),
-                        "page_summary": llm_result.content,
-                    }
-                )
-            logger.debug(
-                f"Document summary system prompt: {self.document_summary_system_prompt}"
+            return []
+
+        token_counts = [
+            self.batcher.count_tokens(data_batch["text"]) for data_batch in data_batches
+        ]
+        llm_results = await self.batcher.arun(
+            self.page_summary_chain.ainvoke, data_batches, token_counts
+        )
+        logger.info(f"PageSummary LLM results: {len(llm_results)}")
+
+        page_summary_result = []
+        for data_batch, llm_result in zip(data_batches, llm_results, strict=False):
+            page_summary_result.append(
+                {
+                    "system_prompt": self.document_summary_system_prompt,
+                    "page": data_batch.get("page"),
+                    "page_raw": data_batch.get("text"),
+                    "page_summary": llm_result.content,
+                }
             )
-            logger.debug(f"PageSummary result sample: {page_summary_result[0]}")
-            logger.info(f"PageSummary result length: {len(page_summary_result)}")
-            llm_results2 = await self.document_summary_chain.ainvoke(
-                page_summary_result
+        logger.debug(f"PageSummary result sample: {page_summary_result[0]}")
+        logger.info(f"PageSummary result length: {len(page_summary_result)}")
+        return page_summary_result
+
+    async def asummarize_document(
+        self, page_summary_result: list[dict[str, Any]]
+    ) -> str:
+        """페이지 요약들로 전체 문서 요약을 생성합니다. 페이지 요약은 페이지 순으로 정렬해 사용합니다."""
+        page_summary_result = sorted(
+            page_summary_result, key=lambda page_summary: int(page_summary["page"])
+        )
+        page_summary_result = await self._areduce_page_summaries(page_summary_result)
+        logger.debug(
+            f"Document summary system prompt: {self.document_summary_system_prompt}"
+        )
+        llm_results = await self.document_summary_chain.ainvoke(page_summary_result)
+        logger.info(f"DocumentSummary LLM results: {llm_results.content}")
+        return llm_results.content
+
+    async def _areduce_page_summaries(
+        self, page_summary_result: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """페이지 요약 전체가 max_context_tokens 안에 들어올 때까지 인접한 요약들을 묶어 다시 요약합니다."""
+        level = 0
+        while True:
+            token_counts = [
+                self.batcher.count_tokens(page_summary["page_summary"])
+                for page_summary in page_summary_result
+            ]
+            total_tokens = sum(token_counts)
+            if total_tokens <= self.max_context_tokens or len(page_summary_result) <= 1:
+                return page_summary_result
+
+            level += 1
+            # 요약 개수가 반드시 줄어들도록 배치마다 최소 2개를 묶음
+            batches = self.batcher.make_batches(
+                token_counts, max_batch_tokens=self.max_context_tokens, min_batch_size=2
+            )
+            logger.info(
+                f"DocumentSummary reduce level {level}: {len(page_summary_result)} summaries "
+                f"({total_tokens} tokens) -> {len(batches)} summaries"
             )
-            logger.info(f"DocumentSummary LLM results: {llm_results2.content}")
+            data_batches = [
+                {
+                    "system_prompt": self.page_summary_system_prompt,
+                    "page": page_summary_result[indices[0]]["page"],
+                    "text": "\n\n".join(
+                        page_summary_result[i]["page_summary"] for i in indices
+                    ),
+                }
+                for indices in batches
+            ]
+            llm_results = await self.batcher.arun(
+                self.page_summary_chain.ainvoke,
+                data_batches,
+                [sum(token_counts[i] for i in indices) for indices in batches],
+            )
+            page_summary_result = [
+                {
+                    "system_prompt": self.document_summary_system_prompt,
+                    "page": data_batch["page"],
+                    "page_raw": data_batch["text"],
+                    "page_summary": llm_result.content,
+                }
+                for data_batch, llm_result in zip(
+                    data_batches, llm_results, strict=True
+                )
+            ]
+
+    async def execute(self, state: ParseState) -> AsyncGenerator[ParseState, None]:
+        page_summary_result = await self.asummarize_pages(state["post_parse_elements"])
+        if len(page_summary_result) == 0:
+            yield {"page_summary": []}
+        else:
             yield {
                 "page_summary": page_summary_result,
-                "document_summary": llm_results2.content,
+                "document_summary": await self.asummarize_document(page_summary_result),
+            }
+
+    async def execute_document_summary(
+        self, state: ParseState
+    ) -> AsyncGenerator[ParseState, None]:
+        """페이지 요약이 분할 파일별로 미리 생성된 경우(파이프라인 모드) 전체 문서 요약만 생성합니다."""
+        page_summary_result = state.get("page_summary") or []
+        if len(page_summary_result) == 0:
+            logger.warning("PageSummary result is empty")
+            yield {}
+        else:
+            yield {
+                "document_summary": await self.asummarize_document(page_summary_result)
             }
 
 
+async def _asummarize_images(
+    chain: Runnable,
+    data_batches: list[dict[str, Any]],
+    element_index: ElementIndex,
+    image_preprocessor: ImagePreprocessor | None,
+    summary_cache: LRUCache,
+    dedup_similar: bool = True,
+) -> list[str]:
+    """이미지 배치 데이터를 멀티모달 모델로 요약합니다.
+
+    image_preprocessor가 있으면 이미지를 모델 해상도로 줄이고, 이전에 같은 입력으로 요약한 이미지는
+    캐시된 요약을 사용합니다. 문서 안에서 앞서 나온 이미지와 같은 이미지는 다시 요약하지 않고
+    앞 이미지의 요약을 그대로 사용합니다.
+
+    Args:
+        chain: 멀티모달 요약 체인
+        data_batches: 이미지/테이블 요약 배치 데이터
+        element_index: 배치 데이터의 element_offset으로 원본 이미지를 디코딩할 요소 인덱스
+        image_preprocessor: 이미지 전처리기. None이면 모든 이미지를 그대로 요약합니다.
+        summary_cache: (시스템 프롬프트, 원본 이미지 sha256, 주변 문맥) 기반 요약 캐시
+        dedup_similar: True이면 지각 해시로 거의 같은 이미지도 같은 이미지로 봅니다.
+            False이면 원본 바이트와 주변 문맥이 모두 같은 경우만 같은 이미지로 봅니다.
+
+    Returns:
+        배치 데이터별 요약
+    """
+    if image_preprocessor is None:
+        for data_batch in data_batches:
+            data_batch["base64_encoding"] = element_index.image_bytes(
+                data_batch["element_offset"]
+            )
+        llm_results = await chain.ainvoke(data_batches)
+        return [llm_result.content for llm_result in llm_results]
+
+    # 원본 이미지는 하나씩 디코딩해 축소한 뒤 바로 버림
+    prepared_images = await asyncio.to_thread(
+        lambda: [
+            image_preprocessor.prepare(
+                element_index.image_bytes(data_batch["element_offset"])
+            )
+            for data_batch in data_batches
+        ]
+    )
+
+    summaries: list[str | None] = [None] * len(data_batches)
+    # 요약할 이미지의 (배치 위치, 전처리 결과), 같은 이미지는 앞 이미지의 요약을 복사
+    seen_images: list[tuple[int, PreparedImage]] = []
+    duplicate_of: dict[int, int] = {}
+    pending: list[int] = []
+    duplicates = cache_hits = image_tokens = 0
+    for i, (data_batch, image) in enumerate(
+        zip(data_batches, prepared_images, strict=True)
+    ):
+        if image is None:
+            data_batch["base64_encoding"] = element_index.image_bytes(
+                data_batch["element_offset"]
+            )
+            pending.append(i)
+            continue
+
+        original = next(
+            (
+                j
+                for j, seen in seen_images
+                if (dedup_similar and image_preprocessor.is_duplicate(image, seen))
+                or (
+                    seen.content_hash == image.content_hash
+                    and data_batches[j]["text"] == data_batch["text"]
+                )
+            ),
+            None,
+        )
+        if original is not None:
+            duplicate_of[i] = original
+            duplicates += 1
+            continue
+        seen_images.append((i, image))
+
+        cached_summary = summary_cache.get(_summary_cache_key(data_batch, image))
+        if cached_summary is not None:
+            summaries[i] = cached_summary
+            cache_hits += 1
+            continue
+
+        data_batch["base64_encoding"] = image.image_bytes
+        data_batch["mime_type"] = image.mime_type
+        image_tokens += image.tokens
+        pending.append(i)
+
+    logger.info(
+        f"Image preprocessing: {len(data_batches)} images -> {len(pending)} requests "
+        f"(duplicates={duplicates}, cache_hits={cache_hits}, image_tokens={image_tokens})"
+    )
+    if pending:
+        llm_results = await chain.ainvoke([data_batches[i] for i in pending])
+        for i, llm_result in zip(pending, llm_results, strict=True):
+            summaries[i] = llm_result.content
+            if prepared_images[i] is not None:
+                summary_cache.set(
+                    _summary_cache_key(data_batches[i], prepared_images[i]),
+                    llm_result.content,
+                )
+    for i, original in duplicate_of.items():
+        summaries[i] = summaries[original]
+    return summaries
+
+
+def _summary_cache_key(
+    data_batch: dict[str, Any], image: PreparedImage
+) -> tuple[str, str, str]:
+    """요약 캐시 키. 모델 입력(시스템 프롬프트, 원본 이미지, 주변 문맥)이 모두 같을 때만 요약을 재사용합니다."""
+    return (data_batch["system_prompt"], image.content_hash, data_batch["text"])
+
+
 class ImageSummaryNode(BaseNode):
-    def __init__(self, chain: Runnable, system_prompt: str):
+    def __init__(
+        self,
+        chain: Runnable,
+        system_prompt: str,
+        image_preprocessor: ImagePreprocessor | None = None,
+        summary_cache_max_size: int = 1024,
+    ):
+        """ImageSummaryNode를 초기화합니다.
+
+        :param image_preprocessor: 이미지 축소/중복 제거 전처리기, None은 원본 이미지를 모두 요약
+        :param summary_cache_max_size: (프롬프트, 원본 이미지, 주변 문맥) 기반 요약 캐시의 최대 항목 수
+        """
         self.name = "image_summary_node"
         self.chain = chain
         self.system_prompt = system_prompt
+        self.image_preprocessor = image_preprocessor
+        self.summary_cache = LRUCache(max_size=summary_cache_max_size)
 
-    def _make_batch_data(
-        self, post_parse_elements: list[dict[str, Any]]
-    ) -> list[dict[str, Any]]:
-        """이미지 요약을 위한 배치 데이터 준비."""
+    def _make_batch_data(self, element_index: ElementIndex) -> list[dict[str, Any]]:
+        """이미지 요약을 위한 배치 데이터 준비. 이미지는 요약 직전에 element_index에서 디코딩합니다."""
         data_batches = []
-        for i in range(len(post_parse_elements)):
-            if (
-                post_parse_elements[i].get("category") == "figure"
-                or post_parse_elements[i].get("category") == "chart"
-            ):
-                text = ""
-                if (i > 1) and (i < len(post_parse_elements) - 2):
-                    text += (
-                        post_parse_elements[i - 2].get("content").get("markdown")
-                        + "\n"
-                        + post_parse_elements[i - 1].get("content").get("markdown")
-                        + "\n"
-                        + post_parse_elements[i].get("content").get("markdown")
-                        + "\n"
-                        + post_parse_elements[i + 1].get("content").get("markdown")
-                        + "\n"
-                        + post_parse_elements[i + 2].get("content").get("markdown")
-                    )
-                elif (i > 0) and (i < len(post_parse_elements) - 1):
-                    text += (
-                        post_parse_elements[i - 1].get("content").get("markdown")
-                        + "\n"
-                        + post_parse_elements[i].get("content").get("markdown")
-                        + "\n"
-                        + post_parse_elements[i + 1].get("content").get("markdown")
-                    )
-                else:
-                    text += post_parse_elements[i].get("content").get("markdown")
-                data_batches.append(
-                    {
-                        "system_prompt": self.system_prompt,
-                        "text": text,
-                        "base64_encoding": base64.b64decode(
-                            post_parse_elements[i].get("base64_encoding")
-                        ),
-                        "mime_type": "image/jpeg",
-                        "page": str(post_parse_elements[i].get("page")),
-                    }
-                )
+        for i in element_index.offsets("figure", "chart"):
+            data_batches.append(
+                {
+                    "system_prompt": self.system_prompt,
+                    "text": element_index.context(i),
+                    "element_offset": i,
+                    "mime_type": "image/jpeg",
+                    "page": str(element_index.elements[i].get("page")),
+                }
+            )
         if len(data_batches) == 0:
             return []
         else:
@@ -144,77 +352,78 @@ class ImageSummaryNode(BaseNode):
             logger.info(f"ImageSummary data batches length: {len(data_batches)}")
             return data_batches
 
-    async def execute(self, state: ParseState) -> AsyncGenerator[ParseState, None]:
-        post_parse_elements = state["post_parse_elements"]
-        data_batches = self._make_batch_data(post_parse_elements)
+    async def asummarize(
+        self,
+        elements: list[dict[str, Any]],
+        element_index: ElementIndex | None = None,
+    ) -> list[dict[str, Any]]:
+        """요소 중 이미지/차트에 대한 요약을 생성합니다. element_index가 없으면 새로 만듭니다."""
+        if element_index is None:
+            element_index = ElementIndex(elements)
+        data_batches = self._make_batch_data(element_index)
         if len(data_batches) == 0:
             logger.warning("ImageSummary data batches is empty")
-            yield {"image_summary": []}
-        else:
-            llm_results = await self.chain.ainvoke(data_batches)
-            logger.info(f"LLM results: {len(llm_results)}")
-
-            result = []
-            for data_batch, llm_result in zip(data_batches, llm_results, strict=False):
-                result.append(
-                    {
-                        "page": data_batch.get("page"),
-                        "image_raw": data_batch.get("text"),
-                        "image_summary": llm_result.content,
-                    }
-                )
-            logger.debug(f"ImageSummary result sample: {result[0]}")
-            logger.info(f"ImageSummary result length: {len(result)}")
-            yield {"image_summary": result}
+            return []
+
+        summaries = await _asummarize_images(
+            self.chain,
+            data_batches,
+            element_index,
+            self.image_preprocessor,
+            self.summary_cache,
+        )
+        logger.info(f"LLM results: {len(summaries)}")
+
+        result = []
+        for data_batch, summary in zip(data_batches, summaries, strict=False):
+            result.append(
+                {
+                    "page": data_batch.get("page"),
+                    "image_raw": data_batch.get("text"),
+                    "image_summary": summary,
+                }
+            )
+        logger.debug(f"ImageSummary result sample: {result[0]}")
+        logger.info(f"ImageSummary result length: {len(result)}")
+        return result
+
+    async def execute(self, state: ParseState) -> AsyncGenerator[ParseState, None]:
+        yield {"image_summary": await self.asummarize(state["post_parse_elements"])}
 
 
 class TableSummaryNode(BaseNode):
-    def __init__(self, chain: Runnable, system_prompt: str):
+    def __init__(
+        self,
+        chain: Runnable,
+        system_prompt: str,
+        image_preprocessor: ImagePreprocessor | None = None,
+        summary_cache_max_size: int = 1024,
+    ):
+        """TableSummaryNode를 초기화합니다.
+
+        :param image_preprocessor: 테이블 이미지 축소 전처리기, None은 원본 이미지를 모두 요약.
+            셀 값만 다른 테이블을 구분할 수 없으므로 지각 해시 중복 제거는 사용하지 않습니다.
+        :param summary_cache_max_size: (프롬프트, 원본 이미지, 주변 문맥) 기반 요약 캐시의 최대 항목 수
+        """
         self.name = "table_summary_node"
         self.chain = chain
         self.system_prompt = system_prompt
+        self.image_preprocessor = image_preprocessor
+        self.summary_cache = LRUCache(max_size=summary_cache_max_size)
 
-    def _make_batch_data(
-        self, post_parse_elements: list[dict[str, Any]]
-    ) -> list[dict[str, Any]]:
-        """테이블 요약을 위한 배치 데이터 준비."""
+    def _make_batch_data(self, element_index: ElementIndex) -> list[dict[str, Any]]:
+        """테이블 요약을 위한 배치 데이터 준비. 이미지는 요약 직전에 element_index에서 디코딩합니다."""
         data_batches = []
-        for i in range(len(post_parse_elements)):
-            if post_parse_elements[i].get("category") == "table":
-                text = ""
-                if (i > 1) and (i < len(post_parse_elements) - 2):
-                    text += (
-                        post_parse_elements[i - 2].get("content").get("markdown")
-                        + "\n"
-                        + post_parse_elements[i - 1].get("content").get("markdown")
-                        + "\n"
-                        + post_parse_elements[i].get("content").get("markdown")
-                        + "\n"
-                        + post_parse_elements[i + 1].get("content").get("markdown")
-                        + "\n"
-                        + post_parse_elements[i + 2].get("content").get("markdown")
-                    )
-                elif (i > 0) and (i < len(post_parse_elements) - 1):
-                    text += (
-                        post_parse_elements[i - 1].get("content").get("markdown")
-                        + "\n"
-                        + post_parse_elements[i].get("content").get("markdown")
-                        + "\n"
-                        + post_parse_elements[i + 1].get("content").get("markdown")
-                    )
-                else:
-                    text += post_parse_elements[i].get("content").get("markdown")
-                data_batches.append(
-                    {
-                        "system_prompt": self.system_prompt,
-                        "text": text,
-                        "base64_encoding": base64.b64decode(
-                            post_parse_elements[i].get("base64_encoding")
-                        ),
-                        "mime_type": "image/jpeg",
-                        "page": str(post_parse_elements[i].get("page")),
-                    }
-                )
+        for i in element_index.offsets("table"):
+            data_batches.append(
+                {
+                    "system_prompt": self.system_prompt,
+                    "text": element_index.context(i),
+                    "element_offset": i,
+                    "mime_type": "image/jpeg",
+                    "page": str(element_index.elements[i].get("page")),
+                }
+            )
         if len(data_batches) == 0:
             return []
         else:
@@ -225,23 +434,39 @@ class TableSummaryNode(BaseNode):
             logger.info(f"TableSummary data batches length: {len(data_batches)}")
             return data_batches
 
-    async def execute(self, state: ParseState) -> AsyncGenerator[ParseState, None]:
-        post_parse_elements = state["post_parse_elements"]
-        data_batches = self._make_batch_data(post_parse_elements)
+    async def asummarize(
+        self,
+        elements: list[dict[str, Any]],
+        element_index: ElementIndex | None = None,
+    ) -> list[dict[str, Any]]:
+        """요소 중 테이블에 대한 요약을 생성합니다. element_index가 없으면 새로 만듭니다."""
+        if element_index is None:
+            element_index = ElementIndex(elements)
+        data_batches = self._make_batch_data(element_index)
         if len(data_batches) == 0:
             logger.warning("TableSummary data batches is empty")
-            yield {"table_summary": []}
-        else:
-            llm_results = await self.chain.ainvoke(data_batches)
-            result = []
-            for data_batch, llm_result in zip(data_batches, llm_results, strict=False):
-                result.append(
-                    {
-                        "page": data_batch.get("page"),
-                        "table_raw": data_batch.get("text"),
-                        "table_summary": llm_result.content,
-                    }
-                )
-            logger.debug(f"TableSummary result sample: {result[0]}")
-            logger.info(f"TableSummary result length: {len(result)}")
-            yield {"table_summary": result}
+            return []
+
+        summaries = await _asummarize_images(
+            self.chain,
+            data_batches,
+            element_index,
+            self.image_preprocessor,
+            self.summary_cache,
+            dedup_similar=False,
+        )
+        result = []
+        for data_batch, summary in zip(data_batches, summaries, strict=False):
+            result.append(
+                {
+                    "page": data_batch.get("page"),
+                    "table_raw": data_batch.get("text"),
+                    "table_summary": summary,
+                }
+            )
+        logger.debug(f"TableSummary result sample: {result[0]}")
+        logger.info(f"TableSummary result length: {len(result)}")
+        return result
+
+    async def execute(self, state: ParseState) -> AsyncGenerator[ParseState, None]:
+        yield {"table_summary": await self.asummarize(state["post_parse_elements"])}
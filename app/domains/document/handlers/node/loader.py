@@ -1,52 +1,184 @@
 import asyncio
+import contextlib
 import os
+import tempfile
 from collections.abc import AsyncGenerator
 from urllib.parse import urlparse
 
-import aiohttp
 import pymupdf
 
+from app.common.downloader import AsyncFileDownloader
 from app.common.logger import logger
 from app.domains.document.handlers.node.base import BaseNode
 from app.domains.document.handlers.node.utils import download_file_to_firebase_url
+from app.domains.document.handlers.split_file_store import SplitFileStore
 from app.domains.document.schemas.state import ParseState
 
 
+def _count_pages(pdf_bytes: bytes) -> int:
+    with pymupdf.open(stream=pdf_bytes, filetype="pdf") as doc:
+        return len(doc)
+
+
+def _parse_page_range(split_filepath: str) -> tuple[int, int]:
+    """####_####로 끝나는 분할 파일명에서 0부터 시작하는 페이지 범위를 읽습니다."""
+    name = os.path.splitext(os.path.basename(split_filepath))[0]
+    start_page, end_page = name[-9:].split("_")
+    return int(start_page), int(end_page)
+
+
 class SplitPDFFilesNode(BaseNode):
-    def __init__(self, batch_size=100, save_dir="./data/tmp", test_page=None):
+    def __init__(
+        self,
+        downloader: AsyncFileDownloader,
+        batch_size=100,
+        save_dir="./data/tmp",
+        test_page=None,
+        in_memory=True,
+        spool_max_bytes=32 * 1024 * 1024,
+        split_file_store: SplitFileStore | None = None,
+    ):
+        """PDF를 Upstage가 처리할 수 있는 크기(batch_size 페이지)로 분할합니다.
+
+        in_memory 모드에서는 분할 파일을 디스크에 쓰지 않고 split_file_store에 보관한 채 state에는 키만 담아
+        OCR로 전달하며, spool_max_bytes보다 큰 분할 파일만 임시 파일로 내려 메모리 사용량을 제한합니다.
+        임시 파일은 OCR(파이프라인 모드에서는 요약까지)이 성공하면 삭제하고, 실패하면 재개를 위해 남겨 두었다가
+        체크포인트 thread를 삭제하거나 만료될 때 ParsingService가 삭제합니다.
+
+        :param downloader: URL 문서를 임시 파일로 스트리밍 다운로드하는 다운로더 (앱 전체 공유)
+        :param batch_size: 분할 파일 하나의 최대 페이지 수
+        :param save_dir: 분할 파일 저장 디렉토리 (in_memory가 false일 때 사용)
+        :param test_page: 처리할 최대 페이지 수 (None은 제한 없음)
+        :param in_memory: 분할 파일을 메모리에서 바로 OCR로 전달할지 여부
+        :param spool_max_bytes: in_memory 모드에서 메모리에 보관할 분할 파일의 최대 크기
+        :param split_file_store: 분할 파일 바이트 저장소 (upstage_parse_node와 공유, in_memory 모드에서 필수)
+        """
+        if in_memory and split_file_store is None:
+            raise ValueError("in_memory 모드에는 split_file_store가 필요합니다.")
         self.name = "split_pdf_files_node"
+        self.downloader = downloader
         self.batch_size = batch_size
         self.save_dir = save_dir
         self.test_page = test_page
+        self.in_memory = in_memory
+        self.spool_max_bytes = spool_max_bytes
+        self.split_file_store = split_file_store
 
-    def _save_split_pdf(
-        self, input_doc: pymupdf.Document, start: int, end: int, output_path: str
-    ):
-        """주어진 범위의 페이지를 새 PDF 파일로 저장하는 함수."""
+    def _split_pdf(
+        self,
+        source_pdf_bytes: bytes,
+        start: int,
+        end: int,
+        output_path: str | None = None,
+    ) -> bytes | None:
+        """주어진 범위의 페이지를 새 PDF로 만드는 함수.
+
+        pymupdf.Document는 스레드 간에 공유할 수 없으므로, 작업마다 원본 바이트로 문서를 따로 엽니다.
+        output_path가 주어지면 파일로 저장하고, 없으면 분할된 PDF 바이트를 반환합니다.
+        OCR 캐시 키가 분할 PDF 바이트의 해시이므로, 같은 입력이면 항상 같은 바이트가 나오도록
+        새 trailer /ID를 만들지 않습니다(no_new_id).
+        """
+        label = output_path or f"memory_{start:04d}_{end:04d}"
         try:
-            # 페이지 번호 유효성 검사 추가
-            num_pages = len(input_doc)
-            if not (0 <= start <= end < num_pages):
-                logger.error(
-                    f"잘못된 페이지 범위: start={start}, end={end}, num_pages={num_pages}"
-                )
-                # 유효하지 않은 범위에 대한 예외 발생 또는 처리 로직 추가 가능
-                raise ValueError(
-                    f"Invalid page range: start={start}, end={end}, num_pages={num_pages}"
-                )
+            with pymupdf.open(stream=source_pdf_bytes, filetype="pdf") as input_doc:
+                # 페이지 번호 유효성 검사 추가
+                num_pages = len(input_doc)
+                if not (0 <= start <= end < num_pages):
+                    logger.error(
+                        f"잘못된 페이지 범위: start={start}, end={end}, num_pages={num_pages}"
+                    )
+                    raise ValueError(
+                        f"Invalid page range: start={start}, end={end}, num_pages={num_pages}"
+                    )
 
-            logger.info(f"분할 PDF 생성 시작: {output_path} (페이지 {start+1}-{end+1})")
-            with pymupdf.open() as output_pdf:
-                # 페이지 삽입 (동기 작업)
-                output_pdf.insert_pdf(input_doc, from_page=start, to_page=end)
-                # 파일 저장 (동기 작업 - I/O 발생)
-                output_pdf.save(output_path)
-            logger.info(f"분할 PDF 생성 완료: {output_path}")
+                logger.info(f"분할 PDF 생성 시작: {label} (페이지 {start+1}-{end+1})")
+                with pymupdf.open() as output_pdf:
+                    output_pdf.insert_pdf(input_doc, from_page=start, to_page=end)
+                    if output_path is None:
+                        split_pdf_bytes = output_pdf.tobytes(no_new_id=True)
+                    else:
+                        output_pdf.save(output_path, no_new_id=True)
+                        split_pdf_bytes = None
+            logger.info(f"분할 PDF 생성 완료: {label}")
+            return split_pdf_bytes
         except Exception as e:
             # 특정 파일 저장 실패 시 로깅 강화
-            logger.error(f"분할 PDF 저장 실패 ({output_path}): {e}", exc_info=True)
+            logger.error(f"분할 PDF 저장 실패 ({label}): {e}", exc_info=True)
             raise
 
+    def _spool_split_pdf(
+        self, split_pdf_bytes: bytes, basename: str, start: int, end: int
+    ) -> str:
+        """메모리에 두기에 큰 분할 PDF를 임시 파일로 저장하고 경로를 반환합니다.
+
+        파일명은 페이지 범위(####_####)로 끝나도록 만들어 upstage_parse_node가 페이지 번호를 계산할 수 있게 합니다.
+        """
+        fd, temp_filepath = tempfile.mkstemp(
+            prefix=f"{basename}_", suffix=f"_{start:04d}_{end:04d}.pdf"
+        )
+        with os.fdopen(fd, "wb") as f:
+            f.write(split_pdf_bytes)
+        return temp_filepath
+
+    async def _aload_cleaned_pdf(self, filepath: str) -> bytes:
+        """URL 또는 로컬 경로의 PDF를 열어 정리(garbage collection, deflate)한 바이트를 반환합니다."""
+        original_pdf = None
+        downloaded_filepath = None
+        try:
+            if urlparse(filepath).scheme in ("http", "https"):
+                # 원본 PDF를 메모리에 모두 올리지 않고 임시 파일로 스트리밍 다운로드
+                logger.info(f"URL에서 PDF 다운로드 시작: {filepath}")
+                downloaded_filepath = await self.downloader.download(filepath)
+                original_pdf = await asyncio.to_thread(
+                    pymupdf.open, downloaded_filepath, filetype="pdf"
+                )
+                logger.info(f"URL에서 PDF 다운로드 완료: {downloaded_filepath}")
+            else:
+                original_pdf = await asyncio.to_thread(pymupdf.open, filepath)
+                logger.info(f"로컬 PDF 파일 열기 완료: {filepath}")
+
+            # NOTE: 새 trailer /ID를 만들면 실행할 때마다 바이트가 달라져 OCR 캐시가 적중하지 않음
+            logger.info(f"PDF 정리 시작 (메모리): {filepath}")
+            cleaned_pdf_bytes = await asyncio.to_thread(
+                original_pdf.tobytes, garbage=4, deflate=True, no_new_id=True
+            )
+            await asyncio.to_thread(original_pdf.close)
+            logger.info(f"PDF 정리 완료 (메모리): {len(cleaned_pdf_bytes)} bytes")
+            return cleaned_pdf_bytes
+        finally:
+            # 원본 PDF 닫기 (정리 도중 실패한 경우)
+            if original_pdf is not None and not original_pdf.is_closed:
+                await asyncio.to_thread(original_pdf.close)
+            # 다운로드한 임시 파일 삭제
+            if downloaded_filepath is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(downloaded_filepath)
+
+    async def arestore_split_files(
+        self, filepath: str, split_file_keys: dict[str, str]
+    ):
+        """저장소에서 사라진 분할 파일(프로세스 재시작 등)을 원본 PDF에서 다시 만들어 같은 키로 저장합니다.
+
+        분할 결과는 결정적이므로(no_new_id) 다시 만든 바이트는 처음 분할한 바이트와 같고 OCR 캐시도 그대로 적중합니다.
+
+        Args:
+            filepath: 원본 PDF 경로 또는 URL
+            split_file_keys: 다시 만들 분할 파일 경로와 저장소 키
+        """
+        cleaned_pdf_bytes = await self._aload_cleaned_pdf(filepath)
+
+        async def _arestore(split_filepath: str, key: str):
+            start_page, end_page = _parse_page_range(split_filepath)
+            split_pdf_bytes = await asyncio.to_thread(
+                self._split_pdf, cleaned_pdf_bytes, start_page, end_page
+            )
+            self.split_file_store.put(key, split_pdf_bytes)
+
+        await asyncio.gather(
+            *(_arestore(path, key) for path, key in split_file_keys.items())
+        )
+        logger.info(f"분할 파일 {len(split_file_keys)}개 복원 완료: {filepath}")
+
     async def execute(self, state: ParseState) -> AsyncGenerator[ParseState, None]:
         """입력 PDF를 여러 개의 작은 PDF 파일로 분할합니다. Upstage가 지원하는 파일의 페이지 수는 100 페이지 이하입니다."""
         ext = state["ext"]
@@ -54,54 +186,26 @@ class SplitPDFFilesNode(BaseNode):
         save_dir = self.save_dir
         file_name = state["file_name"]
         if ext == "pdf":
-            input_pdf = None
-            original_pdf = None
-
             output_files = []
+            split_file_keys = {}
+            split_temp_filepaths = []
             try:
-                # URL인지 파일 경로인지 확인
-                parsed_url = urlparse(filepath)
-                is_url = parsed_url.scheme in ("http", "https")
-
-                if is_url:
-                    logger.info(f"URL에서 PDF 다운로드 시작: {filepath}")
-                    async with (
-                        aiohttp.ClientSession() as session,
-                        session.get(filepath) as response,
-                    ):
-                        response.raise_for_status()
-                        pdf_content = await response.read()
-                        original_pdf = await asyncio.to_thread(
-                            pymupdf.open, stream=pdf_content, filetype="pdf"
-                        )
-                    logger.info(f"URL에서 PDF 다운로드 완료: {len(pdf_content)} bytes")
-                else:
-                    # 1. 원본 PDF 열기
-                    original_pdf = await asyncio.to_thread(pymupdf.open, filepath)
-                    logger.info(f"로컬 PDF 파일 열기 완료: {filepath}")
-
-                # 2. PDF 정리 (메모리 내에서 수행)
-                logger.info(f"PDF 정리 시작 (메모리): {filepath}")
-                cleaned_pdf_bytes = await asyncio.to_thread(
-                    original_pdf.tobytes, garbage=4, deflate=True
-                )
-                await asyncio.to_thread(original_pdf.close)
-                logger.info(f"PDF 정리 완료 (메모리): {len(cleaned_pdf_bytes)} bytes")
+                # 1. 원본 PDF 열기 및 정리 (메모리 내에서 수행)
+                cleaned_pdf_bytes = await self._aload_cleaned_pdf(filepath)
 
-                # 3. 정리된 PDF를 메모리에서 바로 열기
-                input_pdf = await asyncio.to_thread(
-                    pymupdf.open, stream=cleaned_pdf_bytes
-                )
-                num_pages = await asyncio.to_thread(len, input_pdf)
+                # 2. 페이지 수 확인 (분할 작업은 정리된 PDF 바이트로 각자 문서를 열어 수행)
+                num_pages = await asyncio.to_thread(_count_pages, cleaned_pdf_bytes)
                 logger.info(f"정리된 PDF 페이지 수: {num_pages}")
 
                 if self.test_page is not None and self.test_page < num_pages:
                     num_pages = self.test_page
                     logger.info(f"테스트 페이지 제한 적용: {num_pages} 페이지만 처리")
 
-                # 4. PDF 분할 작업 생성
+                # 3. PDF 분할 작업 생성
                 split_tasks = []
-                if is_url:
+                page_ranges = []
+                parsed_url = urlparse(filepath)
+                if parsed_url.scheme in ("http", "https"):
                     filename = os.path.basename(parsed_url.path)
                     input_file_basename = os.path.splitext(filename)[0]
                 else:
@@ -115,35 +219,65 @@ class SplitPDFFilesNode(BaseNode):
                         f"{input_file_basename}_{start_page:04d}_{end_page:04d}.pdf"
                     )
                     output_files.append(os.path.join(save_dir, output_file))
+                    page_ranges.append((start_page, end_page))
                     split_tasks.append(
                         asyncio.to_thread(
-                            self._save_split_pdf,
-                            input_pdf,
+                            self._split_pdf,
+                            cleaned_pdf_bytes,
                             start_page,
                             end_page,
-                            os.path.join(save_dir, output_file),
+                            None if self.in_memory else output_files[-1],
                         )
                     )
 
-                # 5. 분할 작업 동시 실행
-                await asyncio.gather(*split_tasks)
+                # 4. 분할 작업 동시 실행
+                split_results = await asyncio.gather(*split_tasks)
                 logger.info(f"총 {len(output_files)}개의 파일로 분할 완료.")
 
+                # 5. in_memory 모드: 작은 분할 파일은 저장소에 두고 state에는 키만 담으며, 큰 파일만 임시 파일로 저장
+                # NOTE: 바이트를 state에 담으면 checkpointer가 superstep마다 분할 PDF 전체를 직렬화함
+                if self.in_memory:
+                    for i, (split_pdf_bytes, (start_page, end_page)) in enumerate(
+                        zip(split_results, page_ranges, strict=True)
+                    ):
+                        if len(split_pdf_bytes) <= self.spool_max_bytes:
+                            key = self.split_file_store.new_key()
+                            self.split_file_store.put(key, split_pdf_bytes)
+                            split_file_keys[output_files[i]] = key
+                            continue
+                        output_files[i] = await asyncio.to_thread(
+                            self._spool_split_pdf,
+                            split_pdf_bytes,
+                            input_file_basename,
+                            start_page,
+                            end_page,
+                        )
+                        split_temp_filepaths.append(output_files[i])
+                    logger.info(
+                        f"메모리 전달 {len(split_file_keys)}개, 임시 파일 {len(split_temp_filepaths)}개"
+                    )
+
             except Exception as e:
                 logger.error(f"PDF 분할 중 오류 발생: {e}", exc_info=True)
+                if split_file_keys:
+                    self.split_file_store.discard(split_file_keys.values())
+                for temp_filepath in split_temp_filepaths:
+                    with contextlib.suppress(OSError):
+                        os.remove(temp_filepath)
                 raise
-            finally:
-                # 6. PDF 파일 닫기
-                if input_pdf:
-                    await asyncio.to_thread(input_pdf.close)
-                    logger.info("PDF 파일 닫기 완료")
 
-            yield {"split_filepaths": output_files}
+            yield {
+                "split_filepaths": output_files,
+                "split_file_keys": split_file_keys,
+                "split_temp_filepaths": split_temp_filepaths,
+            }
         else:
             if filepath.startswith(("http://", "https://")):
                 temp_file_path = f"{save_dir}/{file_name}"
                 logger.info(f"Downloading file: {filepath} to {temp_file_path}")
-                response = await download_file_to_firebase_url(filepath, temp_file_path)
+                response = await download_file_to_firebase_url(
+                    filepath, temp_file_path, self.downloader
+                )
                 if response:
                     logger.info(f"File downloaded successfully: {response}")
                     yield {"split_filepaths": [response]}
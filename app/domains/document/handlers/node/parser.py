@@ -1,27 +1,71 @@
 import asyncio
+import contextlib
 import json
 import os
+import random
 import time
 from collections.abc import AsyncGenerator
 
-import requests
+import httpx
 
 from app.common.logger import logger
+from app.common.metrics import LatencyMetrics
+from app.common.rate_limiter import AsyncRateLimiter
 from app.domains.document.handlers.node.base import BaseNode
+from app.domains.document.handlers.ocr_cache import DiskOCRCache
+from app.domains.document.handlers.split_file_store import SplitFileStore
 from app.domains.document.schemas.state import ParseState
 
+UPSTAGE_DOCUMENT_DIGITIZATION_URL = "https://api.upstage.ai/v1/document-digitization"
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
 
 class UpstageParseNode(BaseNode):
-    def __init__(self, api_key, is_save=False):
+    def __init__(
+        self,
+        api_key,
+        is_save=False,
+        max_concurrency=4,
+        requests_per_minute=60,
+        request_timeout=300,
+        max_retries=4,
+        backoff_base_seconds=1.0,
+        ocr_cache: DiskOCRCache | None = None,
+        split_file_store: SplitFileStore | None = None,
+    ):
         """Upstage Layout OCR.
 
+        분할된 PDF 파일마다 병렬로 실행되므로, 노드 인스턴스(앱 전체에서 공유)에서
+        동시 요청 수와 분당 요청 수를 제한합니다.
+        HTTP 연결은 keep-alive 연결 풀(httpx.AsyncClient)을 재사용하며, 429/5xx 응답과 네트워크 오류는
+        jitter가 적용된 지수 백오프로 재시도합니다. 호출별 지연 시간은 metrics에 집계됩니다.
+        ocr_cache가 주어지면 (PDF 바이트, config) 해시로 결과를 캐시하고, 캐시 적중 시 API를 호출하지 않습니다.
+
         :param api_key: Upstage API 인증을 위한 API 키
+        :param is_save: OCR 결과 JSON 저장 여부
+        :param max_concurrency: Upstage API 동시 요청 수 (연결 풀 크기)
+        :param requests_per_minute: Upstage API 분당 요청 수
+        :param request_timeout: 요청 한 번의 제한 시간(초)
+        :param max_retries: 재시도 가능한 오류의 최대 재시도 횟수
+        :param backoff_base_seconds: 재시도 대기 시간의 기준값(초)
+        :param ocr_cache: OCR 결과 디스크 캐시. None이면 캐시를 사용하지 않습니다.
+        :param split_file_store: 메모리 분할 파일 저장소 (split_pdf_files_node와 공유)
 
         config 참고: https://docs.upstage.ai/reference/document-digitization
         """
         self.name = "upstage_parse_node"
         self.api_key = api_key
         self.is_save = is_save
+        self.max_concurrency = max_concurrency
+        self.request_timeout = request_timeout
+        self.max_retries = max_retries
+        self.backoff_base_seconds = backoff_base_seconds
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._rate_limiter = AsyncRateLimiter(capacity=requests_per_minute)
+        self._client: httpx.AsyncClient | None = None
+        self.metrics = LatencyMetrics()
+        self.ocr_cache = ocr_cache
+        self.split_file_store = split_file_store
         self.config = {
             "model": "document-parse",
             "chart_recognition": True,
@@ -31,45 +75,106 @@ class UpstageParseNode(BaseNode):
             "base64_encoding": "['figure', 'chart', 'table']",
         }
 
-    def _upstage_ocr_sync(self, input_filepath: str) -> dict:
+    def _get_client(self) -> httpx.AsyncClient:
+        """keep-alive 연결 풀을 사용하는 HTTP 클라이언트를 반환합니다. 처음 호출할 때 생성합니다."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=httpx.Timeout(self.request_timeout, connect=10),
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+            )
+        return self._client
+
+    async def aclose(self):
+        """HTTP 연결 풀을 닫습니다."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_retry_delay(self, attempt: int, response: httpx.Response | None) -> float:
+        """Retry-After 헤더가 있으면 따르고, 없으면 full jitter 지수 백오프 대기 시간을 계산합니다."""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                return float(retry_after)
+        return random.uniform(0, self.backoff_base_seconds * 2**attempt)
+
+    async def _upstage_ocr(
+        self, input_filepath: str, input_bytes: bytes | None = None
+    ) -> tuple[dict, int]:
         """Upstage의 OCR API를 호출하여 이미지 분석을 수행합니다.
 
-        :param input_filepath: 분석할 PDF 파일 경로
-        :return: 분석 결과 (JSON 딕셔너리)
+        input_bytes가 주어지면 메모리의 PDF를 그대로 전송하고,
+        없으면 파일을 메모리에 모두 읽지 않고 multipart 본문으로 스트리밍하여 전송합니다.
+        재시도도 API 요청이므로 시도할 때마다 분당 요청 수 제한을 거칩니다.
+
+        :param input_filepath: 분석할 PDF 파일 경로 (input_bytes가 있으면 파일명으로만 사용)
+        :param input_bytes: 메모리로 전달된 PDF 바이트
+        :return: 분석 결과 (JSON 딕셔너리)와 시도 횟수
         """
-        # API 요청 헤더 설정
-        headers = {"Authorization": f"Bearer {self.api_key}"}
-
-        # 분석할 PDF 파일
-        with open(input_filepath, "rb") as doc_file:
-            files = {"document": doc_file}
-
-            # API 요청 보내기
-            response = requests.post(
-                "https://api.upstage.ai/v1/document-digitization",
-                headers=headers,
-                data=self.config,
-                files=files,
+        client = self._get_client()
+        data = {key: str(value) for key, value in self.config.items()}
+        for attempt in range(self.max_retries + 1):
+            response = None
+            await self._rate_limiter.acquire()
+            try:
+                # 분석할 PDF 파일 (재시도 시 처음부터 다시 전송)
+                if input_bytes is not None:
+                    response = await client.post(
+                        UPSTAGE_DOCUMENT_DIGITIZATION_URL,
+                        data=data,
+                        files={
+                            "document": (
+                                os.path.basename(input_filepath),
+                                input_bytes,
+                                "application/pdf",
+                            )
+                        },
+                    )
+                else:
+                    with open(input_filepath, "rb") as doc_file:
+                        response = await client.post(
+                            UPSTAGE_DOCUMENT_DIGITIZATION_URL,
+                            data=data,
+                            files={"document": doc_file},
+                        )
+                if response.status_code == 200:
+                    return response.json(), attempt + 1
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    logger.error(
+                        f"Upstage OCR API 요청 실패. 상태 코드: {response.text}"
+                    )
+                    raise ValueError(
+                        f"Upstage OCR API 요청 실패. 상태 코드: {response.text}"
+                    )
+                error = f"HTTP {response.status_code}"
+            except httpx.TransportError as e:
+                error = repr(e)
+
+            if attempt == self.max_retries:
+                raise ValueError(
+                    f"Upstage OCR API 요청 실패. {attempt + 1}회 시도: {error}"
+                )
+            delay = self._get_retry_delay(attempt, response)
+            logger.warning(
+                f"Upstage OCR API 요청 재시도 ({attempt + 1}/{self.max_retries}, {delay:.1f}초 후): {error}"
             )
+            await asyncio.sleep(delay)
 
-        # API 응답 처리 및 결과 저장
-        if response.status_code == 200:
-            # 분석 결과를 저장할 JSON 파일 경로 생성
-            output_file = os.path.splitext(input_filepath)[0] + ".json"
-            parsed_json = response.json()
-            if self.is_save:
-                # 분석 결과를 저장할 JSON 파일 경로 생성
-                try:
-                    with open(output_file, "w") as f:
-                        # ensure_ascii=False로 설정하여 한글이 제대로 저장되도록 함
-                        json.dump(parsed_json, f, ensure_ascii=False, indent=4)
-                    logger.info(f"Upstage OCR API 요청 성공. 결과 저장: {output_file}")
-                except Exception as e:
-                    logger.error(f"Upstage OCR API 요청 성공. 결과 저장 실패: {e}")
-            return parsed_json
-        else:
-            logger.error(f"Upstage OCR API 요청 실패. 상태 코드: {response.text}")
-            raise ValueError(f"Upstage OCR API 요청 실패. 상태 코드: {response.text}")
+    def _save_result(self, input_filepath: str, parsed_json: dict):
+        # 분석 결과를 저장할 JSON 파일 경로 생성
+        output_file = os.path.splitext(input_filepath)[0] + ".json"
+        try:
+            os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+            with open(output_file, "w") as f:
+                # ensure_ascii=False로 설정하여 한글이 제대로 저장되도록 함
+                json.dump(parsed_json, f, ensure_ascii=False, indent=4)
+            logger.info(f"Upstage OCR API 요청 성공. 결과 저장: {output_file}")
+        except Exception as e:
+            logger.error(f"Upstage OCR API 요청 성공. 결과 저장 실패: {e}")
 
     def parse_start_end_page(self, filepath):
         # 파일명에서 페이지 번호 추출 (예: WorldEnergyOutlook2024_0040_0049.pdf)
@@ -107,18 +212,94 @@ class UpstageParseNode(BaseNode):
         except (IndexError, ValueError):
             return (-1, -1)
 
-    async def execute(self, state: ParseState) -> AsyncGenerator[ParseState, None]:
+    async def _parse(
+        self, filepath: str, file_bytes: bytes | None
+    ) -> tuple[dict, float, int, bool]:
+        """캐시를 먼저 조회하고, 없으면 Upstage OCR을 호출합니다.
+
+        :return: 분석 결과, API 호출 지연 시간, 시도 횟수, 캐시 적중 여부
+        """
+        cache_key = None
+        parsed_json = None
+        if self.ocr_cache is not None:
+            cache_key = await self.ocr_cache.akey(
+                file_bytes if file_bytes is not None else filepath, self.config
+            )
+            parsed_json = await self.ocr_cache.aget(cache_key)
+
+        if parsed_json is not None:
+            latency, attempts, cache_hit = 0.0, 0, True
+            logger.info(
+                f"Upstage OCR 캐시 적중: {filepath} (누적 {self.ocr_cache.stats()})"
+            )
+        else:
+            cache_hit = False
+            # 동시 요청 수 제한 (분당 요청 수는 _upstage_ocr에서 시도마다 제한)
+            async with self._semaphore:
+                call_start_time = time.perf_counter()
+                try:
+                    parsed_json, attempts = await self._upstage_ocr(
+                        filepath, file_bytes
+                    )
+                except Exception:
+                    self.metrics.record(
+                        time.perf_counter() - call_start_time, success=False
+                    )
+                    raise
+            latency = time.perf_counter() - call_start_time
+            self.metrics.record(latency, success=True, attempts=attempts)
+            logger.info(
+                f"Upstage OCR 호출 완료: {latency:.2f}초, {attempts}회 시도 (누적 {self.metrics.snapshot()})"
+            )
+            if cache_key is not None:
+                try:
+                    await self.ocr_cache.aput(cache_key, parsed_json)
+                except OSError as e:
+                    logger.warning(f"Upstage OCR 결과 캐시 저장 실패: {e}")
+            if self.is_save:
+                await asyncio.to_thread(self._save_result, filepath, parsed_json)
+
+        return parsed_json, latency, attempts, cache_hit
+
+    def release_working_file(self, state: ParseState):
+        """작업이 끝난 분할 파일을 정리합니다. 저장소의 바이트를 비우고, 크기 때문에 임시 파일로 저장된 분할 파일은 삭제합니다."""
+        file_key = state.get("working_file_key")
+        if file_key is not None:
+            self.split_file_store.discard([file_key])
+        if state.get("working_file_is_temp"):
+            with contextlib.suppress(OSError):
+                os.remove(state["working_filepath"])
+
+    async def execute(
+        self, state: ParseState, release_working_file: bool = True
+    ) -> AsyncGenerator[ParseState, None]:
         """주어진 입력 파일에 대해 문서 분석을 비동기적으로 실행합니다.
 
+        분할 파일(저장소의 바이트, 임시 파일)은 OCR이 성공한 뒤에만 정리합니다. 실패하면 재개할 때 다시 사용하므로 남겨 두고,
+        체크포인트 thread를 삭제하거나 만료될 때 ParsingService가 정리합니다.
+
         :param state: ParseState 객체
+        :param release_working_file: OCR 성공 후 분할 파일 정리 여부.
+            OCR 뒤에 같은 작업에서 이어지는 단계가 있으면 False로 호출하고, 작업이 끝난 뒤 release_working_file로 정리합니다.
         :return: 분석 결과 딕셔너리
         """
         start_time = time.time()
         filepath = state["working_filepath"]
+        file_key = state.get("working_file_key")
+        file_bytes = None
+        if file_key is not None:
+            file_bytes = self.split_file_store.get(file_key)
+            if file_bytes is None:
+                raise FileNotFoundError(
+                    f"저장소에 분할 파일이 없습니다 (재개 전에 복원 필요): {filepath}"
+                )
         logger.info(f"Start Parsing: {filepath}")
 
-        # 동기 함수를 별도 스레드에서 실행
-        parsed_json = await asyncio.to_thread(self._upstage_ocr_sync, filepath)
+        parsed_json, latency, attempts, cache_hit = await self._parse(
+            filepath, file_bytes
+        )
+        if release_working_file:
+            self.release_working_file(state)
 
         start_page, _ = self.parse_start_end_page(filepath)
         page_offset = start_page - 1 if start_page != -1 else 0
@@ -132,6 +313,9 @@ class UpstageParseNode(BaseNode):
             "api": parsed_json.pop("api"),
             "model": parsed_json.pop("model"),
             "usage": parsed_json.pop("usage"),
+            "latency_seconds": latency,
+            "attempts": attempts,
+            "cache_hit": cache_hit,
         }
 
         duration = time.time() - start_time
@@ -149,7 +333,11 @@ class PostParseNode(BaseNode):
         self.name = "post_parse_node"
 
     def execute(self, state: ParseState):
-        elements_list = state["parse_elements"]
+        # 분할 파일들은 병렬로 OCR되어 완료 순서대로 합쳐지므로 시작 페이지 순으로 정렬
+        elements_list = sorted(
+            state["parse_elements"],
+            key=lambda elements: elements[0]["page"] if elements else 0,
+        )
         id_counter = 0  # ID를 순차적으로 부여하기 위한 카운터
         post_processed_elements = []
 
@@ -165,20 +353,29 @@ class PostParseNode(BaseNode):
         logger.info(f"Total Post-processed Elements: {id_counter}")
 
         pages_count = 0
+        cached_pages_count = 0
         metadata = state["parse_metadata"]
 
         for meta in metadata:
-            for k, v in meta.items():
-                if k == "usage":
-                    pages_count += int(v["pages"])
+            pages = int(meta["usage"]["pages"])
+            # 캐시 적중 시 usage는 최초 호출 기준이므로 실제로 과금되지 않은 페이지로 집계
+            if meta.get("cache_hit"):
+                cached_pages_count += pages
+            else:
+                pages_count += pages
 
         # TODO: OCR 플랫폼 별 비용 계산할 수 있도록 변경
         total_cost = pages_count * 0.01
+        cost_saved = cached_pages_count * 0.01
 
-        logger.info(f"Total Cost: ${total_cost:.2f} / {pages_count} pages")
+        logger.info(
+            f"Total Cost: ${total_cost:.2f} / {pages_count} pages "
+            f"(cache saved: ${cost_saved:.2f} / {cached_pages_count} pages)"
+        )
 
         # 재정렬된 elements를 state에 업데이트
         return {
             "post_parse_elements": post_processed_elements,
             "parse_cost": total_cost,
+            "parse_cost_saved": cost_saved,
         }
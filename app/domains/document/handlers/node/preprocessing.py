@@ -1,15 +1,115 @@
+"""파싱 결과를 Langchain Document로 변환하는 노드 모듈입니다.
+
+페이지 텍스트 분할은 CPU 작업이므로 이벤트 루프 밖에서 실행합니다.
+recursive 전략은 페이지를 묶음 단위로 나누어 프로세스 풀(또는 스레드)에서 분할하고,
+semantic 전략은 모든 페이지의 문장 그룹 임베딩을 배치로 나누어 동시에 요청한 뒤 페이지별 분할에 재사용합니다.
+semantic 전략에서는 최종 청크 임베딩도 함께 계산하여 문서와 함께 저장하고, MilvusIndexer가 다시 임베딩하지 않도록 합니다.
+두 경우 모두 결과는 페이지를 순서대로 분할한 결과와 같습니다.
+
+처리량 벤치마크:
+    python -m app.domains.document.handlers.node.preprocessing --pages 2000 --workers 4
+"""
+
+import asyncio
+import multiprocessing
+import os
 import re
-import unicodedata
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
 
 from langchain_core.documents import Document
-from langchain_experimental.text_splitter import SemanticChunker
+from langchain_core.embeddings import Embeddings
+from langchain_experimental.text_splitter import SemanticChunker, combine_sentences
 from langchain_openai.embeddings import OpenAIEmbeddings
-from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from app.common.logger import logger
 from app.domains.document.handlers.node.base import BaseNode
+from app.domains.document.handlers.text_processing import (
+    get_recursive_splitter,
+    normalize_text,
+)
 from app.domains.document.schemas.state import ParseState
 
+_MIN_SPLIT_LENGTH = 50  # 이보다 짧은 페이지는 분할하지 않음
+_PROCESS_BATCH_SIZE = 64  # 프로세스 풀 작업 하나에 보낼 페이지 수
+_SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+")
+
+
+def _split_processed_text(text_splitter, processed_text: str) -> list[str]:
+    """정규화된 페이지 텍스트를 분할하고 빈 청크를 제거합니다. 짧은 텍스트는 그대로 반환합니다."""
+    if len(processed_text.strip()) < _MIN_SPLIT_LENGTH:
+        return [processed_text] if processed_text.strip() else []
+    chunks = text_splitter.split_text(processed_text)
+    return [chunk.strip() for chunk in chunks if chunk.strip()]
+
+
+def _split_by_sentences(processed_text: str, chunk_size: int) -> list[str]:
+    """문장 단위로 나눈 뒤 chunk_size 글자를 넘지 않는 범위에서 이어 붙입니다."""
+    chunks = []
+    current = ""
+    for sentence in _SENTENCE_SPLIT_PATTERN.split(processed_text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        if current and len(current) + 1 + len(sentence) > chunk_size:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _split_processed_text_with_fallback(
+    text_splitter, processed_text: str, strategy: str, chunk_size: int
+) -> list[str]:
+    """정규화된 텍스트를 분할합니다. 분할에 실패하면 문장 단위로 분할합니다.
+
+    한 페이지의 실패가 다른 페이지에 영향을 주지 않도록 페이지마다 적용합니다.
+    """
+    try:
+        return _split_processed_text(text_splitter, processed_text)
+
+    except Exception as e:
+        logger.warning(f"Text splitting failed with {strategy} strategy: {str(e)}")
+        # 안전한 fallback: 문장 단위 분할
+        return _split_by_sentences(processed_text, chunk_size)
+
+
+def _split_pages_batch(
+    texts: list[str], chunk_size: int, chunk_overlap: int
+) -> list[list[str]]:
+    """프로세스 풀 작업자에서 실행되는 함수입니다. 작업자마다 분할기를 한 번만 생성하여 재사용합니다."""
+    text_splitter = get_recursive_splitter(chunk_size, chunk_overlap)
+    return [
+        _split_processed_text_with_fallback(
+            text_splitter, normalize_text(t), "recursive", chunk_size
+        )
+        for t in texts
+    ]
+
+
+class _PrefetchedEmbeddings(Embeddings):
+    """미리 계산한 임베딩을 반환하는 Embeddings입니다. 없는 텍스트만 원래 임베딩 모델로 계산합니다."""
+
+    def __init__(self, embeddings: Embeddings, vectors: dict[str, list[float]]):
+        self.embeddings = embeddings
+        self.vectors = vectors
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        missing = [text for text in dict.fromkeys(texts) if text not in self.vectors]
+        if missing:
+            self.vectors.update(
+                zip(missing, self.embeddings.embed_documents(missing), strict=True)
+            )
+        return [self.vectors[text] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_documents([text])[0]
+
 
 class LangchainDocumentNode(BaseNode):
     def __init__(
@@ -18,49 +118,50 @@ class LangchainDocumentNode(BaseNode):
         chunk_overlap: int = 100,
         strategy: str = "recursive",  # semantic, recursive
         embedding_model: str = "text-embedding-3-small",
+        num_workers: int = 0,
+        embedding_batch_size: int = 256,
+        embedding_concurrency: int = 4,
+        embedding_persist_max_bytes: int = 8 * 1024 * 1024,
     ):
+        """LangchainDocumentNode를 초기화합니다.
+
+        :param chunk_size: recursive 전략의 청크 크기
+        :param chunk_overlap: recursive 전략의 청크 겹침 크기
+        :param strategy: 분할 전략 (semantic, recursive)
+        :param embedding_model: semantic 전략에서 사용할 OpenAI 임베딩 모델
+        :param num_workers: recursive 전략의 페이지 분할에 사용할 프로세스 수. 0이면 스레드에서 실행합니다.
+        :param embedding_batch_size: semantic 전략에서 임베딩 요청 하나에 담을 문장 그룹 수
+        :param embedding_concurrency: semantic 전략에서 동시에 보낼 최대 임베딩 요청 수
+        :param embedding_persist_max_bytes: semantic 전략에서 문서와 함께 저장할 청크 임베딩의 최대 크기.
+            MongoDB 문서 크기 제한(16MB)을 넘지 않도록 이보다 크면 저장하지 않습니다.
+        """
         self.name = "langchain_document_node"
+        self.strategy = strategy
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.num_workers = num_workers
+        self.embedding_batch_size = embedding_batch_size
+        self.embedding_concurrency = embedding_concurrency
+        self.embedding_model = embedding_model
+        self.embedding_persist_max_bytes = embedding_persist_max_bytes
+        self._executor: ProcessPoolExecutor | None = None
         if strategy == "semantic":
-            self.text_splitter = SemanticChunker(
-                embeddings=OpenAIEmbeddings(model=embedding_model),
-                buffer_size=2,  # 2문장씩 그룹화 (적당한 컨텍스트)
-                breakpoint_threshold_type="percentile",  # 가장 안정적
-                breakpoint_threshold_amount=0.85,  # 조금 더 많이 분할하도록 조정
-                add_start_index=True,  # 위치 정보 유용
-                sentence_split_regex=r"(?<=[.!?])\s+",  # 영어 문장 분할 개선
+            self.text_splitter = self._create_semantic_chunker(
+                OpenAIEmbeddings(model=embedding_model)
             )
         elif strategy == "recursive":
-            self.text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=chunk_size,
-                chunk_overlap=chunk_overlap,
-                keep_separator=False,
-                separators=[
-                    # 큰 구조부터 분할 (overlap이 제대로 작동하도록)
-                    "\n\n\n",  # 큰 섹션 구분 (최우선)
-                    "\n\n",  # 문단 구분 (두 번째 우선)
-                    "\nChapter ",  # 챕터
-                    "\nSection ",  # 섹션
-                    "\nFigure ",  # 그림
-                    "\nTable ",  # 테이블
-                    "\n• ",  # 불릿 포인트
-                    "\n- ",  # 대시 리스트
-                    "\n1. ",  # 숫자 리스트
-                    "\n",  # 일반 줄바꿈
-                    # 문장 구분자는 나중에 (overlap 보장을 위해)
-                    ". ",  # 문장 끝
-                    "! ",  # 감탄문
-                    "? ",  # 의문문
-                    ".\n",  # 줄바꿈이 있는 문장
-                    "!\n",
-                    "?\n",
-                    "; ",  # 세미콜론
-                    ", ",  # 콤마 (마지막 수단)
-                    " ",  # 공백 (최후 수단)
-                    "",  # 문자 (진짜 마지막)
-                ],
-                length_function=len,
-                is_separator_regex=False,
-            )
+            self.text_splitter = get_recursive_splitter(chunk_size, chunk_overlap)
+
+    @staticmethod
+    def _create_semantic_chunker(embeddings: Embeddings) -> SemanticChunker:
+        return SemanticChunker(
+            embeddings=embeddings,
+            buffer_size=2,  # 2문장씩 그룹화 (적당한 컨텍스트)
+            breakpoint_threshold_type="percentile",  # 가장 안정적
+            breakpoint_threshold_amount=0.85,  # 조금 더 많이 분할하도록 조정
+            add_start_index=True,  # 위치 정보 유용
+            sentence_split_regex=r"(?<=[.!?])\s+",  # 영어 문장 분할 개선
+        )
 
     def _extract_tag_content(self, content: str, tag: str) -> str | None:
         pattern = rf"<{tag}>(.*?)</{tag}>"
@@ -88,88 +189,213 @@ class LangchainDocumentNode(BaseNode):
         """
         return Document(page_content=content, metadata=metadata)
 
-    def _preprocess_text(self, text: str) -> str:
-        """텍스트 전처리."""
-        # 1. 유니코드 정규화 - 같은 문자를 통일된 방식으로 표현
-        # 예: "café" (e + ´) → "café" (é)
-        text = unicodedata.normalize("NFKC", text)
+    def _split_text_with_strategy(self, text: str) -> list[str]:
+        """텍스트를 전략에 따라 분할합니다 (문장 완성도 보장!)."""
+        # 전처리 적용
+        processed_text = normalize_text(text)
+        return self._split_processed_text_with_fallback(
+            self.text_splitter, processed_text
+        )
 
-        # 2. 연속된 공백 통일
-        # 예: "word    multiple    spaces" → "word multiple spaces"
-        text = re.sub(r" {2,}", " ", text)
+    def _split_processed_text_with_fallback(
+        self, text_splitter, processed_text: str
+    ) -> list[str]:
+        """정규화된 텍스트를 분할합니다. 분할에 실패하면 문장 단위로 분할합니다."""
+        return _split_processed_text_with_fallback(
+            text_splitter, processed_text, self.strategy, self.chunk_size
+        )
 
-        # 3. 연속된 줄바꿈 정리 (보고서에서 자주 발생)
-        # 예: "paragraph\n\n\n\n\nnext" → "paragraph\n\nnext"
-        text = re.sub(r"\n{3,}", "\n\n", text)
+    async def _asplit_pages(
+        self, texts: list[str], vectors: dict[str, list[float]] | None = None
+    ) -> list[list[str]]:
+        """페이지 텍스트 목록을 이벤트 루프 밖에서 분할합니다. 결과 순서는 입력 페이지 순서와 같습니다.
 
-        # 4. 탭을 공백으로 변환
-        # 예: "word\t\ttab\tspaces" → "word  tab spaces"
-        text = text.replace("\t", " ")
+        semantic 전략에서는 계산한 문장 그룹 임베딩을 vectors에 추가합니다.
+        """
+        if self.strategy == "semantic":
+            return await self._asplit_pages_semantic(
+                texts, vectors if vectors is not None else {}
+            )
+        if self.num_workers <= 0 or len(texts) < 2:
+            return await asyncio.to_thread(
+                lambda: [self._split_text_with_strategy(text) for text in texts]
+            )
 
-        # 5. 단일 줄바꿈을 공백으로 변환 (문단 구분은 유지)
-        # 예: "spring\nturnaround season" → "spring turnaround season"
-        # 단, 문단 구분(\n\n)은 유지
-        text = re.sub(r"(?<!\n)\n(?!\n)", " ", text)
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        batch_size = max(
+            1, min(_PROCESS_BATCH_SIZE, -(-len(texts) // self.num_workers))
+        )
+        batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+        try:
+            results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        executor,
+                        _split_pages_batch,
+                        batch,
+                        self.chunk_size,
+                        self.chunk_overlap,
+                    )
+                    for batch in batches
+                )
+            )
+        except BrokenProcessPool as e:
+            # 작업자가 비정상 종료되면 풀을 다시 만들도록 버리고, 이번 요청은 스레드에서 분할
+            logger.warning(
+                f"페이지 분할 프로세스 풀 손상, 다음 요청에서 다시 생성: {e}"
+            )
+            self._discard_executor(executor)
+            return await asyncio.to_thread(
+                lambda: [self._split_text_with_strategy(text) for text in texts]
+            )
+        return [chunks for batch_result in results for chunks in batch_result]
 
-        # 6. 문장 끝 공백 정리 (보고서에서 중요!)
-        # 예: "sentence.   Next sentence" → "sentence. Next sentence"
-        text = re.sub(r"([.!?])\s+", r"\1 ", text)
+    async def _aembed_missing(
+        self, texts: list[str], vectors: dict[str, list[float]]
+    ) -> int:
+        """vectors에 없는 텍스트의 임베딩을 embedding_batch_size개씩 묶어 동시에 요청하고 vectors에 추가합니다.
 
-        # 7. 보고서에서 자주 나오는 특수 공백 문자 제거
-        # Non-breaking space, em space, thin space 등
-        text = re.sub(r"[\u00A0\u2000-\u200B\u2028\u2029]", " ", text)
-        # Zero-width 문자들 (복사-붙여넣기 시 자주 생김)
-        text = re.sub(r"[\u200C\u200D\uFEFF]", "", text)
+        같은 텍스트는 한 번만 요청하며, 동시에 보내는 요청 수는 embedding_concurrency로 제한합니다.
 
-        # 8. 각 줄의 시작/끝 공백 제거 (남은 줄바꿈들에 대해)
-        lines = text.split("\n")
-        lines = [line.strip() for line in lines]
-        text = "\n".join(lines)
+        Returns:
+            int: 보낸 임베딩 요청 수
+        """
+        missing = [text for text in dict.fromkeys(texts) if text not in vectors]
+        batches = [
+            missing[i : i + self.embedding_batch_size]
+            for i in range(0, len(missing), self.embedding_batch_size)
+        ]
+        semaphore = asyncio.Semaphore(self.embedding_concurrency)
+        embeddings = self.text_splitter.embeddings
 
-        # 9. 위 과정에서 생긴 추가 공백들 재정리
-        text = re.sub(r" {2,}", " ", text)
+        async def _aembed(batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                return await embeddings.aembed_documents(batch)
 
-        # 10. 전체 텍스트 양끝 공백 제거
-        text = text.strip()
+        batch_vectors = await asyncio.gather(*(_aembed(batch) for batch in batches))
+        for batch, batch_result in zip(batches, batch_vectors, strict=True):
+            vectors.update(zip(batch, batch_result, strict=True))
+        return len(batches)
 
-        return text
+    async def _asplit_pages_semantic(
+        self, texts: list[str], vectors: dict[str, list[float]]
+    ) -> list[list[str]]:
+        """모든 페이지의 문장 그룹 임베딩을 배치로 동시에 요청한 뒤, 페이지별 분할에 재사용합니다.
 
-    def _split_text_with_strategy(self, text: str) -> list[str]:
-        """텍스트를 전략에 따라 분할합니다 (문장 완성도 보장!)."""
-        # 전처리 적용
-        processed_text = self._preprocess_text(text)
+        SemanticChunker는 페이지마다 임베딩 요청을 한 번씩 순서대로 보내므로,
+        같은 방식으로 문장 그룹을 만들어 중복을 제거하고 embedding_batch_size개씩 묶어 미리 요청합니다.
+        계산한 문장 그룹 임베딩은 vectors에 추가되어 최종 청크 임베딩에도 재사용됩니다.
+        """
+        processed_texts = await asyncio.to_thread(
+            lambda: [normalize_text(text) for text in texts]
+        )
 
-        # 텍스트가 너무 짧으면 그냥 반환
-        if len(processed_text.strip()) < 50:
-            return [processed_text] if processed_text.strip() else []
+        combined_sentences: list[str] = []
+        for processed_text in processed_texts:
+            if len(processed_text.strip()) < _MIN_SPLIT_LENGTH:
+                continue
+            sentences = self.text_splitter._get_single_sentences_list(processed_text)
+            if len(sentences) < 2:
+                continue
+            combined_sentences.extend(
+                sentence["combined_sentence"]
+                for sentence in combine_sentences(
+                    [{"sentence": x, "index": i} for i, x in enumerate(sentences)],
+                    self.text_splitter.buffer_size,
+                )
+            )
 
-        try:
-            # 기본 청킹
-            chunks = self.text_splitter.split_text(processed_text)
+        request_count = await self._aembed_missing(combined_sentences, vectors)
+        logger.info(
+            f"Semantic chunking: {len(texts)} pages, {len(combined_sentences)} sentence groups "
+            f"-> {request_count} embedding requests (concurrency={self.embedding_concurrency})"
+        )
 
-            # 빈 청크 제거 및 후처리
-            chunks = [chunk.strip() for chunk in chunks if chunk.strip()]
-            return chunks
+        text_splitter = self._create_semantic_chunker(
+            _PrefetchedEmbeddings(self.text_splitter.embeddings, vectors)
+        )
 
-        except Exception as e:
+        return await asyncio.to_thread(
+            lambda: [
+                self._split_processed_text_with_fallback(text_splitter, processed_text)
+                for processed_text in processed_texts
+            ]
+        )
+
+    async def _aembed_documents(
+        self, documents: list[Document], vectors: dict[str, list[float]]
+    ) -> dict[str, Any] | None:
+        """최종 청크의 임베딩을 계산하여 인덱싱 단계에서 재사용할 수 있는 형태로 반환합니다.
+
+        청크 분할 중 계산한 문장 그룹 임베딩과 본문이 같은 청크는 다시 요청하지 않습니다.
+        벡터는 SQLiteEmbeddingCache와 같은 float32 바이트로 저장하며, 전체 크기가
+        embedding_persist_max_bytes를 넘으면 저장하지 않고 인덱싱 단계에서 다시 계산하도록 합니다.
+
+        Returns:
+            dict[str, Any] | None: {"model": 임베딩 모델, "vectors": documents와 같은 순서의 벡터 바이트 목록}
+        """
+        texts = [doc.page_content for doc in documents]
+        reused_count = sum(text in vectors for text in dict.fromkeys(texts))
+        request_count = await self._aembed_missing(texts, vectors)
+        encoded_vectors = [array("f", vectors[text]).tobytes() for text in texts]
+        total_bytes = sum(len(vector) for vector in encoded_vectors)
+        logger.info(
+            f"Chunk embeddings: {len(texts)} documents, {reused_count} reused from sentence groups, "
+            f"{request_count} embedding requests ({total_bytes} bytes)"
+        )
+        if total_bytes > self.embedding_persist_max_bytes:
             logger.warning(
-                f"Text splitting failed with {self.strategy} strategy: {str(e)}"
+                f"청크 임베딩 크기({total_bytes} bytes)가 저장 한도({self.embedding_persist_max_bytes} bytes)를 넘어 "
+                "저장하지 않습니다. 인덱싱 단계에서 다시 계산합니다."
+            )
+            return None
+        return {"model": self.embedding_model, "vectors": encoded_vectors}
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """프로세스 풀을 반환합니다. 처음 호출할 때 생성합니다.
+
+        서버 프로세스에는 이미 스레드(gRPC 채널, to_thread 작업자, 로거)가 있으므로, fork하면 자식 프로세스가
+        복사된 잠금에서 멈출 수 있어 spawn으로 작업자를 시작합니다.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.num_workers,
+                mp_context=multiprocessing.get_context("spawn"),
             )
-            # 안전한 fallback: 문장 단위 분할
-            return self._split_by_sentences(processed_text)
+            logger.info(f"페이지 분할 프로세스 풀 생성: workers={self.num_workers}")
+        return self._executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor):
+        """손상된 프로세스 풀을 버립니다. 다른 요청이 이미 새 풀을 만들었다면 그대로 둡니다."""
+        if self._executor is executor:
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def close(self):
+        """프로세스 풀을 종료합니다."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
 
     async def execute(self, state: ParseState):
         logger.info("Start creating documents...")
         filepath = state.get("filepath", None)
         file_name = state.get("file_name", None)
-        page_summary = state.get("page_summary", None)
-        image_summary = state.get("image_summary", None)
-        table_summary = state.get("table_summary", None)
+        # NOTE: 파이프라인 모드에서는 요약이 분할 파일의 완료 순서로 쌓이므로, 실행마다 같은 청크 순서가 되도록
+        # 페이지 순으로 정렬 (같은 페이지 안의 순서는 유지)
+        page_summary, image_summary, table_summary = (
+            sorted(state.get(key) or [], key=lambda summary: int(summary["page"]))
+            for key in ("page_summary", "image_summary", "table_summary")
+        )
 
         all_documents = []
-        for p in page_summary:
-            page_text = p.get("page_raw")
-            splitted_text = self._split_text_with_strategy(page_text)
+        # semantic 전략에서 계산한 임베딩 (텍스트: 벡터), 최종 청크 임베딩에 재사용
+        vectors: dict[str, list[float]] = {}
+        page_chunks = await self._asplit_pages(
+            [p.get("page_raw") for p in page_summary], vectors
+        )
+        for p, splitted_text in zip(page_summary, page_chunks, strict=True):
             for text in splitted_text:
                 all_documents.append(
                     self._create_document(
@@ -278,4 +504,54 @@ class LangchainDocumentNode(BaseNode):
                     )
                 )
         logger.info(f"Created {len(all_documents)} langchain documents")
-        yield {"documents": all_documents}
+        document_embeddings = None
+        if self.strategy == "semantic":
+            document_embeddings = await self._aembed_documents(all_documents, vectors)
+        yield {"documents": all_documents, "document_embeddings": document_embeddings}
+
+
+if __name__ == "__main__":
+    import argparse
+    import random
+    import time
+
+    parser = argparse.ArgumentParser(description="페이지 분할 처리량 벤치마크")
+    parser.add_argument("--pages", type=int, default=2000, help="분할할 페이지 수")
+    parser.add_argument("--words", type=int, default=600, help="페이지당 단어 수")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="프로세스 수"
+    )
+    args = parser.parse_args()
+
+    random.seed(0)
+    vocabulary = [
+        "로봇", "주행", "알람이", "발생했습니다.", "controller", "the", "and",
+        "navigation", "error!", "scheduling?", "12", "3.5%", "-", "•", "Table",
+        "\n", "\n\n", "\t", "\u00a0",
+    ]  # fmt: skip
+    corpus = [
+        " ".join(random.choices(vocabulary, k=args.words)) for _ in range(args.pages)
+    ]
+    total_mb = sum(len(text) for text in corpus) / 1024 / 1024
+
+    def _report(name: str, elapsed: float):
+        print(
+            f"{name:<28} {elapsed:7.3f}s  {args.pages / elapsed:10.1f} pages/s  {total_mb / elapsed:7.2f} MB/s"
+        )
+
+    print(f"pages={args.pages}, words/page={args.words}, size={total_mb:.2f}MB")
+    serial = LangchainDocumentNode(strategy="recursive")
+    start = time.perf_counter()
+    expected = [serial._split_text_with_strategy(text) for text in corpus]
+    _report("serial", time.perf_counter() - start)
+
+    pooled = LangchainDocumentNode(strategy="recursive", num_workers=args.workers)
+    start = time.perf_counter()
+    actual = asyncio.run(pooled._asplit_pages(corpus))
+    _report("process pool (cold start)", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    asyncio.run(pooled._asplit_pages(corpus))
+    _report(f"process pool (workers={args.workers})", time.perf_counter() - start)
+    pooled.close()
+    assert actual == expected, "프로세스 풀 결과가 순차 처리 결과와 다릅니다."
@@ -0,0 +1,137 @@
+"""OCR 결과를 디스크에 보관하는 content-addressed 캐시 모듈입니다.
+
+(분할 PDF 바이트, OCR 옵션)의 SHA-256 해시를 키로 OCR 결과 JSON을 저장하여,
+같은 PDF나 같은 분할 구간을 다시 업로드해도 OCR API를 다시 호출하지 않도록 합니다.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import threading
+
+from app.common.logger import logger
+
+
+class DiskOCRCache:
+    """파일 기반의 크기 제한 LRU OCR 결과 캐시입니다.
+
+    결과 하나를 `{key}.json` 파일 하나로 저장하며, 조회될 때마다 파일 수정 시각을 갱신합니다.
+    저장된 파일 크기의 합이 max_bytes를 넘으면 가장 오래 접근하지 않은 파일부터 삭제합니다.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 1024**3):
+        """DiskOCRCache를 초기화합니다.
+
+        Args:
+            cache_dir (str): 캐시 파일을 저장할 디렉토리입니다.
+            max_bytes (int): 캐시에 보관할 최대 크기(바이트)입니다.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(cache_dir, exist_ok=True)
+        # 파일 목록은 시작할 때 한 번만 읽고 이후에는 메모리에서 크기를 추적
+        self._sizes: dict[str, int] = {}
+        for entry in os.scandir(cache_dir):
+            if entry.is_file() and entry.name.endswith(".json"):
+                self._sizes[entry.name[: -len(".json")]] = entry.stat().st_size
+        self._total_bytes = sum(self._sizes.values())
+        logger.info(
+            f"OCR cache initialized: {cache_dir} "
+            f"({len(self._sizes)} entries, {self._total_bytes} bytes, max_bytes={max_bytes})"
+        )
+
+    @staticmethod
+    def make_key(source: str | bytes, options: dict) -> str:
+        """PDF 바이트와 OCR 옵션으로 캐시 키를 만듭니다.
+
+        source가 파일 경로이면 파일을 청크 단위로 읽어 해싱하고, 바이트이면 그대로 해싱합니다.
+        """
+        digest = hashlib.sha256(
+            json.dumps(options, sort_keys=True, ensure_ascii=False).encode()
+        )
+        digest.update(b"\x00")
+        if isinstance(source, bytes):
+            digest.update(source)
+            return digest.hexdigest()
+        with open(source, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> dict | None:
+        """캐시된 OCR 결과를 조회합니다. 캐시에 없으면 None입니다."""
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                result = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return result
+
+    def put(self, key: str, result: dict):
+        """OCR 결과를 캐시에 저장하고, 필요하면 LRU 정책으로 오래된 항목을 삭제합니다."""
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False)
+        # 다른 요청이 읽는 중에도 완성된 파일만 보이도록 원자적으로 교체
+        os.replace(tmp_path, path)
+        size = os.path.getsize(path)
+        with self._lock:
+            self._total_bytes += size - self._sizes.get(key, 0)
+            self._sizes[key] = size
+            self._evict()
+
+    def _evict(self):
+        """저장된 크기가 max_bytes를 넘으면 가장 오래 접근하지 않은 파일을 삭제합니다."""
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        def _last_access(key: str) -> float:
+            try:
+                return os.path.getmtime(self._path(key))
+            except OSError:
+                return 0.0
+
+        evicted = 0
+        for key in sorted(self._sizes, key=_last_access):
+            if self._total_bytes <= self.max_bytes:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self._path(key))
+            self._total_bytes -= self._sizes.pop(key)
+            evicted += 1
+        logger.info(f"OCR cache evicted {evicted} entries")
+
+    async def akey(self, source: str | bytes, options: dict) -> str:
+        return await asyncio.to_thread(self.make_key, source, options)
+
+    async def aget(self, key: str) -> dict | None:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aput(self, key: str, result: dict):
+        await asyncio.to_thread(self.put, key, result)
+
+    def stats(self) -> dict[str, float]:
+        """캐시 적중 통계를 반환합니다."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "total_bytes": self._total_bytes,
+        }
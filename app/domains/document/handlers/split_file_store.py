@@ -0,0 +1,44 @@
+"""분할 PDF 바이트를 그래프 state 밖에서 보관하는 프로세스 로컬 저장소 모듈입니다.
+
+분할 PDF 바이트를 state나 Send 인자에 담으면 checkpointer가 superstep마다 직렬화하여 저장하므로,
+state에는 키만 두고 바이트는 이 저장소를 통해 주고받습니다.
+프로세스가 재시작되면 내용이 사라지므로, 재개할 때 없는 분할 파일은 SplitPDFFilesNode가 원본에서 다시 만듭니다.
+"""
+
+import threading
+import uuid
+from collections.abc import Iterable
+
+
+class SplitFileStore:
+    """키별로 분할 PDF 바이트를 보관합니다. 분할 노드와 OCR 노드가 같은 인스턴스를 공유해야 합니다."""
+
+    def __init__(self):
+        self._files: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def new_key() -> str:
+        return uuid.uuid4().hex
+
+    def put(self, key: str, data: bytes):
+        with self._lock:
+            self._files[key] = data
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            return self._files.get(key)
+
+    def discard(self, keys: Iterable[str]):
+        """키에 해당하는 바이트를 삭제합니다. 없는 키는 무시합니다."""
+        with self._lock:
+            for key in keys:
+                self._files.pop(key, None)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._files
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._files)
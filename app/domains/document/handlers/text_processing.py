@@ -0,0 +1,166 @@
+"""파싱 결과 텍스트 정규화 및 청크 분할 모듈입니다.
+
+PDF 파싱 결과(LangchainDocumentNode)와 txt 업로드(parse_with_langchain)가 같은 정규화 함수와 분할기를 사용합니다.
+정규식은 모듈을 불러올 때 한 번만 컴파일하고, 분할기는 설정별로 한 번만 생성하여 재사용합니다.
+"""
+
+import functools
+import re
+import unicodedata
+
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+# 문장 끝 뒤 공백을 공백 하나로 정리 (이미 공백 하나인 경우는 제외)
+_SENTENCE_END_PATTERN = re.compile(r"([.!?])(?: \s+|[^\S ]\s*)")
+# 두 개 이상 연속된 줄바꿈 (문단 구분)
+_PARAGRAPH_BREAK_PATTERN = re.compile(r"\n\n+")
+_MULTI_SPACE_PATTERN = re.compile(r"  +")
+# 탭과 보고서에서 자주 나오는 특수 공백 문자는 공백으로, zero-width 문자는 삭제
+# (U+00A0, U+2000~U+200A는 NFKC 정규화에서 이미 공백으로 바뀜)
+# 문자 대부분이 한글인 텍스트에서는 str.translate보다 포함 여부를 확인한 str.replace가 빠름
+_SPACE_REPLACEMENTS = (
+    ("\t", " "),
+    ("\u200b", " "),
+    ("\u2028", " "),
+    ("\u2029", " "),
+    ("\u200c", ""),
+    ("\u200d", ""),
+    ("\ufeff", ""),
+)
+
+RECURSIVE_SEPARATORS = [
+    # 큰 구조부터 분할 (overlap이 제대로 작동하도록)
+    "\n\n\n",  # 큰 섹션 구분 (최우선)
+    "\n\n",  # 문단 구분 (두 번째 우선)
+    "\nChapter ",  # 챕터
+    "\nSection ",  # 섹션
+    "\nFigure ",  # 그림
+    "\nTable ",  # 테이블
+    "\n• ",  # 불릿 포인트
+    "\n- ",  # 대시 리스트
+    "\n1. ",  # 숫자 리스트
+    "\n",  # 일반 줄바꿈
+    # 문장 구분자는 나중에 (overlap 보장을 위해)
+    ". ",  # 문장 끝
+    "! ",  # 감탄문
+    "? ",  # 의문문
+    ".\n",  # 줄바꿈이 있는 문장
+    "!\n",
+    "?\n",
+    "; ",  # 세미콜론
+    ", ",  # 콤마 (마지막 수단)
+    " ",  # 공백 (최후 수단)
+    "",  # 문자 (진짜 마지막)
+]
+
+
+def normalize_text(text: str) -> str:
+    """파싱 결과 텍스트를 정규화합니다.
+
+    1. 유니코드 정규화(NFKC) - 같은 문자를 통일된 방식으로 표현 (예: "e + ´" → "é")
+    2. 문장 끝 공백 정리 (예: "sentence.   Next" → "sentence. Next")
+    3. 두 개 이상 연속된 줄바꿈은 빈 줄 하나(문단 구분)로, 단일 줄바꿈은 공백으로 변환
+    4. 탭/특수 공백 문자는 공백으로, zero-width 문자는 삭제
+    5. 각 줄 시작/끝 공백 제거 후 연속된 공백 통일, 전체 양끝 공백 제거
+    """
+    if not unicodedata.is_normalized("NFKC", text):
+        text = unicodedata.normalize("NFKC", text)
+    text = _SENTENCE_END_PATTERN.sub(r"\1 ", text)
+    text = "\n\n".join(
+        paragraph.replace("\n", " ")
+        for paragraph in _PARAGRAPH_BREAK_PATTERN.split(text)
+    )
+    for old, new in _SPACE_REPLACEMENTS:
+        if old in text:
+            text = text.replace(old, new)
+    # 3번 이후 줄바꿈은 문단 구분(\n\n)으로만 남아 있음
+    text = "\n\n".join(paragraph.strip() for paragraph in text.split("\n\n"))
+    text = _MULTI_SPACE_PATTERN.sub(" ", text)
+    return text.strip()
+
+
+@functools.cache
+def get_recursive_splitter(
+    chunk_size: int = 1000, chunk_overlap: int = 100
+) -> RecursiveCharacterTextSplitter:
+    """문서 구조 구분자를 사용하는 RecursiveCharacterTextSplitter를 반환합니다. 설정별로 한 번만 생성합니다."""
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        keep_separator=False,
+        separators=RECURSIVE_SEPARATORS,
+        length_function=len,
+        is_separator_regex=False,
+    )
+
+
+if __name__ == "__main__":
+    import argparse
+    import random
+    import time
+
+    parser = argparse.ArgumentParser(description="텍스트 정규화/분할 처리량 벤치마크")
+    parser.add_argument("--pages", type=int, default=2000, help="정규화할 페이지 수")
+    parser.add_argument("--words", type=int, default=400, help="페이지당 단어 수")
+    args = parser.parse_args()
+
+    def _legacy_preprocess_text(text: str) -> str:
+        """기존 LangchainDocumentNode._preprocess_text 구현 (비교용)."""
+        text = unicodedata.normalize("NFKC", text)
+        text = re.sub(r" {2,}", " ", text)
+        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = text.replace("\t", " ")
+        text = re.sub(r"(?<!\n)\n(?!\n)", " ", text)
+        text = re.sub(r"([.!?])\s+", r"\1 ", text)
+        text = re.sub(r"[\u00A0\u2000-\u200B\u2028\u2029]", " ", text)
+        text = re.sub(r"[\u200C\u200D\uFEFF]", "", text)
+        lines = text.split("\n")
+        lines = [line.strip() for line in lines]
+        text = "\n".join(lines)
+        text = re.sub(r" {2,}", " ", text)
+        return text.strip()
+
+    random.seed(0)
+    vocabulary = [
+        "로봇", "주행", "알람이", "발생했습니다.", "controller", "the", "and",
+        "navigation", "error!", "scheduling?", "12", "3.5%", "-", "•", "Table",
+        " ", "  ", "\t", "\n", "\n\n", "\n\n\n\n", "\u00a0", "\u200b", "\ufeff", "\ufb01",
+    ]  # fmt: skip
+    corpus = [
+        " ".join(random.choices(vocabulary, k=args.words)) for _ in range(args.pages)
+    ]
+    total_mb = sum(len(text) for text in corpus) / 1024 / 1024
+
+    def _report(name: str, elapsed: float):
+        print(
+            f"{name:<28} {elapsed:7.3f}s  {args.pages / elapsed:10.1f} pages/s  {total_mb / elapsed:7.2f} MB/s"
+        )
+
+    print(f"pages={args.pages}, words/page={args.words}, size={total_mb:.2f}MB")
+    start = time.perf_counter()
+    expected = [_legacy_preprocess_text(text) for text in corpus]
+    _report("legacy normalize", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    actual = [normalize_text(text) for text in corpus]
+    _report("normalize_text", time.perf_counter() - start)
+    assert actual == expected, "normalize_text 결과가 기존 구현과 다릅니다."
+
+    def _legacy_splitter() -> RecursiveCharacterTextSplitter:
+        return RecursiveCharacterTextSplitter(
+            chunk_size=1000,
+            chunk_overlap=100,
+            keep_separator=False,
+            separators=list(RECURSIVE_SEPARATORS),
+            length_function=len,
+            is_separator_regex=False,
+        )
+
+    start = time.perf_counter()
+    expected_chunks = [_legacy_splitter().split_text(text) for text in expected]
+    _report("legacy split (per call)", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    actual_chunks = [get_recursive_splitter().split_text(text) for text in actual]
+    _report("shared splitter", time.perf_counter() - start)
+    assert actual_chunks == expected_chunks, "분할 결과가 기존 구현과 다릅니다."
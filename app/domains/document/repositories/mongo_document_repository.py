@@ -31,8 +31,10 @@ class MongoDocumentRepository(IDocumentRepository, MongoBaseRepository[MongoDocu
         )
 
     async def find_by_id(self, document_id: str) -> MongoDocument | None:
-        """ID로 문서를 찾습니다."""
-        document = await self.collection.find_one({"_id": document_id})
+        """ID로 문서를 찾습니다. 크기가 큰 청크 임베딩(embeddings)은 조회하지 않습니다."""
+        document = await self.collection.find_one(
+            {"_id": document_id}, {"embeddings": 0}
+        )
         if not document:
             logger.warning(f"Document not found: {document_id}")
             return None
@@ -40,25 +42,34 @@ class MongoDocumentRepository(IDocumentRepository, MongoBaseRepository[MongoDocu
         document["document_id"] = document_id
         return MongoDocument.model_validate(document) if document else None
 
-    async def find_by_user_id(self, user_id: str) -> list[MongoDocument]:
-        """User ID로 문서를 찾습니다."""
-        documents = await self.collection.find({"user_id": user_id}).to_list(
-            length=None
+    @staticmethod
+    def _to_domain(doc: dict) -> MongoDocument:
+        return MongoDocument(
+            document_id=doc.pop("_id"),
+            title=doc.pop("title"),
+            summary=doc.pop("summary"),
+            content=doc.pop("content"),
+            embeddings=doc.pop("embeddings", None),
+            document_url=doc.pop("document_url"),
+            user_id=doc.pop("user_id"),
+            updated_at=doc.pop("updated_at"),
         )
-        results = []
-        for doc in documents:
-            results.append(
-                MongoDocument(
-                    document_id=doc.pop("_id"),
-                    title=doc.pop("title"),
-                    summary=doc.pop("summary"),
-                    content=doc.pop("content"),
-                    document_url=doc.pop("document_url"),
-                    user_id=doc.pop("user_id"),
-                    updated_at=doc.pop("updated_at"),
-                )
-            )
-        return results
+
+    async def find_by_user_id(self, user_id: str) -> list[MongoDocument]:
+        """User ID로 문서를 찾습니다. 크기가 큰 청크 임베딩(embeddings)은 조회하지 않습니다."""
+        documents = await self.collection.find(
+            {"user_id": user_id}, {"embeddings": 0}
+        ).to_list(length=None)
+        return [self._to_domain(doc) for doc in documents]
+
+    async def find_by_ids(
+        self, user_id: str, document_ids: list[str]
+    ) -> list[MongoDocument]:
+        """사용자의 문서 중 document_ids에 해당하는 문서를 청크 임베딩과 함께 찾습니다. 인덱싱에 사용합니다."""
+        documents = await self.collection.find(
+            {"_id": {"$in": document_ids}, "user_id": user_id}
+        ).to_list(length=None)
+        return [self._to_domain(doc) for doc in documents]
 
     async def find_all(self) -> list[MongoDocument]:
         """모든 문서를 찾아 리스트로 반환합니다."""
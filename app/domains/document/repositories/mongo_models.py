@@ -17,6 +17,10 @@ class Document(BaseModel):
     title: str = Field(..., description="문서 제목")
     summary: str = Field(..., description="문서 요약")
     content: list[Any] = Field(..., description="문서 내용")
+    embeddings: dict[str, Any] | None = Field(
+        default=None,
+        description="content와 같은 순서의 청크 임베딩 (모델, float32 바이트 목록). 인덱싱 시 재사용",
+    )
     document_url: str = Field(..., description="문서 URL")
     user_id: str = Field(..., description="문서를 소유한 사용자 ID")
     updated_at: datetime = Field(
@@ -1,5 +1,5 @@
 import operator
-from typing import Annotated, TypedDict
+from typing import Annotated, Any, TypedDict
 
 
 class ParseState(TypedDict):
@@ -9,19 +9,35 @@ class ParseState(TypedDict):
     filepath: Annotated[str, "filepath"]  # 원본 파일경로
     save_dir: Annotated[str, "save_dir"]  # 분할된 파일 저장 디렉토리
     split_filepaths: Annotated[list[str], "split_filepaths"]  # 분할된 파일 경로
+    split_file_keys: Annotated[
+        dict[str, str], "split_file_keys"
+    ]  # 메모리로 전달하는 분할 파일 (경로: SplitFileStore 키)
+    split_temp_filepaths: Annotated[
+        list[str], "split_temp_filepaths"
+    ]  # OCR 후 삭제할 임시 분할 파일 경로
     working_filepath: Annotated[str, "working_filepath"]  # 현재 작업중인 파일
+    working_file_key: Annotated[
+        str | None, "working_file_key"
+    ]  # 현재 작업중인 파일의 SplitFileStore 키 (메모리 전달 시)
+    working_file_is_temp: Annotated[
+        bool, "working_file_is_temp"
+    ]  # 현재 작업중인 파일이 OCR 후 삭제할 임시 파일인지 여부
 
     # ParseNode 결과
     parse_elements: Annotated[list[str], operator.add]  # Parse 결과
     parse_metadata: Annotated[list[str], operator.add]  # Parse 메타데이터
     post_parse_elements: Annotated[list[str], "post_parse_elements"]  # Post Parse 결과
     parse_cost: Annotated[float, "parse_cost"]  # Parse 비용
+    parse_cost_saved: Annotated[float, "parse_cost_saved"]  # OCR 캐시로 절감한 비용
 
     # LLM 결과
-    page_summary: Annotated[dict[str, str], "page_summary"]
+    # 파이프라인 모드에서는 분할 파일별 요약이 병렬로 쌓이므로 리스트를 합치는 reducer 사용
+    page_summary: Annotated[list[dict[str, str]], operator.add]
     document_summary: Annotated[dict[str, str], "document_summary"]
-    image_summary: Annotated[list[dict[str, str]], "image_summary"]
-    table_summary: Annotated[list[dict[str, str]], "table_summary"]
+    image_summary: Annotated[list[dict[str, str]], operator.add]
+    table_summary: Annotated[list[dict[str, str]], operator.add]
 
     # RAG를 위한 Document 생성
     documents: Annotated[list[dict[str, str]], "documents"]
+    # semantic 전략에서 계산한 청크 임베딩 {"model": 모델, "vectors": documents 순서의 float32 바이트}
+    document_embeddings: Annotated[dict[str, Any] | None, "document_embeddings"]
@@ -4,6 +4,7 @@ from collections.abc import AsyncGenerator
 
 from fastapi import HTTPException
 
+from app.common.exceptions.custom_exceptions import ParsingInProgressError
 from app.common.logger import logger
 from app.domains.document.enums import DocumentProcessingStatus
 from app.domains.document.repositories.interface import IDocumentRepository
@@ -55,12 +56,66 @@ class DocumentService:
             request: Create document request
         """
         # # 1. 문서 파싱 & 파싱 중간 결과 SSE로 전송
+        # document_id는 파싱 체크포인트의 thread_id로도 사용되어, 파싱이 중단되면 resume_document로 재개할 수 있음
         document_id = uuid.uuid4().hex
 
-        parsed_docs = None
-        async for event in self.parsing_service.parse_document(
-            request.document_url, request.file_name
+        events = self.parsing_service.parse_document(
+            request.document_url,
+            request.file_name,
+            document_id=document_id,
+            metadata={"user_id": request.user_id},
+        )
+        async for response in self._save_parsed_document(
+            document_id, request.user_id, request.file_name, events
         ):
+            yield response
+
+    async def resume_document(
+        self, document_id: str
+    ) -> AsyncGenerator[CreateDocumentSSEResponse, None]:
+        """Resume an interrupted document parsing with SSE processing updates.
+
+        완료된 파싱 단계(OCR, 요약 등)는 체크포인트에서 불러오고 남은 단계만 실행합니다.
+
+        Args:
+            document_id: Document ID returned by create_document
+
+        Raises:
+            HTTPException: 404 if there is no resumable parsing for the document,
+                409 if the document is still being parsed
+        """
+        if self.parsing_service.is_running(document_id):
+            raise HTTPException(
+                status_code=409,
+                detail=f"Document {document_id} is still being parsed",
+            )
+        run = await self.parsing_service.get_resumable_run(document_id)
+        if run is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No resumable parsing found for document {document_id}",
+            )
+
+        events = self.parsing_service.resume_document(document_id)
+        try:
+            async for response in self._save_parsed_document(
+                document_id, run["metadata"].get("user_id"), run["file_name"], events
+            ):
+                yield response
+        except ParsingInProgressError as e:
+            # 위 확인 이후 동시에 들어온 재개 요청
+            raise HTTPException(status_code=e.status_code, detail=e.message) from e
+
+    async def _save_parsed_document(
+        self,
+        document_id: str,
+        user_id: str,
+        file_name: str,
+        events: AsyncGenerator[dict, None],
+    ) -> AsyncGenerator[CreateDocumentSSEResponse, None]:
+        """파싱 중간 결과를 SSE 응답으로 전달하고, 최종 결과를 MongoDB에 저장합니다."""
+        parsed_docs = None
+        async for event in events:
             if event.get("node") == "final_state":
                 parsed_docs = event
                 break
@@ -80,11 +135,12 @@ class DocumentService:
         # 2. MongoDB에 저장
         document_to_save = MongoDocument(
             document_id=document_id,
-            title=request.file_name,
+            title=file_name,
             summary=parsed_docs.get("summary"),
             content=parsed_docs.get("content"),
+            embeddings=parsed_docs.get("embeddings"),
             document_url=parsed_docs.get("document_url"),
-            user_id=request.user_id,
+            user_id=user_id,
         )
 
         await self.document_repository.save(document_to_save)
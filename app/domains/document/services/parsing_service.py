@@ -1,20 +1,27 @@
+import asyncio
+import contextlib
+import os
+import uuid
 from collections.abc import AsyncGenerator
 from typing import Any
 
 from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph.state import CompiledStateGraph, StateGraph
+from langgraph.types import Send
 
+from app.common.downloader import AsyncFileDownloader
+from app.common.exceptions.custom_exceptions import ParsingInProgressError
 from app.common.logger import logger
 from app.domains.document.enums import DocumentProcessingStatus
+from app.domains.document.handlers.element_index import ElementIndex
 from app.domains.document.handlers.langchain.adapter import LangchainAdapter
 from app.domains.document.handlers.langchain.chain import summarize_chain
 from app.domains.document.handlers.langchain.parser import parse_with_langchain
 from app.domains.document.handlers.node.base import BaseNode
-from app.domains.document.handlers.node.utils import (
-    continue_parse,
-    download_file_to_firebase_url,
-)
+from app.domains.document.handlers.node.utils import download_file_to_firebase_url
+from app.domains.document.handlers.split_file_store import SplitFileStore
 from app.domains.document.schemas.state import ParseState
 
 
@@ -22,6 +29,15 @@ class ParsingService:
     """Parsing 서비스 클래스입니다.
 
     Knowledge Center에 업로드 할 문서를 파싱하고, 파싱 결과를 몽고 디비에 저장하거나 RAG를 위한 문서 객체를 생성합니다.
+    pipeline_summaries가 True이면 분할 파일마다 OCR이 끝나는 즉시 해당 페이지들의 페이지/이미지/테이블 요약을 시작하고,
+    False이면 모든 분할 파일의 OCR이 끝난 뒤 전체 요소에 대해 요약합니다.
+
+    checkpointer가 디스크에 저장하는 방식(SQLiteCheckpointSaver)이면 실패하거나 중단된 파싱의 체크포인트를 남겨 두고,
+    resume_document로 완료된 노드(OCR, 요약 등)를 건너뛰고 이어서 실행할 수 있습니다.
+    남은 체크포인트는 checkpoint_ttl_seconds가 지나면 삭제합니다.
+    메모리 분할 파일은 체크포인트에 직렬화되지 않도록 split_file_store에 두고 state에는 키만 저장하며,
+    재개할 때 저장소에 없는 분할 파일은 원본에서 다시 만듭니다.
+    같은 thread의 그래프가 동시에 두 번 실행되지 않도록 이 프로세스에서 실행 중인 thread를 기록합니다.
     """
 
     def __init__(
@@ -29,22 +45,93 @@ class ParsingService:
         split_pdf_files_node: BaseNode,
         upstage_parse_node: BaseNode,
         post_parse_node: BaseNode,
-        working_queue_node: BaseNode,
         page_summary_node: BaseNode,
         image_summary_node: BaseNode,
         table_summary_node: BaseNode,
         langchain_document_node: BaseNode,
         langchain_adapter: LangchainAdapter,
+        downloader: AsyncFileDownloader,
+        pipeline_summaries: bool = True,
+        checkpointer: BaseCheckpointSaver | None = None,
+        checkpoint_ttl_seconds: float | None = None,
+        split_file_store: SplitFileStore | None = None,
     ):
         self.split_pdf_files_node = split_pdf_files_node
         self.upstage_parse_node = upstage_parse_node
         self.post_parse_node = post_parse_node
-        self.working_queue_node = working_queue_node
         self.page_summary_node = page_summary_node
         self.image_summary_node = image_summary_node
         self.table_summary_node = table_summary_node
         self.langchain_document_node = langchain_document_node
         self.langchain_adapter = langchain_adapter
+        self.downloader = downloader
+        self.pipeline_summaries = pipeline_summaries
+        # 그래프는 서비스 인스턴스당 한 번만 컴파일하고, 요청마다 고유한 thread_id로 실행
+        self.checkpointer = checkpointer or MemorySaver()
+        self.resumable = not isinstance(self.checkpointer, MemorySaver)
+        self.checkpoint_ttl_seconds = checkpoint_ttl_seconds
+        self.split_file_store = split_file_store
+        self._running_thread_ids: set[str] = set()
+        self.graph = self._create_graph()
+
+    @staticmethod
+    def _fan_out_parse(state: ParseState) -> list[Send] | str:
+        """분할된 파일마다 upstage_parse_node 실행을 하나씩 보냅니다. 분할 파일이 없으면 바로 post_parse_node로 이동합니다.
+
+        메모리로 분할된 파일은 저장소 키를 함께 보내 디스크를 거치지 않고 OCR합니다.
+        Send 인자도 체크포인트에 저장되므로 파일 바이트는 보내지 않습니다.
+        """
+        split_filepaths = state.get("split_filepaths") or []
+        if not split_filepaths:
+            return "post_parse_node"
+        split_file_keys = state.get("split_file_keys") or {}
+        split_temp_filepaths = set(state.get("split_temp_filepaths") or [])
+        return [
+            Send(
+                "upstage_parse_node",
+                {
+                    "working_filepath": filepath,
+                    "working_file_key": split_file_keys.get(filepath),
+                    "working_file_is_temp": filepath in split_temp_filepaths,
+                },
+            )
+            for filepath in split_filepaths
+        ]
+
+    async def _parse_and_summarize(
+        self, state: ParseState
+    ) -> AsyncGenerator[ParseState, None]:
+        """분할 파일 하나를 OCR한 뒤, 다른 분할 파일의 OCR을 기다리지 않고 바로 해당 페이지들을 요약합니다.
+
+        LangGraph는 superstep 단위로 다음 노드를 실행하므로, 분할 파일별 OCR과 요약을 한 노드 안에서 이어서 실행해야
+        앞 구간의 요약과 뒤 구간의 OCR이 겹쳐서 진행됩니다.
+        이미지/테이블 요약의 주변 문맥은 분할 파일 안에서만 가져옵니다.
+        요약이 실패하면 재개할 때 OCR부터 다시 실행되므로, 분할 파일은 요약까지 성공한 뒤 정리합니다.
+        """
+        parse_result = {}
+        async for update in self.upstage_parse_node.execute(
+            state, release_working_file=False
+        ):
+            parse_result.update(update)
+        elements = [
+            element
+            for split_elements in parse_result["parse_elements"]
+            for element in split_elements
+        ]
+        # 세 요약 노드가 요소 목록을 한 번만 훑은 인덱스를 함께 사용
+        element_index = ElementIndex(elements)
+        page_summary, image_summary, table_summary = await asyncio.gather(
+            self.page_summary_node.asummarize_pages(elements, element_index),
+            self.image_summary_node.asummarize(elements, element_index),
+            self.table_summary_node.asummarize(elements, element_index),
+        )
+        self.upstage_parse_node.release_working_file(state)
+        yield {
+            **parse_result,
+            "page_summary": page_summary,
+            "image_summary": image_summary,
+            "table_summary": table_summary,
+        }
 
     def _create_graph(self) -> CompiledStateGraph:
         """LangGraph를 빌드하고 컴파일합니다.
@@ -55,37 +142,45 @@ class ParsingService:
 
         logger.info("Adding nodes to graph...")
         state_graph.add_node("split_pdf_files_node", self.split_pdf_files_node.execute)
-        state_graph.add_node("upstage_parse_node", self.upstage_parse_node.execute)
         state_graph.add_node("post_parse_node", self.post_parse_node.execute)
-        state_graph.add_node("working_queue_node", self.working_queue_node.execute)
-        state_graph.add_node("page_summary_node", self.page_summary_node.execute)
-        state_graph.add_node("image_summary_node", self.image_summary_node.execute)
-        state_graph.add_node("table_summary_node", self.table_summary_node.execute)
         state_graph.add_node(
             "langchain_document_node", self.langchain_document_node.execute
         )
 
         logger.info("Adding edges to graph...")
-        state_graph.add_edge("split_pdf_files_node", "working_queue_node")
-        # OCR 경로
+        # OCR 경로: 분할된 파일마다 upstage_parse_node를 병렬 실행 (fan-out) 후 post_parse_node에서 합침
         state_graph.add_conditional_edges(
-            "working_queue_node",
-            continue_parse,
-            {True: "upstage_parse_node", False: "post_parse_node"},
-        )  # 큐가 비면 post_ocr_node로 이동
-        state_graph.add_edge("upstage_parse_node", "working_queue_node")
-        state_graph.add_edge("post_parse_node", "page_summary_node")
-        state_graph.add_edge("post_parse_node", "image_summary_node")
-        state_graph.add_edge("post_parse_node", "table_summary_node")
-        state_graph.add_edge("page_summary_node", "langchain_document_node")
-        state_graph.add_edge("image_summary_node", "langchain_document_node")
-        state_graph.add_edge("table_summary_node", "langchain_document_node")
+            "split_pdf_files_node",
+            self._fan_out_parse,
+            ["upstage_parse_node", "post_parse_node"],
+        )
+        state_graph.add_edge("upstage_parse_node", "post_parse_node")
+
+        if self.pipeline_summaries:
+            # 분할 파일별로 OCR 직후 페이지/이미지/테이블 요약까지 실행하고, 합친 후 전체 문서 요약만 생성
+            state_graph.add_node("upstage_parse_node", self._parse_and_summarize)
+            state_graph.add_node(
+                "page_summary_node", self.page_summary_node.execute_document_summary
+            )
+            state_graph.add_edge("post_parse_node", "page_summary_node")
+            state_graph.add_edge("page_summary_node", "langchain_document_node")
+        else:
+            state_graph.add_node("upstage_parse_node", self.upstage_parse_node.execute)
+            state_graph.add_node("page_summary_node", self.page_summary_node.execute)
+            state_graph.add_node("image_summary_node", self.image_summary_node.execute)
+            state_graph.add_node("table_summary_node", self.table_summary_node.execute)
+            state_graph.add_edge("post_parse_node", "page_summary_node")
+            state_graph.add_edge("post_parse_node", "image_summary_node")
+            state_graph.add_edge("post_parse_node", "table_summary_node")
+            state_graph.add_edge("page_summary_node", "langchain_document_node")
+            state_graph.add_edge("image_summary_node", "langchain_document_node")
+            state_graph.add_edge("table_summary_node", "langchain_document_node")
 
         state_graph.set_entry_point("split_pdf_files_node")  # 시작노드 지정
 
         logger.info("Compiling graph...")
-        # TODO: MemorySavers는 in-memory 저장 방식이라 서비스 단에서 사용하기 어려움 / Redis(from langgraph.checkpoint.redis import RedisCheckpointer) 등 영속성 체크포인터 고려 필요
-        compiled_graph = state_graph.compile(checkpointer=MemorySaver())
+        # 체크포인트는 파싱이 끝나면 thread 단위로 삭제하므로 계속 늘지 않음
+        compiled_graph = state_graph.compile(checkpointer=self.checkpointer)
         # mermaid_definition = compiled_graph.get_graph(xray=True).draw_mermaid()
         # logger.info(f"mermaid_definition:\n{mermaid_definition}")
         # logger.info("Graph compiled successfully.")
@@ -96,7 +191,7 @@ class ParsingService:
     async def _astream(
         self,
         graph: CompiledStateGraph,
-        inputs: dict,
+        inputs: dict | None,
         config: dict | None = None,
         stream_mode: str = "messages",
         include_subgraphs: bool = False,
@@ -185,20 +280,181 @@ class ParsingService:
                             }
                             yield out
 
+    async def _arun_graph(
+        self,
+        inputs: ParseState | None,
+        config: RunnableConfig,
+        file_name: str,
+        document_url: str,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """그래프를 실행하며 중간 과정을 스트리밍하고, 마지막에 최종 상태를 전달합니다.
+
+        inputs가 None이면 thread의 마지막 체크포인트부터 이어서 실행합니다.
+        성공하면 thread의 체크포인트를 삭제하고, 실패하거나 중단되면 resumable일 때만 재개를 위해 남겨 둡니다.
+        """
+        thread_id = config["configurable"]["thread_id"]
+        try:
+            # 워크플로우 중간 과정 스트리밍
+            async for chunk in self._astream(self.graph, inputs, config, "updates"):
+                yield chunk
+
+            # 최종 상태 조회
+            state = await self.graph.aget_state(config)
+        except BaseException:
+            if self.resumable:
+                # 저장소의 분할 파일은 메모리만 차지하므로 비우고, 재개할 때 원본에서 다시 만듦
+                snapshot = await self.graph.aget_state(config)
+                self._release_split_files(snapshot.values)
+                logger.warning(f"파싱 중단, 체크포인트 보존 (재개 가능): {thread_id}")
+            else:
+                await self._adelete_thread(thread_id)
+            raise
+        await self._adelete_thread(thread_id)
+
+        yield {
+            "node": "final_state",
+            "title": file_name,
+            "summary": state.values.get("document_summary"),
+            "content": state.values.get("documents"),
+            "embeddings": state.values.get("document_embeddings"),
+            "document_url": document_url,
+        }
+
+    def _release_split_files(self, values: dict[str, Any]):
+        """state에 기록된 분할 파일의 바이트를 저장소에서 비웁니다."""
+        split_file_keys = values.get("split_file_keys")
+        if split_file_keys and self.split_file_store is not None:
+            self.split_file_store.discard(split_file_keys.values())
+
+    async def _arestore_split_files(self, config: RunnableConfig):
+        """OCR이 남은 thread를 재개하기 전에 저장소에 없는 분할 파일을 원본에서 다시 만듭니다."""
+        snapshot = await self.graph.aget_state(config)
+        if "upstage_parse_node" not in snapshot.next:
+            return
+        split_file_keys = snapshot.values.get("split_file_keys") or {}
+        missing = {
+            filepath: key
+            for filepath, key in split_file_keys.items()
+            if key not in self.split_file_store
+        }
+        if missing:
+            await self.split_pdf_files_node.arestore_split_files(
+                snapshot.values["filepath"], missing
+            )
+
+    def is_running(self, thread_id: str) -> bool:
+        """thread의 파싱 그래프가 이 프로세스에서 실행 중인지 반환합니다."""
+        return thread_id in self._running_thread_ids
+
+    @contextlib.contextmanager
+    def _mark_running(self, thread_id: str):
+        """thread를 실행 중으로 기록합니다. 이미 실행 중이면 ParsingInProgressError를 발생시킵니다.
+
+        확인과 기록 사이에 await가 없어야 동시에 들어온 요청 중 하나만 통과합니다.
+        """
+        if thread_id in self._running_thread_ids:
+            raise ParsingInProgressError()
+        self._running_thread_ids.add(thread_id)
+        try:
+            yield
+        finally:
+            self._running_thread_ids.discard(thread_id)
+
+    def close(self):
+        """디스크 체크포인트 저장소의 연결을 닫습니다."""
+        if self.resumable and hasattr(self.checkpointer, "close"):
+            self.checkpointer.close()
+
+    async def _adelete_thread(self, thread_id: str):
+        """thread의 체크포인트를 삭제합니다. 재개를 위해 남겨 둔 분할 파일(저장소, 임시 파일)도 함께 정리합니다."""
+        snapshot = await self.graph.aget_state(self._make_config(thread_id))
+        self._release_split_files(snapshot.values)
+        for temp_filepath in snapshot.values.get("split_temp_filepaths") or []:
+            with contextlib.suppress(OSError):
+                os.remove(temp_filepath)
+        await self.checkpointer.adelete_thread(thread_id)
+
+    async def _adelete_expired(self):
+        """checkpoint_ttl_seconds가 지난 thread를 임시 분할 파일과 함께 삭제합니다."""
+        thread_ids = await self.checkpointer.aexpired_thread_ids(
+            self.checkpoint_ttl_seconds
+        )
+        for thread_id in thread_ids:
+            await self._adelete_thread(thread_id)
+        if thread_ids:
+            logger.info(f"만료된 파싱 체크포인트 {len(thread_ids)}개 삭제")
+
+    def _make_config(
+        self, thread_id: str, metadata: dict[str, Any] | None = None
+    ) -> RunnableConfig:
+        return RunnableConfig(
+            recursion_limit=50,
+            max_concurrency=50,
+            configurable={"thread_id": thread_id},
+            metadata=metadata or {},
+        )
+
+    async def get_resumable_run(self, document_id: str) -> dict[str, Any] | None:
+        """재개할 수 있는 파싱 작업의 정보를 반환합니다. 없거나 이미 완료된 경우 None입니다.
+
+        Returns:
+            dict | None: document_url, file_name과 파싱 시작 시 전달한 metadata
+        """
+        if not self.resumable:
+            return None
+        snapshot = await self.graph.aget_state(self._make_config(document_id))
+        if not snapshot.values or not snapshot.next:
+            return None
+        return {
+            "document_url": snapshot.values.get("filepath"),
+            "file_name": snapshot.values.get("file_name"),
+            "metadata": snapshot.metadata or {},
+        }
+
+    async def resume_document(
+        self, document_id: str
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """중단된 파싱 작업을 마지막 체크포인트부터 이어서 실행합니다. 완료된 노드는 다시 실행하지 않습니다.
+
+        Raises:
+            ParsingInProgressError: 같은 문서의 파싱이 이미 실행 중인 경우
+        """
+        with self._mark_running(document_id):
+            run = await self.get_resumable_run(document_id)
+            if run is None:
+                raise ValueError(f"재개할 수 있는 파싱 작업이 없습니다: {document_id}")
+
+            logger.info(f"파싱 재개: {document_id} ({run['file_name']})")
+            config = self._make_config(document_id, run["metadata"])
+            await self._arestore_split_files(config)
+            async for chunk in self._arun_graph(
+                None,
+                config,
+                run["file_name"],
+                run["document_url"],
+            ):
+                yield chunk
+
     async def parse_document(
         self,
         document_url: str,
         file_name: str,
+        document_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
     ) -> AsyncGenerator[dict[str, Any], None]:
-        """PDFs, DOCX, TXT, CSV, Excel, etc."""
+        """PDFs, DOCX, TXT, CSV, Excel, etc.
+
+        document_id는 그래프 체크포인트의 thread_id로 사용되어 resume_document로 재개할 때 쓰입니다.
+        metadata는 체크포인트에 함께 저장되어 재개 시 get_resumable_run으로 조회할 수 있습니다.
+        """
         ext = file_name.split(".")[-1].lower()
         if ext in ["pdf", "docx", "xlsx", "pdf", "jpg", "jpeg", "hwp", "hwpx", "pptx"]:
-            app = self._create_graph()
-            config = RunnableConfig(
-                recursion_limit=50,
-                max_concurrency=50,
-                configurable={"thread_id": "1"},
-            )
+            if self.resumable and self.checkpoint_ttl_seconds:
+                await self._adelete_expired()
+
+            # 동시 업로드가 체크포인트를 공유하지 않도록 요청마다 고유한 thread_id 사용
+            thread_id = document_id or uuid.uuid4().hex
+            config = self._make_config(thread_id, metadata)
             inputs = ParseState(
                 ext=ext,
                 filepath=document_url,
@@ -206,19 +462,11 @@ class ParsingService:
                 save_dir="./data",
             )
 
-            # 워크플로우 중간 과정 스트리밍
-            async for chunk in self._astream(app, inputs, config, "updates"):
-                yield chunk
-
-            # 최종 상태 반환
-            state = app.get_state(config)
-            yield {
-                "node": "final_state",
-                "title": file_name,
-                "summary": state.values.get("document_summary"),
-                "content": state.values.get("documents"),
-                "document_url": document_url,
-            }
+            with self._mark_running(thread_id):
+                async for chunk in self._arun_graph(
+                    inputs, config, file_name, document_url
+                ):
+                    yield chunk
         else:
             temp_file_path = None
             yield {
@@ -229,7 +477,7 @@ class ParsingService:
             }
             if document_url.startswith(("http://", "https://")):
                 temp_file_path = await download_file_to_firebase_url(
-                    document_url, f"./data/tmp/{file_name}"
+                    document_url, f"./data/tmp/{file_name}", self.downloader
                 )
 
             yield {
@@ -8,8 +8,6 @@ from fastapi.middleware import Middleware
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.agents.mcp.mcp_manager import MCPManager
-
-# from pymilvus import connections
 from app.common.logger import logger
 from app.domains import API_VERSION
 from app.domains.containers import BaseContainer
@@ -32,37 +30,48 @@ async def cleanup_mcp_sessions(app: FastAPI) -> None:
         app.state.mcp_sessions.clear()
 
 
-# # NOTE: alias는 "default"로 통일. 나중에 설정값으로 추가 필요
-# async def init_milvus_connection(app: FastAPI) -> None:
-#     """Milvus 연결 초기화."""
-#     load_dotenv()
-#     try:
-#         alias = "default"
-#         if not connections.has_connection(alias):
-#             connections.connect(alias, address="127.0.0.1:19530")
-#             logger.info("Milvus connection initialized at 127.0.0.1:19530")
+async def init_milvus_connection(app: FastAPI) -> None:
+    """Milvus 연결 풀 초기화.
+
+    연결은 백그라운드에서 미리 생성하므로 Milvus가 준비되지 않아도 앱 시작을 막지 않습니다.
+    사전 연결에 실패하면 실제 사용 시점에 다시 연결을 시도합니다.
+    """
+    milvus_connection_pool = (
+        app.state.base_container.chat_container.milvus_connection_pool()
+    )
+    app.state.milvus_connection_pool = milvus_connection_pool
+    app.state.milvus_warmup_task = asyncio.create_task(milvus_connection_pool.awarmup())
+
+
+async def cleanup_milvus_connection(app: FastAPI) -> None:
+    """Milvus 연결 정리."""
+    warmup_task = getattr(app.state, "milvus_warmup_task", None)
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+    milvus_connection_pool = getattr(app.state, "milvus_connection_pool", None)
+    if milvus_connection_pool is not None:
+        await asyncio.to_thread(milvus_connection_pool.close)
+
 
-#         app.state.milvus_connection_alias = alias
-#     except Exception as e:
-#         logger.error(f"Failed to initialize Milvus connection: {e}")
-#         raise
+async def cleanup_milvus_indexer(app: FastAPI) -> None:
+    """Milvus 인덱서의 BM25 전처리 프로세스 풀과 임베딩 캐시 연결 정리."""
+    milvus_indexer = app.state.base_container.chat_container.milvus_indexer()
+    await asyncio.to_thread(milvus_indexer.close)
 
 
-# async def cleanup_milvus_connection(app: FastAPI) -> None:
-#     """Milvus 연결 정리."""
-#     try:
-#         if hasattr(app.state, "milvus_connection_alias"):
-#             alias = app.state.milvus_connection_alias
-#             if connections.has_connection(alias):
-#                 connections.disconnect(alias)
-#                 logger.info(f"Milvus connection '{alias}' disconnected")
-#     except Exception as e:
-#         logger.warning(f"Error during Milvus cleanup: {e}")
+async def cleanup_document_http_clients(app: FastAPI) -> None:
+    """Upstage OCR 및 문서 다운로더 HTTP 연결 풀, 페이지 분할 프로세스 풀, 파싱 체크포인트 연결 정리."""
+    document_container = app.state.base_container.document_container
+    await document_container.upstage_parse_node().aclose()
+    await document_container.file_downloader().aclose()
+    document_container.langchain_document_node().close()
+    # 파싱 체크포인트(SQLite) 연결 정리
+    document_container.parsing_service().close()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """FastAPI 앱의 생명주기 동안 MCP 서버를 관리합니다."""
+    """FastAPI 앱의 생명주기 동안 MCP 서버와 Milvus 연결 풀을 관리합니다."""
     # Startup: 앱 시작 시 MCP 서버들을 실행합니다.
     # config 파일 경로를 올바르게 지정합니다.
     mcp_config_path = Path(__file__).parent.parent / "agents" / "mcp" / "mcp.json"
@@ -70,10 +79,14 @@ async def lifespan(app: FastAPI):
     await mcp_manager.startup()
     # 생성된 세션을 앱 상태에 저장하여 다른 곳에서 참조할 수 있도록 합니다.
     app.state.mcp_sessions = mcp_manager.get_sessions()
+    await init_milvus_connection(app)
 
     yield
 
-    # Shutdown: 앱 종료 시 MCP 서버들을 정리합니다.
+    # Shutdown: 앱 종료 시 MCP 서버들과 Milvus, 문서 처리 HTTP 연결을 정리합니다.
+    await cleanup_milvus_indexer(app)
+    await cleanup_milvus_connection(app)
+    await cleanup_document_http_clients(app)
     await mcp_manager.shutdown()
 
 